@@ -4,6 +4,7 @@ This is a sphinx extension which improves the documentation of Django apps.
 
 from __future__ import annotations
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
 from typing import TYPE_CHECKING
 
@@ -12,24 +13,68 @@ try:
 except PackageNotFoundError:  # pragma: no cover
     __version__ = "0.0.0.dev0"
 
-from . import docstrings, roles
+#: The sub-extensions which are set up by :func:`setup`, in order
+SUBMODULES = (
+    "docstrings",
+    "roles",
+    "variants",
+    "autodjango",
+    "check",
+    "coverage",
+    "schemadiff",
+    "signals",
+    "templates",
+    "commands",
+)
+
+#: The sub-extensions which are only set up if they are added to ``extensions``, since they load
+#: further Sphinx extensions
+OPTIONAL_SUBMODULES = ("graph",)
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     import sphinx
     from sphinx.util.typing import ExtensionMetadata
 
 
+def __getattr__(name: str) -> ModuleType:
+    """
+    Import the sub-extensions on first access, so importing this package (e.g. to only use
+    :mod:`~sphinxcontrib_django.roles`) doesn't import Django and its optional integrations.
+
+    :param name: The name of the sub-extension
+    :return: The module of the sub-extension
+    """
+    if name in SUBMODULES or name in OPTIONAL_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     """
     Allow this module to be used as sphinx extension.
 
-    Setup the two sub-extensions :mod:`~sphinxcontrib_django.docstrings` and
-    :mod:`~sphinxcontrib_django.roles` which can also be imported separately.
+    Setup the sub-extensions which can also be imported separately:
+
+    * :mod:`~sphinxcontrib_django.docstrings`
+    * :mod:`~sphinxcontrib_django.roles`
+    * :mod:`~sphinxcontrib_django.variants`
+    * :mod:`~sphinxcontrib_django.autodjango`
+    * :mod:`~sphinxcontrib_django.check`
+    * :mod:`~sphinxcontrib_django.coverage`
+    * :mod:`~sphinxcontrib_django.schemadiff`
+    * :mod:`~sphinxcontrib_django.signals`
+    * :mod:`~sphinxcontrib_django.templates`
+    * :mod:`~sphinxcontrib_django.commands`
+
+    The sub-extensions in :data:`OPTIONAL_SUBMODULES`, e.g. :mod:`~sphinxcontrib_django.graph`,
+    have to be added to ``extensions`` separately.
 
     :param app: The Sphinx application object
     """
-    docstrings.setup(app)
-    roles.setup(app)
+    for name in SUBMODULES:
+        import_module(f".{name}", __name__).setup(app)
 
     return {
         "version": __version__,
@@ -0,0 +1,295 @@
+"""
+Command line interface of sphinxcontrib-django, e.g.::
+
+    python -m sphinxcontrib_django stubs --settings myproject.settings --output-dir docs/apps
+    python -m sphinxcontrib_django snapshot --settings myproject.settings --output schema.json
+    python -m sphinxcontrib_django diff old-schema.json schema.json
+    python -m sphinxcontrib_django build docs docs/_build --language en --language de
+
+Run ``python -m sphinxcontrib_django --help`` for a list of all commands.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sphinx.errors import ConfigError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Get the argument parser of the command line interface.
+
+    :return: The argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sphinxcontrib_django",
+        description="Tools for the documentation of Django projects with Sphinx.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    stubs = subparsers.add_parser(
+        "stubs",
+        help="generate reStructuredText stub files for Django apps",
+        description=(
+            "Generate reStructuredText stub files for Django apps. Files are only rewritten"
+            " if their content changed."
+        ),
+    )
+    add_django_arguments(stubs)
+    stubs.add_argument(
+        "-o",
+        "--output-dir",
+        required=True,
+        type=Path,
+        help="directory of the stub files",
+    )
+    stubs.add_argument(
+        "-g",
+        "--granularity",
+        choices=("app", "module", "model"),
+        default="app",
+        help="write one stub file per app, module or model (default: %(default)s)",
+    )
+    stubs.add_argument(
+        "--tocfile",
+        default="apps",
+        help="name of the table of contents file (default: %(default)s)",
+    )
+    stubs.add_argument(
+        "--no-toc", action="store_true", help="don't create a table of contents file"
+    )
+    stubs.set_defaults(handler=run_stubs)
+
+    snapshot = subparsers.add_parser(
+        "snapshot",
+        help="export a schema snapshot of the Django models",
+        description=(
+            "Export the models, fields and database tables of the app registry as JSON with"
+            " sorted keys, which can be compared via the diff command."
+        ),
+    )
+    add_django_arguments(snapshot)
+    snapshot.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="file to write the snapshot to (default: standard output)",
+    )
+    snapshot.set_defaults(handler=run_snapshot)
+
+    diff = subparsers.add_parser(
+        "diff",
+        help="compare two schema snapshots",
+        description="Compare two schema snapshots without setting up Django.",
+    )
+    diff.add_argument("old", type=Path, help="the snapshot of the old version")
+    diff.add_argument("new", type=Path, help="the snapshot of the new version")
+    diff.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="exit with 1 if there are changes and 0 otherwise",
+    )
+    diff.set_defaults(handler=run_diff)
+
+    build = subparsers.add_parser(
+        "build",
+        help="build the documentation in several languages",
+        description=(
+            "Build the documentation once per language in a single process, so Django is only"
+            " set up and introspected once. The output of each language is written to a"
+            " subdirectory of the output directory."
+        ),
+    )
+    build.add_argument("sourcedir", type=Path, help="the directory of conf.py")
+    build.add_argument("outputdir", type=Path, help="the output directory")
+    build.add_argument(
+        "-l",
+        "--language",
+        dest="languages",
+        action="append",
+        required=True,
+        help="language to build, can be given multiple times",
+    )
+    build.add_argument(
+        "-b",
+        "--builder",
+        default="html",
+        help="the Sphinx builder to use (default: %(default)s)",
+    )
+    build.set_defaults(handler=run_build)
+
+    return parser
+
+
+def add_django_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments which are required to set up Django.
+
+    :param parser: The parser of the command
+    """
+    parser.add_argument(
+        "-s",
+        "--settings",
+        default=os.environ.get("DJANGO_SETTINGS_MODULE"),
+        help="import path of the Django settings module (default: $DJANGO_SETTINGS_MODULE)",
+    )
+    parser.add_argument(
+        "-p",
+        "--path",
+        action="append",
+        default=[],
+        help="directory to add to sys.path, can be given multiple times",
+    )
+    parser.add_argument(
+        "-a",
+        "--app",
+        dest="apps",
+        action="append",
+        default=[],
+        help=(
+            "label or name of an app to document, can be given multiple times"
+            " (default: all apps)"
+        ),
+    )
+    parser.add_argument(
+        "-m",
+        "--mock",
+        action="append",
+        default=[],
+        help="module to mock while setting up Django, can be given multiple times",
+    )
+
+
+def setup_django(args: argparse.Namespace) -> None:
+    """
+    Set up Django like the Sphinx extension does.
+
+    :param args: The parsed command line arguments
+    """
+    from .docstrings import configure_django
+
+    sys.path[:0] = [os.path.abspath(path) for path in args.path]
+    configure_django(args.settings, apps_to_document=args.apps, mock_imports=args.mock)
+
+
+def run_stubs(args: argparse.Namespace) -> int:
+    """
+    Generate the stub files.
+
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    from .stubs import generate_stubs
+
+    setup_django(args)
+    written = generate_stubs(
+        args.output_dir,
+        app_labels=args.apps,
+        granularity=args.granularity,
+        tocfile=None if args.no_toc else args.tocfile,
+    )
+    for path, changed in written.items():
+        if changed:
+            print(f"Writing {path}")
+    print(
+        f"{sum(written.values())} of {len(written)} stub files written,"
+        f" {len(written) - sum(written.values())} unchanged"
+    )
+    return 0
+
+
+def run_snapshot(args: argparse.Namespace) -> int:
+    """
+    Export the schema snapshot.
+
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    from .metadata import get_snapshot
+
+    setup_django(args)
+    snapshot = get_snapshot(args.apps)
+    if args.output:
+        args.output.write_text(snapshot, encoding="utf-8")
+    else:
+        sys.stdout.write(snapshot)
+    return 0
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    """
+    Print the changes between two schema snapshots.
+
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    from .schemadiff import diff_snapshots, load_snapshot
+
+    changes = diff_snapshots(load_snapshot(args.old), load_snapshot(args.new))
+    for change in changes:
+        print(f"* {change}")
+    return int(args.exit_code and bool(changes))
+
+
+def run_build(args: argparse.Namespace) -> int:
+    """
+    Build the documentation once per language with ``django_translate`` enabled.
+
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    from importlib import import_module
+
+    from sphinx import locale
+    from sphinx.application import Sphinx, builtin_extensions
+    from sphinx.util.docutils import docutils_namespace, patch_docutils
+
+    # Labels like "Parameters" are only translated lazily if their modules are imported before
+    # the first message catalog is loaded, otherwise they would keep the first language
+    for extension in builtin_extensions:
+        import_module(extension)
+
+    status = 0
+    for language in args.languages:
+        print(f"Building language {language!r}")
+        # The message catalogs of Sphinx are loaded once per process
+        locale.translators.clear()
+        with patch_docutils(args.sourcedir), docutils_namespace():
+            app = Sphinx(
+                args.sourcedir,
+                args.sourcedir,
+                args.outputdir / language,
+                args.outputdir / ".doctrees" / language,
+                args.builder,
+                confoverrides={"language": language, "django_translate": True},
+            )
+            app.build()
+        status = max(status, app.statuscode)
+    return status
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command line interface.
+
+    :param argv: The command line arguments, defaults to :data:`sys.argv`
+    :return: The exit code
+    """
+    args = get_parser().parse_args(argv)
+    try:
+        return int(args.handler(args))
+    except ConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+This module adds the ``autodjango`` directive which documents a whole Django app without stub
+files, e.g.::
+
+    .. autodjango:: blog
+
+It walks the app registry once and generates the documentation of the app's models (including
+their fields), forms and views directly from the metadata which is also used to improve the
+autodoc docstrings. In contrast to :rst:dir:`automodule`, the modules are not scanned for members
+and the :event:`autodoc-process-docstring` event is not emitted for every member.
+
+The sections to document can be restricted with the ``:models:``, ``:forms:`` and ``:views:``
+flags.
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.autodjango",
+    ]
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import inspect
+import sys
+from typing import TYPE_CHECKING
+
+from django import forms, views
+from django.apps import apps
+from django.db import models
+from docutils import nodes
+from docutils.parsers.rst import directives
+from docutils.statemachine import StringList
+from sphinx.util.docstrings import prepare_docstring
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+from .docstrings.attributes import get_field_details
+from .docstrings.classes import get_field_docs, improve_class_docstring
+from .docstrings.views import improve_view_docstring
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import ModuleType
+    from typing import Any
+
+    import django
+    import sphinx
+    from django.apps import AppConfig
+    from sphinx.util.typing import ExtensionMetadata
+
+#: The sections which are documented by default
+SECTIONS = ("models", "forms", "views")
+
+
+class AutoDjangoDirective(SphinxDirective):
+    """
+    Directive to document the models, forms and views of a Django app, registered as
+    ``autodjango``.
+    """
+
+    required_arguments = 1
+    option_spec = {section: directives.flag for section in SECTIONS}
+
+    def run(self) -> list[nodes.Node]:
+        """Generate the documentation of the given app."""
+        try:
+            app_config = apps.get_app_config(self.arguments[0])
+        except LookupError as e:
+            raise self.error(f"Unable to document Django app: {e}") from e
+        sections = [section for section in SECTIONS if section in self.options] or list(
+            SECTIONS
+        )
+
+        source, _ = self.get_source_info()
+        lines = StringList()
+        # BuildEnvironment.app is deprecated since Sphinx 9
+        app = getattr(self.env, "_app", None) or self.env.app
+        for line in get_app_lines(app, app_config, sections):
+            lines.append(line, source)
+        for file in get_module_files(app_config, sections):
+            # Read the document again if one of the documented modules changes
+            self.env.note_dependency(file)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def get_app_lines(
+    app: sphinx.application.Sphinx, app_config: AppConfig, sections: list[str]
+) -> list[str]:
+    """
+    Get the reStructuredText lines which document the given app.
+
+    :param app: The Sphinx application object
+    :param app_config: The config of the app to document
+    :param sections: The sections to document (see :data:`SECTIONS`)
+    :return: The lines of the documentation
+    """
+    lines = []
+    if "models" in sections:
+        for model in app_config.get_models():
+            lines.extend(get_model_lines(app, model))
+    if "forms" in sections:
+        for form in get_module_members(app_config, "forms", is_form):
+            lines.extend(get_object_lines(app, form))
+    if "views" in sections:
+        for view in get_module_members(app_config, "views", is_view):
+            lines.extend(get_object_lines(app, view))
+    return lines
+
+
+def get_module_files(app_config: AppConfig, sections: list[str]) -> list[str]:
+    """
+    Get the files of the modules whose contents are documented for the given app.
+
+    This has to be called after :func:`get_app_lines`, which imports the modules.
+
+    :param app_config: The config of the app to document
+    :param sections: The sections to document (see :data:`SECTIONS`)
+    :return: The sorted paths of the module files
+    """
+    module_names: set[str] = set()
+    if "models" in sections:
+        module_names.update(model.__module__ for model in app_config.get_models())
+    module_names.update(
+        f"{app_config.name}.{section}" for section in sections if section != "models"
+    )
+    files = {
+        getattr(sys.modules.get(module_name), "__file__", None)
+        for module_name in module_names
+    }
+    return sorted(file for file in files if file)
+
+
+def get_model_lines(
+    app: sphinx.application.Sphinx, model: type[django.db.models.Model]
+) -> list[str]:
+    """
+    Get the reStructuredText lines which document the given model and its fields.
+
+    :param app: The Sphinx application object
+    :param model: The class of the model
+    :return: The lines of the documentation
+    """
+    lines = get_object_lines(app, model)
+    field_docs = get_field_docs(model)
+    for field in model._meta.get_fields():
+        if isinstance(field, models.fields.reverse_related.ForeignObjectRel):
+            # Reverse relationships are documented under the name of their accessor
+            if field.hidden:
+                continue
+            name = field.get_accessor_name() or field.name
+        else:
+            name = field.name
+        lines.extend([f"   .. py:attribute:: {name}", ""])
+        field_lines = get_field_details(app, field)
+        if field_docs.get(name):
+            field_lines.extend(["", *field_docs[name]])
+        lines.extend(indent(field_lines, 6))
+        lines.append("")
+    return lines
+
+
+def get_object_lines(
+    app: sphinx.application.Sphinx, obj: type | Callable[..., Any]
+) -> list[str]:
+    """
+    Get the reStructuredText lines which document the given class or function.
+
+    :param app: The Sphinx application object
+    :param obj: The documented class or function
+    :return: The lines of the documentation
+    """
+    if isinstance(obj, type):
+        directive, signature = "class", ""
+    else:
+        directive, signature = "function", str(inspect.signature(obj))
+    lines = [
+        f".. py:{directive}:: {obj.__qualname__}{signature}",
+        f"   :module: {obj.__module__}",
+        "",
+    ]
+    # Don't use inspect.getdoc(), since it returns the docstrings of base classes
+    docstring = obj.__doc__
+    if (
+        isinstance(obj, type)
+        and issubclass(obj, models.Model)
+        and docstring
+        and docstring.startswith(f"{obj.__name__}(")
+    ):
+        # Ignore the docstring which Django generates for models without docstring
+        docstring = None
+    docstring_lines = prepare_docstring(docstring or "")
+    if isinstance(obj, type):
+        improve_class_docstring(app, obj, docstring_lines)
+    else:
+        improve_view_docstring(obj, docstring_lines)
+    # Remove trailing empty lines
+    while docstring_lines and not docstring_lines[-1]:
+        docstring_lines.pop()
+    lines.extend(indent(docstring_lines, 3))
+    lines.append("")
+    return lines
+
+
+def get_module_members(
+    app_config: AppConfig, module_name: str, predicate: Callable[[object], bool]
+) -> Iterator[Any]:
+    """
+    Get the members of a submodule of the given app which are defined in this module.
+
+    :param app_config: The config of the app
+    :param module_name: The name of the submodule, e.g. ``forms``
+    :param predicate: A function which returns whether a member should be included
+    :return: The members of the submodule
+    """
+    module_path = f"{app_config.name}.{module_name}"
+    if importlib.util.find_spec(module_path) is None:
+        return
+    module: ModuleType = importlib.import_module(module_path)
+    for name, member in vars(module).items():
+        if (
+            not name.startswith("_")
+            and getattr(member, "__module__", None) == module_path
+            and predicate(member)
+        ):
+            yield member
+
+
+def is_form(obj: object) -> bool:
+    """
+    Check whether the given object is a form class.
+
+    :param obj: The object
+    """
+    return isinstance(obj, type) and issubclass(obj, forms.BaseForm)
+
+
+def is_view(obj: object) -> bool:
+    """
+    Check whether the given object is a view function or class-based view.
+
+    :param obj: The object
+    """
+    return inspect.isfunction(obj) or (
+        isinstance(obj, type) and issubclass(obj, views.View)
+    )
+
+
+def indent(lines: list[str], width: int) -> list[str]:
+    """
+    Indent the given non-empty lines.
+
+    :param lines: The lines to indent
+    :param width: The number of spaces
+    :return: The indented lines
+    """
+    return [" " * width + line if line else "" for line in lines]
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`AutoDjangoDirective`.
+
+    :param app: The Sphinx application object
+    """
+    app.add_directive("autodjango", AutoDjangoDirective)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
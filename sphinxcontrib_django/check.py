@@ -0,0 +1,307 @@
+"""
+This module adds the ``djangocheck`` builder which validates the Django references of the
+documentation without a full build, e.g.::
+
+    sphinx-build -b djangocheck docs docs/_build/djangocheck
+
+Instead of parsing the documents with docutils and writing output files, it only checks:
+
+* ``:py:model:`` references in the source files against the app registry
+* ``:setting:`` references in the source files against the settings which are documented with
+  ``.. setting::`` in the source files or in loaded intersphinx inventories, and against the
+  configured Django settings
+* the ``:attr:`` targets which are generated for related fields (see
+  :func:`~sphinxcontrib_django.docstrings.field_utils.get_field_verbose_name`) against the
+  attributes of the referenced models
+
+All broken references are reported as warnings, so ``-W`` can be used to fail on errors. Since
+the source files are only scanned for the references and no intersphinx inventories are
+loaded, the builder finishes in seconds. However, references which are generated by other
+extensions or directives are not checked.
+
+Like every builder, it stores its build environment in the doctree directory. Since it doesn't
+read the documents, don't share this directory with other builders, e.g. via ``make`` mode
+(``sphinx-build -M``), which uses one doctree directory for all builders. With ``-b``, the
+default doctree directory is inside the output directory of the builder, so it's separate.
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.check",
+    ]
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from sphinx.builders import Builder
+from sphinx.util import logging
+
+from . import __version__
+from .docstrings.field_utils import get_field_verbose_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Set
+    from typing import Any
+
+    import sphinx
+    from docutils import nodes
+    from sphinx.environment import BuildEnvironment
+    from sphinx.util.typing import ExtensionMetadata
+
+logger = logging.getLogger(__name__)
+
+#: The pattern of the checked references in source files
+REFERENCE_PATTERN = re.compile(r":(?P<role>py:model|setting):`(?P<content>[^`]+)`")
+
+#: The pattern of the setting targets in source files
+SETTING_TARGET_PATTERN = re.compile(
+    r"^\s*\.\. setting::[ \t]*(?P<name>\S+)", re.MULTILINE
+)
+
+#: The pattern of the generated attribute references
+ATTRIBUTE_PATTERN = re.compile(r":attr:`~?(?P<target>[^`]+)`")
+
+
+class RegistryBuilder(Builder):
+    """
+    Base class of builders which only use the app registry and the source files.
+
+    Apart from the root document, the documents are not parsed (see :func:`skip_reading`) and
+    the intersphinx inventories are not loaded (see :func:`skip_intersphinx`).
+    """
+
+    #: The intersphinx mapping of the configuration, which is restored after it was skipped
+    intersphinx_mapping: Any = None
+
+    def init(self) -> None:
+        """Nothing to initialize."""
+
+    def get_outdated_docs(self) -> str:
+        """All documents are processed on every build."""
+        return "all documents"
+
+    def get_target_uri(self, docname: str, typ: str | None = None) -> str:
+        """This builder has no document output."""
+        return ""
+
+    def write_doc(self, docname: str, doctree: nodes.document) -> None:
+        """This builder has no document output."""
+
+
+class DjangoCheckBuilder(RegistryBuilder):
+    """
+    Builder which checks the Django references of the source files instead of writing documents,
+    registered as ``djangocheck``.
+    """
+
+    name = "djangocheck"
+    epilog = "Look for any warnings in the above output."
+
+    def write_documents(self, docnames: Set[str]) -> None:
+        """
+        Check the references of the given documents and the generated references of all models
+        instead of writing the documents.
+
+        :param docnames: The documents to check
+        """
+        sources = {
+            docname: (
+                self.env.doc2path(docname).read_text(
+                    encoding=self.config.source_encoding
+                )
+            )
+            for docname in sorted(docnames)
+        }
+        setting_targets = get_setting_targets(self.env, sources.values())
+        broken = 0
+        for docname, source in sources.items():
+            for lineno, role, target in get_references(source):
+                if not is_valid_reference(role, target, setting_targets):
+                    logger.warning(
+                        "Broken Django reference :%s:`%s`",
+                        role,
+                        target,
+                        location=(docname, lineno),
+                    )
+                    broken += 1
+        for model_path, target in get_broken_attribute_targets():
+            logger.warning(
+                "Broken generated reference :attr:`%s` in the documentation of %s",
+                target,
+                model_path,
+            )
+            broken += 1
+        logger.info("%d broken Django references found", broken)
+
+
+def skip_reading(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """
+    Don't parse the documents for builders which only use the app registry and the source
+    files. Only the root document is read, which Sphinx requires.
+
+    Called on the :event:`env-before-read-docs` event.
+
+    :param app: The Sphinx application object
+    :param env: The Sphinx build environment
+    :param docnames: The documents to read, which are modified in place
+    """
+    if isinstance(app.builder, RegistryBuilder):
+        docnames[:] = [
+            docname for docname in docnames if docname == app.config.root_doc
+        ]
+
+
+def skip_intersphinx(app: sphinx.application.Sphinx) -> None:
+    """
+    Don't load the intersphinx inventories for builders which only use the app registry and the
+    source files.
+
+    Called on the :event:`builder-inited` event, before :mod:`sphinx.ext.intersphinx` loads the
+    inventories. The mapping is restored afterwards by :func:`restore_intersphinx`, so the
+    configuration which is stored with the build environment doesn't change.
+
+    :param app: The Sphinx application object
+    """
+    if isinstance(app.builder, RegistryBuilder) and "intersphinx_mapping" in app.config:
+        app.builder.intersphinx_mapping = app.config.intersphinx_mapping
+        app.config.intersphinx_mapping = {}
+
+
+def restore_intersphinx(app: sphinx.application.Sphinx) -> None:
+    """
+    Restore the intersphinx mapping which was skipped by :func:`skip_intersphinx`.
+
+    Called on the :event:`builder-inited` event, after :mod:`sphinx.ext.intersphinx` loaded the
+    inventories.
+
+    :param app: The Sphinx application object
+    """
+    if (
+        isinstance(app.builder, RegistryBuilder)
+        and app.builder.intersphinx_mapping is not None
+    ):
+        app.config.intersphinx_mapping = app.builder.intersphinx_mapping
+
+
+def get_setting_targets(env: BuildEnvironment, sources: Iterable[str]) -> set[str]:
+    """
+    Get the documented settings, which are valid targets of ``:setting:`` references.
+
+    :param env: The Sphinx build environment
+    :param sources: The contents of the source files
+    :return: The names of the settings which are documented with ``.. setting::`` in the source
+             files or in a previous build, or in already loaded intersphinx inventories
+    """
+    targets = {
+        match.group("name")
+        for source in sources
+        for match in SETTING_TARGET_PATTERN.finditer(source)
+    }
+    targets.update(
+        name
+        for objtype, name in env.domaindata.get("std", {}).get("objects", {})
+        if objtype == "setting"
+    )
+    targets.update(getattr(env, "intersphinx_inventory", {}).get("std:setting", {}))
+    return targets
+
+
+def get_references(source: str) -> Iterator[tuple[int, str, str]]:
+    """
+    Find the checked references in the given source.
+
+    :param source: The content of a source file
+    :return: The line number, the role and the target of each reference
+    """
+    for match in REFERENCE_PATTERN.finditer(source):
+        target = match.group("content")
+        # Use the target of references with explicit titles
+        explicit = re.fullmatch(r".*<(.+)>", target, re.DOTALL)
+        if explicit:
+            target = explicit.group(1)
+        yield (
+            source.count("\n", 0, match.start()) + 1,
+            match.group("role"),
+            target.lstrip("~!"),
+        )
+
+
+def is_valid_reference(
+    role: str, target: str, setting_targets: Set[str] = frozenset()
+) -> bool:
+    """
+    Check whether the given reference can be resolved.
+
+    :param role: The role of the reference (``py:model`` or ``setting``)
+    :param target: The target of the reference
+    :param setting_targets: The documented settings (see :func:`get_setting_targets`)
+    """
+    if role == "setting":
+        return target in setting_targets or (
+            target.isupper() and hasattr(settings, target)
+        )
+    if target.count(".") == 1:
+        try:
+            apps.get_model(target)
+        except LookupError:
+            return False
+        return True
+    return any(
+        f"{model.__module__}.{model.__qualname__}" == target
+        for model in apps.get_models()
+    )
+
+
+def get_broken_attribute_targets() -> Iterator[tuple[str, str]]:
+    """
+    Find the generated ``:attr:`` targets of related fields which don't exist.
+
+    The models of Django itself are skipped, since they are documented by Django.
+
+    :return: The path of the documented model and the broken target
+    """
+    model_paths = {
+        f"{model.__module__}.{model.__qualname__}": model for model in apps.get_models()
+    }
+    for model_path, model in model_paths.items():
+        if model.__module__.startswith("django."):
+            continue
+        for field in model._meta.get_fields():
+            for match in ATTRIBUTE_PATTERN.finditer(get_field_verbose_name(field)):
+                target_model, _, attribute = match.group("target").rpartition(".")
+                if target_model in model_paths and not hasattr(
+                    model_paths[target_model], attribute
+                ):
+                    yield model_path, match.group("target")
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`DjangoCheckBuilder` and skips the reading of documents and the
+    loading of intersphinx inventories for all :class:`RegistryBuilder` subclasses.
+
+    :param app: The Sphinx application object
+    """
+    app.add_builder(DjangoCheckBuilder)
+    app.connect("builder-inited", skip_intersphinx, priority=400)
+    app.connect("builder-inited", restore_intersphinx, priority=600)
+    app.connect("env-before-read-docs", skip_reading)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,431 @@
+"""
+This module adds the ``django-commands`` directive which documents the management commands of an
+app or of all apps of the project, e.g.::
+
+    .. django-commands:: blog
+
+Each command is documented with its help text, usage and options as target of the
+``:django-admin:`` role (see :mod:`~sphinxcontrib_django.roles`), so it can be referenced like the
+commands of Django, e.g. ``:django-admin:`rebuild_index```. The commands of Django itself are not
+included, since they are documented by Django.
+
+Building the argument parser of a command imports its module, which might be slow. So the parsers
+are built in a pool of worker processes, which set up Django once each. The workers have to be set
+up and every command has to be extracted within ``django_commands_timeout`` seconds. The workers
+are replaced after a timeout, so a hanging command can't stall the build. If the workers can't be
+set up, all commands fail at once. Commands which fail or time out are reported as warnings. The
+extracted data is stored in the build environment and only extracted again if the hash of the
+command module changed::
+
+    # Seconds to set up the workers and to extract the parser of a command, default: 30
+    django_commands_timeout = 30
+    # Number of worker processes, default: None (number of CPUs)
+    django_commands_workers = 4
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension and the cross-reference types of the
+:mod:`~sphinxcontrib_django.roles` extension::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.roles",
+        "sphinxcontrib_django.commands",
+    ]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.apps import apps
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.util import logging
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import sphinx
+    from django.apps import AppConfig
+    from sphinx.environment import BuildEnvironment
+    from sphinx.util.typing import ExtensionMetadata
+
+logger = logging.getLogger(__name__)
+
+#: The default amount of seconds to extract the parser of a command,
+#: used as default for the ``django_commands_timeout`` option
+COMMANDS_TIMEOUT = 30.0
+
+#: The error of the setup of this worker process, see :func:`setup_worker`
+SETUP_ERROR: Exception | None = None
+
+
+class ManagementCommand(NamedTuple):
+    """
+    A management command which was discovered in an app.
+    """
+
+    #: The name of the app which contains the command
+    app_name: str
+    #: The name of the command
+    name: str
+    #: The path of the command module
+    file: str
+    #: The SHA-256 hash of the command module, used to decide whether the extraction is outdated
+    digest: str
+
+
+class CommandMetadata(NamedTuple):
+    """
+    The extracted documentation of a management command.
+    """
+
+    #: The hash of the command module at the time of the extraction
+    digest: str
+    #: The help text of the command
+    help: str
+    #: The usage of the command
+    usage: str
+    #: The options and positional arguments with their help texts
+    options: tuple[tuple[str, str], ...]
+
+
+class CommandsDirective(SphinxDirective):
+    """
+    Directive to document the management commands of an app or of all apps, registered as
+    ``django-commands``.
+    """
+
+    optional_arguments = 1
+
+    def run(self) -> list[nodes.Node]:
+        """Document the commands of the given app, or of all apps."""
+        if self.arguments:
+            try:
+                app_configs = [apps.get_app_config(self.arguments[0])]
+            except LookupError as e:
+                raise self.error(f"Unable to document management commands: {e}") from e
+        else:
+            app_configs = list(apps.get_app_configs())
+
+        commands = discover_commands(app_configs)
+        for command in commands:
+            # Read the document again if one of the commands changes
+            self.env.note_dependency(command.file)
+        extracted = get_command_metadata(self.env, commands, self.get_location())
+
+        source, _ = self.get_source_info()
+        lines = StringList()
+        for command in commands:
+            for line in get_command_lines(command.name, extracted.get(command)):
+                lines.append(line, source)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def get_file_digest(path: str) -> str:
+    """
+    Get the hash of a file.
+
+    :param path: The path of the file
+    :return: The SHA-256 hash of the file
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def discover_commands(app_configs: Sequence[AppConfig]) -> list[ManagementCommand]:
+    """
+    Discover the management commands of the given apps without importing them.
+
+    :param app_configs: The configs of the apps
+    :return: The commands, sorted by app and name
+    """
+    from django.core.management import find_commands
+
+    commands = []
+    for app_config in app_configs:
+        if app_config.name.startswith("django."):
+            continue
+        management_dir = os.path.join(app_config.path, "management")
+        for name in sorted(find_commands(management_dir)):
+            file = os.path.join(management_dir, "commands", f"{name}.py")
+            if os.path.isfile(file):
+                commands.append(
+                    ManagementCommand(
+                        app_config.name, name, file, get_file_digest(file)
+                    )
+                )
+    return commands
+
+
+def get_command_metadata(
+    env: BuildEnvironment, commands: list[ManagementCommand], location: str
+) -> dict[ManagementCommand, CommandMetadata]:
+    """
+    Get the documentation of the given commands from the cache of the build environment, and
+    extract the commands which are not cached or whose modules changed.
+
+    :param env: The Sphinx build environment
+    :param commands: The commands
+    :param location: The location of the directive, used in warnings
+    :return: The documentation of the commands which could be extracted
+    """
+    cache: dict[tuple[str, str], CommandMetadata] = getattr(env, "django_commands", {})
+    env.django_commands = cache  # type: ignore[attr-defined]
+    outdated = [
+        command
+        for command in commands
+        if (command.app_name, command.name) not in cache
+        or cache[command.app_name, command.name].digest != command.digest
+    ]
+    if outdated:
+        for command, result in extract_commands(env.config, outdated).items():
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Unable to extract the management command %r: %s",
+                    command.name,
+                    result,
+                    location=location,
+                )
+            else:
+                cache[command.app_name, command.name] = result
+    return {
+        command: cache[command.app_name, command.name]
+        for command in commands
+        if (command.app_name, command.name) in cache
+        and cache[command.app_name, command.name].digest == command.digest
+    }
+
+
+def setup_worker(
+    settings_module: str,
+    apps_to_document: list[str],
+    mock_imports: list[str],
+    sys_path: list[str],
+) -> None:
+    """
+    Set up Django in a worker process, which then extracts the parsers of several commands.
+
+    An error is stored in :data:`SETUP_ERROR` and raised by :func:`check_worker`, since a pool
+    would replace a worker whose initializer fails over and over again.
+
+    :param settings_module: The import path of the Django settings module
+    :param apps_to_document: The labels or names of the apps which should be documented
+    :param mock_imports: The modules to mock
+    :param sys_path: The module search path of the Sphinx process
+    """
+    global SETUP_ERROR
+    from .docstrings import configure_django
+    from .docstrings.patches import patch_django_for_autodoc, patch_integrations
+
+    sys.path[:] = sys_path
+    try:
+        # Use the same module paths as the main process
+        patch_django_for_autodoc()
+        configure_django(settings_module, apps_to_document, mock_imports)
+        patch_integrations()
+    except Exception as e:
+        SETUP_ERROR = e
+
+
+def check_worker() -> None:
+    """
+    Check whether the worker process was set up.
+
+    :raises Exception: The error of :func:`setup_worker`
+    """
+    if SETUP_ERROR is not None:
+        raise SETUP_ERROR
+
+
+def parse_command(command: ManagementCommand) -> CommandMetadata:
+    """
+    Import a command and build its argument parser.
+
+    :param command: The command
+    :return: The documentation of the command
+    """
+    from django.core.management import load_command_class
+    from django.core.management.base import BaseCommand
+
+    check_worker()
+    instance = load_command_class(command.app_name, command.name)
+    parser = instance.create_parser("django-admin", command.name)
+    # Skip the options which all commands share
+    common = {
+        action.dest
+        for action in BaseCommand().create_parser("django-admin", "command")._actions
+    }
+    options = tuple(
+        (", ".join(action.option_strings) or action.dest, action.help or "")
+        for action in parser._actions
+        if action.dest not in common and action.help != argparse.SUPPRESS
+    )
+    return CommandMetadata(
+        digest=command.digest,
+        help=str(instance.help),
+        usage=parser.format_usage().strip(),
+        options=options,
+    )
+
+
+def extract_commands(
+    config: sphinx.config.Config, commands: list[ManagementCommand]
+) -> dict[ManagementCommand, CommandMetadata | BaseException]:
+    """
+    Extract the documentation of the given commands in a pool of worker processes.
+
+    The setup of the workers and the result of each command are awaited for at most
+    ``django_commands_timeout`` seconds. If the workers can't be set up, all commands fail with
+    the same error. Since a command which hangs, e.g. while it's imported, blocks its worker
+    process, the pool is terminated after a timeout and the commands which didn't finish yet are
+    extracted by new workers.
+
+    :param config: The Sphinx configuration
+    :param commands: The commands to extract
+    :return: The documentation or the error of each command
+    """
+    from .docstrings.budget import BudgetExceeded
+
+    # Use fresh interpreters, since forked workers would inherit the configured Django settings
+    context = multiprocessing.get_context("spawn")
+    timeout = config.django_commands_timeout
+    results: dict[ManagementCommand, CommandMetadata | BaseException] = {}
+    remaining = list(commands)
+    while remaining:
+        # Leaving the context terminates the workers, including hung ones
+        with context.Pool(
+            processes=min(
+                len(remaining), config.django_commands_workers or os.cpu_count() or 1
+            ),
+            initializer=setup_worker,
+            initargs=(
+                config.django_settings,
+                config.django_apps_to_document,
+                config.django_mock_imports,
+                sys.path,
+            ),
+        ) as pool:
+            setup_error: Exception | None = None
+            try:
+                pool.apply_async(check_worker).get(timeout)
+            except multiprocessing.TimeoutError:
+                setup_error = BudgetExceeded(
+                    f"workers not set up after {timeout:g} seconds"
+                )
+            except Exception as e:
+                setup_error = e
+            if setup_error is not None:
+                # Every worker fails the same way, so don't try the commands one by one
+                results.update(dict.fromkeys(remaining, setup_error))
+                return results
+            pending = {
+                command: pool.apply_async(parse_command, (command,))
+                for command in remaining
+            }
+            timed_out = False
+            for command, result in pending.items():
+                # After a timeout, only keep the commands which already finished
+                if timed_out and not result.ready():
+                    continue
+                try:
+                    results[command] = result.get(None if timed_out else timeout)
+                except multiprocessing.TimeoutError:
+                    results[command] = BudgetExceeded(
+                        f"not finished after {timeout:g} seconds"
+                    )
+                    # The worker of the command is blocked, so start new workers
+                    timed_out = True
+                except Exception as e:
+                    results[command] = e
+        remaining = [command for command in remaining if command not in results]
+    return results
+
+
+def get_command_lines(name: str, metadata: CommandMetadata | None) -> list[str]:
+    """
+    Get the reStructuredText lines which document a management command.
+
+    :param name: The name of the command
+    :param metadata: The documentation of the command, or ``None`` if it couldn't be extracted
+    :return: The lines of the documentation
+    """
+    # The targets of the cross-reference types have no content
+    lines = [f".. django-admin:: {name}", "", f"``{name}``"]
+    if metadata is None:
+        lines.extend(["   The command could not be inspected.", ""])
+        return lines
+    if metadata.help:
+        lines.extend(
+            f"   {line}" if line else "" for line in metadata.help.splitlines()
+        )
+        lines.append("")
+    lines.extend(["   .. code-block:: text", ""])
+    lines.extend(f"      {line}" for line in metadata.usage.splitlines())
+    lines.append("")
+    if metadata.options:
+        lines.extend(
+            f"   * ``{option}``: {text}" if text else f"   * ``{option}``"
+            for option, text in metadata.options
+        )
+        lines.append("")
+    return lines
+
+
+def merge_command_metadata(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """
+    Merge the commands which were extracted by parallel readers.
+
+    Called on the :event:`env-merge-info` event.
+
+    :param app: The Sphinx application object
+    :param env: The Sphinx build environment
+    :param docnames: The names of the documents which were read in parallel
+    :param other: The build environment of the parallel reader
+    """
+    if not hasattr(env, "django_commands"):
+        env.django_commands = {}  # type: ignore[attr-defined]
+    env.django_commands.update(getattr(other, "django_commands", {}))  # type: ignore[attr-defined]
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It adds the config values ``django_commands_timeout`` and ``django_commands_workers`` and
+    registers the :class:`CommandsDirective`.
+
+    :param app: The Sphinx application object
+    """
+    # Seconds to set up the workers and to extract the parser of a command, None for no limit
+    app.add_config_value("django_commands_timeout", COMMANDS_TIMEOUT, "env")
+    # Number of worker processes, defaults to the number of CPUs
+    app.add_config_value("django_commands_workers", None, "env")
+
+    app.add_directive("django-commands", CommandsDirective)
+    app.connect("env-merge-info", merge_command_metadata)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,243 @@
+"""
+This module adds the ``djangocoverage`` builder which reports which models and fields are
+documented, e.g.::
+
+    sphinx-build -b djangocoverage docs docs/_build/djangocoverage
+
+A model is documented if it has a docstring, a field is documented if it has an inline docstring
+(see :func:`~sphinxcontrib_django.docstrings.classes.get_field_docs`) or a ``help_text``. Reverse
+relations and automatically created fields (e.g. the implicit primary key) are not counted.
+
+The coverage per app, model and field is collected in a single pass over the app registry and
+written to ``coverage.txt`` and ``coverage.json`` in the output directory. Like the
+``djangocheck`` builder, it doesn't parse the documents.
+
+The build fails if the total coverage is below ``django_coverage_fail_under``::
+
+    # Minimum percentage of documented models and fields, default: None
+    django_coverage_fail_under = 90
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension and :mod:`~sphinxcontrib_django.check` to skip
+the reading of the documents::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.check",
+        "sphinxcontrib_django.coverage",
+    ]
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.db import models
+from django.utils.encoding import force_str
+from sphinx.errors import SphinxError
+from sphinx.util import logging
+
+from . import __version__
+from .check import RegistryBuilder
+from .docstrings.classes import get_field_docs
+from .docstrings.subset import get_app_configs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Set
+    from typing import Any
+
+    import sphinx
+    from django.db.models import Model
+    from sphinx.util.typing import ExtensionMetadata
+
+logger = logging.getLogger(__name__)
+
+
+class DjangoCoverageBuilder(RegistryBuilder):
+    """
+    Builder which writes the documentation coverage of models and fields,
+    registered as ``djangocoverage``.
+    """
+
+    name = "djangocoverage"
+    epilog = "Look at the coverage report in %(outdir)s."
+
+    def write_documents(self, docnames: Set[str]) -> None:
+        """The coverage doesn't depend on the documents."""
+
+    def finish(self) -> None:
+        """
+        Write the coverage report and check the threshold.
+
+        :raises ~sphinx.errors.SphinxError: If the coverage is below
+                                            ``django_coverage_fail_under``
+        """
+        coverage = get_coverage(self.config.django_apps_to_document)
+        (self.outdir / "coverage.json").write_text(
+            json.dumps(coverage, indent=2), encoding="utf-8"
+        )
+        (self.outdir / "coverage.txt").write_text(
+            format_coverage(coverage), encoding="utf-8"
+        )
+        logger.info(
+            "%d of %d models and fields documented (%.2f%%)",
+            coverage["documented"],
+            coverage["total"],
+            coverage["coverage"],
+        )
+        fail_under = self.config.django_coverage_fail_under
+        if fail_under is not None and coverage["coverage"] < fail_under:
+            raise SphinxError(
+                f"The documentation coverage of {coverage['coverage']:.2f}% is below"
+                f" django_coverage_fail_under = {fail_under}%"
+            )
+
+
+def get_coverage(app_labels: list[str]) -> dict[str, Any]:
+    """
+    Get the documentation coverage of all models.
+
+    The models of Django itself are skipped, since they are documented by Django.
+
+    :param app_labels: The labels or names of the apps to include, all apps if empty
+    :return: The coverage per app and model, and the documentation status of each field
+
+    :raises ~sphinx.errors.ConfigError: If one of the given apps is not installed
+    """
+    if app_labels:
+        models_to_document = [
+            model
+            for app_config in get_app_configs(app_labels)
+            for model in app_config.get_models()
+        ]
+    else:
+        models_to_document = [
+            model
+            for model in apps.get_models()
+            if not model.__module__.startswith("django.")
+        ]
+    coverage: dict[str, Any] = {"apps": {}}
+    for model in models_to_document:
+        app_coverage = coverage["apps"].setdefault(
+            model._meta.app_label, {"models": {}}
+        )
+        app_coverage["models"][model._meta.label] = get_model_coverage(model)
+    for app_coverage in coverage["apps"].values():
+        add_totals(app_coverage, app_coverage["models"].values())
+    add_totals(coverage, coverage["apps"].values())
+    return coverage
+
+
+def get_model_coverage(model: type[Model]) -> dict[str, Any]:
+    """
+    Get the documentation coverage of the given model and its fields.
+
+    :param model: The model
+    :return: Whether the model and each field is documented and the totals
+    """
+    field_docs = get_field_docs(model)
+    fields = {
+        field.name: bool(
+            field_docs.get(field.name) or force_str(getattr(field, "help_text", ""))
+        )
+        for field in model._meta.get_fields(include_parents=True)
+        if not field.auto_created
+        and not isinstance(field, models.fields.reverse_related.ForeignObjectRel)
+    }
+    # Django adds a docstring with the signature to models without docstring
+    generated_docstring = (
+        f"{model.__name__}({', '.join(field.name for field in model._meta.fields)})"
+    )
+    docstring = bool(model.__doc__) and model.__doc__ != generated_docstring
+    documented = docstring + sum(fields.values())
+    total = 1 + len(fields)
+    return {
+        "docstring": docstring,
+        "fields": fields,
+        "documented": documented,
+        "total": total,
+        "coverage": get_percentage(documented, total),
+    }
+
+
+def add_totals(coverage: dict[str, Any], children: Iterable[dict[str, Any]]) -> None:
+    """
+    Add the sum of the documented and total items of the given children.
+
+    :param coverage: The coverage of an app or of all apps
+    :param children: The coverages of the models or apps
+    """
+    children_list = list(children)
+    coverage["documented"] = sum(child["documented"] for child in children_list)
+    coverage["total"] = sum(child["total"] for child in children_list)
+    coverage["coverage"] = get_percentage(coverage["documented"], coverage["total"])
+
+
+def get_percentage(documented: int, total: int) -> float:
+    """
+    Get the percentage of documented items.
+
+    :param documented: The number of documented items
+    :param total: The number of items
+    """
+    return round(100 * documented / total, 2) if total else 100.0
+
+
+def format_coverage(coverage: dict[str, Any]) -> str:
+    """
+    Format the coverage as text table, followed by the undocumented models and fields.
+
+    :param coverage: The coverage of all apps
+    :return: The text report
+    """
+    rows = []
+    undocumented = []
+    for app_label, app_coverage in sorted(coverage["apps"].items()):
+        rows.append((app_label, app_coverage))
+        for model_label, model_coverage in sorted(app_coverage["models"].items()):
+            rows.append((f"  {model_label}", model_coverage))
+            if not model_coverage["docstring"]:
+                undocumented.append(model_label)
+            undocumented.extend(
+                f"{model_label}.{field_name}"
+                for field_name, documented in model_coverage["fields"].items()
+                if not documented
+            )
+    rows.append(("Total", coverage))
+
+    width = max(len(name) for name, _ in rows)
+    lines = [f"{'Name':<{width}}  Documented  Coverage"]
+    lines.append("-" * len(lines[0]))
+    lines.extend(
+        f"{name:<{width}}  {row['documented']:>4} / {row['total']:<3}"
+        f"  {row['coverage']:>7.2f}%"
+        for name, row in rows
+    )
+    if undocumented:
+        lines.extend(["", "Undocumented:", ""])
+        lines.extend(f"* {name}" for name in undocumented)
+    return "\n".join(lines) + "\n"
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`DjangoCoverageBuilder` and the config value
+    ``django_coverage_fail_under``.
+
+    :param app: The Sphinx application object
+    """
+    app.add_builder(DjangoCoverageBuilder)
+    # Minimum percentage of documented models and fields, None to disable
+    app.add_config_value("django_coverage_fail_under", None, "")
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
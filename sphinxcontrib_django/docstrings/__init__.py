@@ -15,30 +15,65 @@ For example:
   (see :mod:`~sphinxcontrib_django.docstrings.views`)
 * Fix the intersphinx mappings to the Django documentation
   (see :mod:`~sphinxcontrib_django.docstrings.patches`)
+* Only load the documented apps
+  (see :mod:`~sphinxcontrib_django.docstrings.subset`)
+* Mock heavy optional modules while setting up Django
+  (see :mod:`~sphinxcontrib_django.docstrings.mock`)
+* Evaluate callable choices within a time and item budget
+  (see :mod:`~sphinxcontrib_django.docstrings.budget`)
+* Move oversized lists onto companion pages
+  (see :mod:`~sphinxcontrib_django.docstrings.overflow`)
+* Exclude generated content from the search index
+  (see :mod:`~sphinxcontrib_django.docstrings.search`)
+* Skip members by configurable rules
+  (see :mod:`~sphinxcontrib_django.docstrings.skip`)
+* Add the admin configuration of models
+  (see :mod:`~sphinxcontrib_django.docstrings.admin`)
+* Add the receivers of model signals
+  (see :mod:`~sphinxcontrib_django.docstrings.signals`)
 """
 
 from __future__ import annotations
 
 import importlib
 import os
+from functools import partial
 from typing import TYPE_CHECKING
 
 import django
+from sphinx.config import ENUM
 from sphinx.errors import ConfigError
 
 from .. import __version__
+from .admin import reset_admin_index
 from .attributes import improve_attribute_docstring
 from .classes import improve_class_docstring
-from .config import CHOICES_LIMIT, EXCLUDE_MEMBERS, INCLUDE_MEMBERS
+from .config import CHOICES_LIMIT, CHOICES_MAX_ITEMS, CHOICES_TIMEOUT
 from .data import improve_data_docstring
-from .methods import improve_method_docstring
+from .methods import (
+    improve_method_docstring,
+    improve_method_signature,
+    reset_contributed_methods,
+)
+from .mock import install_mock_imports, remove_mock_imports, report_mock_imports
+from .overflow import collect_overflow_pages, merge_overflow_pages, purge_overflow_pages
+from .search import check_search_exclude, mark_excluded_fields
+from .signals import reset_signal_receivers
+from .skip import get_owner, setup_skip_rules
+from .subset import restrict_installed_apps
+from .translation import activate_language, deactivate_language
 from .views import improve_view_docstring
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import sphinx
     from sphinx.ext.autodoc import Options
     from sphinx.util.typing import ExtensionMetadata
 
+    from .mock import DjangoMockFinder
+    from .skip import SkipRuleMatcher
+
 
 def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     """
@@ -56,7 +91,7 @@ def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
 
     :param app: The Sphinx application object
     """
-    from .patches import patch_django_for_autodoc
+    from .patches import patch_django_for_autodoc, patch_integrations
 
     # When running, make sure Django doesn't execute querysets
     # Fix module paths for intersphinx mappings
@@ -64,19 +99,60 @@ def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
 
     # Register custom event which can be emitted after Django has been set up
     app.add_event("django-configured")
+    # Patch optional integrations, e.g. postgres fields, once the installed apps are known
+    app.connect("django-configured", patch_integrations)
 
     # Set default to environment variable to enable backwards compatibility
     app.add_config_value(
         "django_settings", os.environ.get("DJANGO_SETTINGS_MODULE"), "env"
     )
 
+    # Labels of the apps to document, all installed apps are loaded if empty
+    app.add_config_value("django_apps_to_document", [], "env")
+
+    # Modules to mock while setting up Django
+    app.add_config_value("django_mock_imports", [], "env")
+
     # Django models tables names configuration.
     # Set default of django_show_db_tables to False
     app.add_config_value("django_show_db_tables", False, "env")
     # Set default of django_show_db_tables_abstract to False
     app.add_config_value("django_show_db_tables_abstract", False, "env")
+    # Add the admin configuration of registered models, default False
+    app.add_config_value("django_show_admin", False, "env")
+    # Add the signal receivers of models, default False
+    app.add_config_value("django_show_signals", False, "env")
     # Integer amount of model field choices to show
     app.add_config_value("django_choices_to_show", CHOICES_LIMIT, "env")
+    # Seconds to wait for callable choices and limit_choices_to, None to wait without limit
+    app.add_config_value("django_choices_timeout", CHOICES_TIMEOUT, "env")
+    # Integer amount of callable choices to evaluate at most, None to evaluate all
+    app.add_config_value("django_choices_max_items", CHOICES_MAX_ITEMS, "env")
+    # Integer amount of reverse relationships to show, all are shown if None
+    app.add_config_value("django_reverse_relations_to_show", None, "env")
+    # Move the full lists of truncated choices and reverse relationships to separate pages
+    app.add_config_value("django_overflow_pages", False, "env")
+    # Render the fields of models as parameters or as compact table
+    app.add_config_value(
+        "django_model_fields_renderer", "params", "env", ENUM("params", "table")
+    )
+    # Integer amount of fields above which a model is rendered as table, None to disable
+    app.add_config_value("django_model_fields_table_threshold", None, "env")
+    # Integer amount of base class levels shown in the inheritance diagrams of models
+    app.add_config_value("django_inheritance_diagram_depth", None, "env")
+    # Sections of the generated content to exclude from the search index
+    app.add_config_value("django_search_exclude", [], "env")
+    app.connect("config-inited", check_search_exclude)
+    # Translate verbose names, help texts and choice labels into the language of the build
+    app.add_config_value("django_translate", False, "env")
+    app.connect("django-configured", activate_language)
+    # Forget the methods which Django contributed to the models of a previous setup
+    app.connect("django-configured", reset_contributed_methods)
+    # Index the models which are registered on admin sites
+    app.connect("django-configured", reset_admin_index)
+    # Index the receivers of model signals by sender
+    app.connect("django-configured", reset_signal_receivers)
+    app.connect("build-finished", deactivate_language)
     # Setup Django after config is initialized
     app.connect("config-inited", setup_django)
 
@@ -86,10 +162,21 @@ def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     # Generate docstrings for Django model fields
     # Register the docstring processor with sphinx
     app.connect("autodoc-process-docstring", improve_docstring)
+    app.connect("autodoc-process-signature", improve_method_signature)
 
     # influence skip rules
+    app.add_config_value("django_autodoc_skip_rules", [], "env")
+    app.connect("config-inited", setup_skip_rules)
     app.connect("autodoc-skip-member", autodoc_skip)
 
+    # Generate the companion pages of truncated lists
+    app.connect("html-collect-pages", collect_overflow_pages)
+    app.connect("env-purge-doc", purge_overflow_pages)
+    app.connect("env-merge-info", merge_overflow_pages)
+
+    # Exclude the parameter lists of models from the search index
+    app.connect("doctree-read", mark_excluded_fields)
+
     return {
         "version": __version__,
         "parallel_read_safe": True,
@@ -110,24 +197,65 @@ def setup_django(app: sphinx.application.Sphinx, config: sphinx.config.Config) -
 
     :raises ~sphinx.errors.ConfigError: If setting ``django_settings`` is not set correctly
     """
-    if not config.django_settings:
+    finder = configure_django(
+        config.django_settings,
+        apps_to_document=config.django_apps_to_document,
+        mock_imports=config.django_mock_imports,
+    )
+    if finder is not None:
+        app.connect("build-finished", partial(remove_mock_imports, finder))
+
+    # Emit event to allow code which depends on Django to run
+    app.emit("django-configured")
+
+
+def configure_django(
+    settings_module: str | None,
+    apps_to_document: Sequence[str] = (),
+    mock_imports: Sequence[str] = (),
+) -> DjangoMockFinder | None:
+    """
+    Import the settings module and call :func:`django.setup`.
+
+    If ``apps_to_document`` is given, only these apps and the apps they depend on are loaded
+    (see :func:`~sphinxcontrib_django.docstrings.subset.restrict_installed_apps`).
+    The modules in ``mock_imports`` are mocked until
+    :func:`~sphinxcontrib_django.docstrings.mock.remove_mock_imports` is called
+    (see :mod:`~sphinxcontrib_django.docstrings.mock`).
+
+    :param settings_module: The import path of the Django settings module
+    :param apps_to_document: The labels or names of the apps which should be documented
+    :param mock_imports: The modules to mock
+    :return: The finder of the mocked modules, if any
+
+    :raises ~sphinx.errors.ConfigError: If the settings module is not set correctly
+    """
+    if not settings_module:
         raise ConfigError(
             "Please specify your Django settings in the configuration 'django_settings'"
             " in your conf.py"
         )
+    finder = None
+    if mock_imports:
+        # Mock heavy modules which are imported by the settings or models
+        finder = install_mock_imports(mock_imports)
     try:
-        importlib.import_module(config.django_settings)
+        importlib.import_module(settings_module)
     except ModuleNotFoundError as e:
         raise ConfigError(
             "The module you specified in the configuration 'django_settings' in your"
             " conf.py cannot be imported. Make sure the module path is correct and the"
             " source directory is added to sys.path."
         ) from e
-    os.environ["DJANGO_SETTINGS_MODULE"] = config.django_settings
+    os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+    if apps_to_document:
+        # Only load the documented apps and the apps they depend on
+        restrict_installed_apps(apps_to_document)
     django.setup()
 
-    # Emit event to allow code which depends on Django to run
-    app.emit("django-configured")
+    if finder is not None:
+        report_mock_imports(finder)
+    return finder
 
 
 def autodoc_skip(
@@ -141,8 +269,10 @@ def autodoc_skip(
     """
     Hook to tell autodoc to include or exclude certain fields (see :event:`autodoc-skip-member`).
 
-    Sadly, it doesn't give a reference to the parent object,
-    so only the ``name`` can be used for referencing.
+    The event doesn't give a reference to the parent object, so the class which is currently
+    documented is taken from autodoc (see :func:`~sphinxcontrib_django.docstrings.skip.get_owner`)
+    and the rules of ``django_autodoc_skip_rules`` are checked (see
+    :mod:`~sphinxcontrib_django.docstrings.skip`).
 
     :param app: The Sphinx application object
     :param what: The parent type, ``class`` or ``module``
@@ -151,13 +281,8 @@ def autodoc_skip(
     :param skip: Whether autodoc would skip this member on its own
     :param options: The current autodoc settings.
     """
-    if name in EXCLUDE_MEMBERS:
-        return True
-
-    if name in INCLUDE_MEMBERS:
-        return False
-
-    return None
+    skip_rules: SkipRuleMatcher = app.django_skip_rules  # type: ignore[attr-defined]
+    return skip_rules.match(name, get_owner(app, what))
 
 
 def improve_docstring(
@@ -189,7 +314,7 @@ def improve_docstring(
     elif what == "attribute":
         improve_attribute_docstring(app, obj, name, lines)
     elif what == "method":
-        improve_method_docstring(name, lines)
+        improve_method_docstring(app, name, lines)
     elif what == "data":
         improve_data_docstring(obj, lines)
     elif what == "function" and callable(obj):
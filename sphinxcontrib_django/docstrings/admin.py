@@ -0,0 +1,169 @@
+"""
+This module adds the admin configuration of models to their documentation, and the registered
+models to the documentation of :class:`~django.contrib.admin.ModelAdmin` classes.
+
+The registrations of the default :data:`~django.contrib.admin.site` and of all custom
+:class:`~django.contrib.admin.AdminSite` instances are collected into one index after Django has
+been set up, so documenting a class only needs a lookup instead of scanning all admin sites.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from .form_utils import get_class_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    import sphinx.application
+    from django.contrib.admin import AdminSite, ModelAdmin
+    from django.db.models import Model
+
+
+class AdminRegistration(NamedTuple):
+    """
+    A model which is registered on an admin site.
+    """
+
+    #: The name of the admin site
+    site_name: str
+    #: The class of the registered model
+    model: type[Model]
+    #: The model admin instance of the site
+    model_admin: ModelAdmin[Any]
+
+
+class AdminIndex(NamedTuple):
+    """
+    The registrations of all admin sites.
+    """
+
+    #: The registrations by model class
+    models: dict[type[Model], list[AdminRegistration]]
+    #: The registrations by model admin class
+    model_admins: dict[type[ModelAdmin[Any]], list[AdminRegistration]]
+
+
+@cache
+def get_admin_index() -> AdminIndex:
+    """
+    Get the index of the models which are registered on any admin site.
+
+    The sites are taken from :data:`django.contrib.admin.sites.all_sites`, which contains every
+    instantiated site, including the default site once models are registered on it. If the
+    admin was never imported, no models can be registered, so it isn't imported here either.
+
+    :return: The registrations by model and by model admin class
+    """
+    sites_module = sys.modules.get("django.contrib.admin.sites")
+    sites: Iterable[AdminSite] = sorted(
+        getattr(sites_module, "all_sites", ()), key=lambda site: site.name
+    )
+    index = AdminIndex({}, {})
+    for site in sites:
+        for model, model_admin in site._registry.items():
+            registration = AdminRegistration(site.name, model, model_admin)
+            index.models.setdefault(model, []).append(registration)
+            index.model_admins.setdefault(type(model_admin), []).append(registration)
+    return index
+
+
+def reset_admin_index(app: sphinx.application.Sphinx) -> None:
+    """
+    Forget the admin registrations of a previous setup of the app registry.
+
+    Called on the ``django-configured`` event.
+
+    :param app: The Sphinx application object
+    """
+    get_admin_index.cache_clear()
+
+
+def format_names(values: Iterable[Any]) -> str:
+    """
+    Format the entries of an admin option, e.g. field names or callables.
+
+    :param values: The entries of the option
+    :return: The comma-separated names as inline literals
+    """
+    return ", ".join(f"``{getattr(value, '__name__', value)}``" for value in values)
+
+
+def get_model_admin_lines(registration: AdminRegistration) -> list[str]:
+    """
+    Get the documentation of the admin configuration of a model.
+
+    :param registration: The registration of the model
+    :return: The docstring lines
+    """
+    model_admin: Any = registration.model_admin
+    lines = [
+        f"Admin :class:`~{get_class_path(type(model_admin))}`"
+        f" (site ``{registration.site_name}``):",
+        "",
+        f"* List display: {format_names(model_admin.list_display)}",
+    ]
+    if model_admin.search_fields:
+        lines.append(f"* Search fields: {format_names(model_admin.search_fields)}")
+    if model_admin.list_select_related is True:
+        lines.append("* List select related: all")
+    elif model_admin.list_select_related:
+        lines.append(
+            f"* List select related: {format_names(model_admin.list_select_related)}"
+        )
+    if model_admin.inlines:
+        inlines = ", ".join(
+            f":class:`~{get_class_path(inline)}`" for inline in model_admin.inlines
+        )
+        lines.append(f"* Inlines: {inlines}")
+    return lines
+
+
+def add_admin_configuration(
+    app: sphinx.application.Sphinx, model: type[Model], lines: list[str]
+) -> None:
+    """
+    Add the admin configuration of a model, if it's registered on any admin site and
+    ``django_show_admin`` is enabled.
+
+    :param app: The Sphinx application object
+    :param model: The class of the model to document
+    :param lines: The docstring lines
+    """
+    if not app.config.django_show_admin:
+        return
+    for registration in get_admin_index().models.get(model, []):
+        lines.append("")
+        lines.extend(get_model_admin_lines(registration))
+
+
+def improve_model_admin_docstring(
+    app: sphinx.application.Sphinx, cls: type, lines: list[str]
+) -> None:
+    """
+    Add the models for which a :class:`~django.contrib.admin.ModelAdmin` class is registered, if
+    ``django_show_admin`` is enabled.
+
+    Classes which are not registered on any admin site are left unchanged.
+
+    :param app: The Sphinx application object
+    :param cls: The class to document
+    :param lines: The docstring lines
+    """
+    if not app.config.django_show_admin:
+        return
+    registrations = get_admin_index().model_admins.get(cls)
+    if not registrations:
+        return
+    if lines and lines[-1]:
+        lines.append("")
+    lines.extend(["Registered for:", ""])
+    lines.extend(
+        f"* :class:`~{get_class_path(registration.model)}`"
+        f" (site ``{registration.site_name}``)"
+        for registration in registrations
+    )
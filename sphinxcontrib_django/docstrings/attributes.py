@@ -11,29 +11,46 @@ from django.db.models.fields import related_descriptors
 from django.db.models.fields.files import FileDescriptor
 from django.db.models.manager import ManagerDescriptor
 from django.db.models.query_utils import DeferredAttribute
-from django.utils.module_loading import import_string
+from django.utils.choices import CallableChoiceIterator
 from sphinx.application import Sphinx
+from sphinx.util import logging
 from sphinx.util.docstrings import prepare_docstring
 
+from .budget import call_with_timeout, evaluate_with_budget
 from .field_utils import get_field_type, get_field_verbose_name
+from .overflow import get_overflow_link
+from .search import exclude_from_search, is_excluded
+from .translation import cache_per_language
 
 if TYPE_CHECKING:
     from typing import Any
 
     from django.db.models.fields.reverse_related import ForeignObjectRel
 
+logger = logging.getLogger(__name__)
+
+#: The descriptors which are documented like forward fields, extended by
+#: :func:`register_field_descriptor`
 FIELD_DESCRIPTORS: tuple[type[Any], ...] = (
     FileDescriptor,
     related_descriptors.ForwardManyToOneDescriptor,
 )
 
-# Support for some common third party fields
-try:
-    from phonenumber_field.modelfields import PhoneNumberDescriptor
+#: The prepared docstrings of the classes of documented attributes
+DEFAULT_DOCSTRINGS: dict[type[Any], list[str]] = {}
+
 
-    FIELD_DESCRIPTORS += (PhoneNumberDescriptor,)
-except ImportError:
-    PhoneNumberDescriptor = None
+def register_field_descriptor(descriptor: type[Any]) -> None:
+    """
+    Document the attributes of the given descriptor class like forward fields, e.g. the
+    descriptors of third party fields (see
+    :func:`~sphinxcontrib_django.docstrings.patches.patch_integrations`).
+
+    :param descriptor: The descriptor class, which has to reference its field as ``field``
+    """
+    global FIELD_DESCRIPTORS
+    if descriptor not in FIELD_DESCRIPTORS:
+        FIELD_DESCRIPTORS += (descriptor,)
 
 
 def improve_attribute_docstring(
@@ -53,11 +70,10 @@ def improve_attribute_docstring(
     docstring_lines = lines.copy()
     lines.clear()
     if isinstance(attribute, DeferredAttribute):
-        # This only points to a field name, not a field.
-        # Get the field by importing the name.
-        cls_path, field_name = name.rsplit(".", 1)
-        model = import_string(cls_path)
-        field = model._meta.get_field(field_name)
+        # The deferred attribute holds the field it loads, so the model doesn't have to be
+        # imported by its name
+        cls_path = name.rsplit(".", 1)[0]
+        field = attribute.field
         if isinstance(field, models.fields.related.RelatedField):
             # If a deferred attribute is a related field, it is an automatically created field
             # with the postfix "_id" and contains the reference to the id of the related model
@@ -87,20 +103,37 @@ def improve_attribute_docstring(
         module, model_name, field_name = name.rsplit(".", 2)
         lines.append("Django manager to access the ORM")
         lines.append(f"Use ``{model_name}.objects.all()`` to fetch all objects.")
-    # Check if there are initial docstrings to be appended
-    if docstring_lines:
-        # Get default docstring of attribute
-        parent_docstring = type(attribute).__doc__
+        if is_excluded(app, "managers"):
+            lines[:] = exclude_from_search(lines)
+    # Check if there are initial docstrings to be appended, but only append the initial
+    # docstring of the attribute if it's overwritten
+    if docstring_lines and (
+        docstring_lines != get_default_docstring(attribute.__class__) or not lines
+    ):
+        if lines:
+            # If lines are not empty, append a separating new line before docstring
+            lines.append("")
+        # Remove last element because it's a newline
+        lines.extend(docstring_lines[:-1])
+
+
+def get_default_docstring(attribute_type: type[Any]) -> list[str]:
+    """
+    Get the prepared docstring of the class of an attribute, e.g. of a descriptor class.
+
+    The result is cached per class, since it is compared with the docstring of each documented
+    attribute.
+
+    :param attribute_type: The class of the attribute
+    :return: The docstring lines
+    """
+    if attribute_type not in DEFAULT_DOCSTRINGS:
+        docstring = attribute_type.__doc__
         # Ignore non-string __doc__
-        if not isinstance(parent_docstring, str):
-            parent_docstring = ""
-        # Only append the initial docstring of the attribute if it's overwritten
-        if docstring_lines != prepare_docstring(parent_docstring) or not lines:
-            if lines:
-                # If lines are not empty, append a separating new line before docstring
-                lines.append("")
-            # Remove last element because it's a newline
-            lines.extend(docstring_lines[:-1])
+        DEFAULT_DOCSTRINGS[attribute_type] = prepare_docstring(
+            docstring if isinstance(docstring, str) else ""
+        )
+    return DEFAULT_DOCSTRINGS[attribute_type]
 
 
 def get_field_details(
@@ -114,19 +147,44 @@ def get_field_details(
     :param field: The field
     :return: The field details as list of strings
     """
-    choices_limit = app.config.django_choices_to_show
-
     field_details = [
         f"Type: {get_field_type(field)}",
         "",
         f"{get_field_verbose_name(field)}",
     ]
-    # ensure lazy choices (e.g. callables) are evaluated
-    raw_choices = getattr(field, "choices", None)
-    choices = list(raw_choices) if raw_choices else []
-    if choices:
-        field_details.extend(["", "Choices:", ""])
-        field_details.extend(
+    limit_choices_to = get_limit_choices_to(field, app.config.django_choices_timeout)
+    if limit_choices_to:
+        field_details.extend(["", f"Limited to: {limit_choices_to}"])
+    choice_lines = get_choice_lines(app, field)
+    if choice_lines:
+        field_details.append("")
+        field_details.extend(choice_lines)
+    if is_excluded(app, "attributes"):
+        return exclude_from_search(field_details)
+    return field_details
+
+
+def get_choice_lines(
+    app: Sphinx, field: models.Field[Any, Any] | ForeignObjectRel
+) -> list[str]:
+    """
+    Get the choices of a field as bullet list, truncated after ``django_choices_to_show``.
+
+    :param app: The Sphinx application object
+    :param field: The field
+    :return: The lines of the choices, or an empty list if the field has no choices
+    """
+    choices_limit = app.config.django_choices_to_show
+    choices = get_choices(
+        field, app.config.django_choices_timeout, app.config.django_choices_max_items
+    )
+    if choices is None:
+        choice_lines = [
+            f"Choices: computed by ``{get_callable_path(field.choices)}``"  # type: ignore[union-attr]
+        ]
+    elif choices:
+        choice_lines = ["Choices:", ""]
+        choice_lines.extend(
             format_choice(key, value) for key, value in choices[:choices_limit]
         )
 
@@ -134,10 +192,135 @@ def get_field_details(
         if len(choices) > choices_limit:
             # If only one element has been truncated, just list it as well
             if len(choices) == choices_limit + 1:
-                field_details.append(format_choice(*choices[-1]))
+                choice_lines.append(format_choice(*choices[-1]))
             else:
-                field_details.append(f"* and {len(choices) - choices_limit} more")
-    return field_details
+                more = f"* and {len(choices) - choices_limit} more"
+                uri = get_overflow_link(
+                    app,
+                    f"choices/{field.model._meta.label_lower}.{field.name}",
+                    f"Choices of {field.model._meta.label}.{field.name}",
+                    f"{field.model.__module__}.{field.model.__qualname__}.{field.name}",
+                    [
+                        (
+                            str(key) if key != "" else "''",
+                            value if value != str(key) else "",
+                            None,
+                        )
+                        for key, value in choices
+                    ],
+                )
+                if uri:
+                    more += f" (`show all <{uri}>`__)"
+                choice_lines.append(more)
+    else:
+        return []
+    if is_excluded(app, "choices"):
+        return exclude_from_search(choice_lines)
+    return choice_lines
+
+
+@cache_per_language
+def get_choices(
+    field: models.Field[Any, Any] | ForeignObjectRel,
+    timeout: float | None = None,
+    max_items: int | None = None,
+) -> list[tuple[Any, str]] | None:
+    """
+    Get the choices of a field with their rendered display names.
+
+    The choices are evaluated by :func:`evaluate_choices`. The result is cached per language (see
+    :func:`~sphinxcontrib_django.docstrings.translation.cache_per_language`).
+
+    :param field: The field
+    :param timeout: The seconds to wait for callable choices, ``None`` to wait without limit
+    :param max_items: The maximum amount of callable choices, ``None`` for no limit
+    :return: The stored values and display names of the choices, or ``None`` if the callable
+             choices failed or exceeded the budget
+    """
+    choices = evaluate_choices(field, timeout, max_items)
+    if choices is None:
+        return None
+    return [(key, str(value)) for key, value in choices]
+
+
+def evaluate_choices(
+    field: models.Field[Any, Any] | ForeignObjectRel,
+    timeout: float | None = None,
+    max_items: int | None = None,
+) -> list[tuple[Any, Any]] | None:
+    """
+    Get the choices of a field, evaluating callable choices within the given budget (see
+    :mod:`~sphinxcontrib_django.docstrings.budget`). If the callable fails or doesn't finish in
+    time, a warning is logged.
+
+    :param field: The field
+    :param timeout: The seconds to wait for callable choices, ``None`` to wait without limit
+    :param max_items: The maximum amount of callable choices, ``None`` for no limit
+    :return: The stored values and display names of the choices, or ``None`` if the callable
+             choices failed or exceeded the budget
+    """
+    raw_choices = getattr(field, "choices", None)
+    if not isinstance(raw_choices, CallableChoiceIterator):
+        return list(raw_choices) if raw_choices else []
+    try:
+        # ensure lazy choices (e.g. callables) are evaluated
+        return list(evaluate_with_budget(raw_choices, timeout, max_items))
+    except Exception as e:
+        # The callable might fail without a request or database during the build
+        logger.warning(
+            "Skipped the choices of %s computed by %s: %s",
+            field,
+            get_callable_path(raw_choices),
+            e,
+        )
+        return None
+
+
+def get_limit_choices_to(
+    field: models.Field[Any, Any] | ForeignObjectRel, timeout: float | None = None
+) -> str | None:
+    """
+    Get the ``limit_choices_to`` of a forward relation as inline literal.
+
+    Callables are evaluated within the given timeout (see
+    :mod:`~sphinxcontrib_django.docstrings.budget`). If a callable fails or doesn't finish in
+    time, a warning is logged and only its import path is rendered.
+
+    :param field: The field
+    :param timeout: The seconds to wait for a callable, ``None`` to wait without limit
+    :return: The rendered filter, or ``None`` if the choices are not limited
+    """
+    if not isinstance(field, models.fields.related.RelatedField):
+        return None
+    limit_choices_to = field.remote_field.limit_choices_to
+    if not limit_choices_to:
+        return None
+    if not callable(limit_choices_to):
+        return f"``{limit_choices_to!r}``"
+    try:
+        return f"``{call_with_timeout(field.get_limit_choices_to, timeout)!r}``"
+    except Exception as e:
+        # The callable might fail without a request or database during the build
+        logger.warning(
+            "Skipped limit_choices_to of %s computed by %s: %s",
+            field,
+            get_callable_path(limit_choices_to),
+            e,
+        )
+        return f"computed by ``{get_callable_path(limit_choices_to)}``"
+
+
+def get_callable_path(obj: object) -> str:
+    """
+    Get the import path of a callable, e.g. of the function which computes callable choices.
+
+    :param obj: The callable or the :class:`~django.utils.choices.CallableChoiceIterator`
+    :return: The import path, or the representation if the path is unknown
+    """
+    func = getattr(obj, "func", obj)
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    return f"{module}.{qualname}" if module and qualname else repr(func)
 
 
 def format_choice(key: object, value: object) -> str:
@@ -0,0 +1,97 @@
+"""
+This module evaluates dynamic field metadata, e.g. callable choices and ``limit_choices_to``,
+within a time and item budget.
+
+These callables might query the database or remote services. So they are evaluated in a worker
+thread which is abandoned if it doesn't finish in time, and a single pathological field can't
+stall the build. The budgets are configured in ``conf.py``::
+
+    # Seconds to wait for callable choices and limit_choices_to, default: 5
+    django_choices_timeout = 5
+    # Maximum amount of dynamic choices to evaluate, default: None (all)
+    django_choices_max_items = 1000
+"""
+
+from __future__ import annotations
+
+import threading
+from itertools import islice
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar("T")
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised if the evaluation of dynamic field metadata exceeds its budget.
+    """
+
+
+class _Worker(threading.Thread, Generic[T]):
+    """
+    Daemon thread which stores the result or the exception of a function.
+    """
+
+    def __init__(self, func: Callable[[], T]) -> None:
+        super().__init__(name=f"sphinxcontrib-django: {func!r}", daemon=True)
+        self.func = func
+        self.result: T | None = None
+        self.exception: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            self.result = self.func()
+        # Catch everything, since the exception is raised again in the waiting thread
+        except BaseException as e:
+            self.exception = e
+
+
+def call_with_timeout(func: Callable[[], T], timeout: float | None) -> T:
+    """
+    Call the given function in a worker thread and wait for its result.
+
+    If the function doesn't return in time, the worker thread is abandoned. Since it is a daemon
+    thread, it doesn't block the exit of the interpreter.
+
+    :param func: The function to call
+    :param timeout: The timeout in seconds, or ``None`` to wait without limit
+    :return: The return value of the function
+    :raises BudgetExceeded: If the function didn't return in time
+    """
+    if timeout is None:
+        return func()
+    worker = _Worker(func)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise BudgetExceeded(f"not finished after {timeout:g} seconds")
+    if worker.exception is not None:
+        raise worker.exception
+    return worker.result  # type: ignore[return-value]
+
+
+def evaluate_with_budget(
+    iterable: Iterable[T], timeout: float | None, max_items: int | None
+) -> list[T]:
+    """
+    Evaluate a lazy iterable, e.g. callable choices, within the given budget.
+
+    :param iterable: The lazy iterable
+    :param timeout: The timeout in seconds, or ``None`` to wait without limit
+    :param max_items: The maximum amount of items, or ``None`` to evaluate all items
+    :return: The items
+    :raises BudgetExceeded: If the iterable didn't finish in time or has too many items
+    """
+    if max_items is None:
+        items = call_with_timeout(lambda: list(iterable), timeout)
+    else:
+        # Only evaluate one item more than the budget to detect the excess
+        items = call_with_timeout(
+            lambda: list(islice(iterable, max_items + 1)), timeout
+        )
+        if len(items) > max_items:
+            raise BudgetExceeded(f"more than {max_items} items")
+    return items
@@ -10,7 +10,12 @@ from django import forms
 from django.db import models
 from sphinx.pycode import ModuleAnalyzer
 
+from .admin import add_admin_configuration, improve_model_admin_docstring
 from .field_utils import get_field_type, get_field_verbose_name
+from .form_utils import get_form_lines, get_formset_lines
+from .overflow import get_overflow_link
+from .search import exclude_fields_from_search, exclude_from_search, is_excluded
+from .signals import add_signal_receivers
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -25,7 +30,7 @@ def improve_class_docstring(
     app: sphinx.application.Sphinx, cls: type, lines: list[str]
 ) -> None:
     """
-    Improve the documentation of a class if it's a Django model or form
+    Improve the documentation of a class if it's a Django model, form, formset or model admin
 
     :param app: The Sphinx application object
     :param cls: The instance of the class to document
@@ -33,8 +38,17 @@ def improve_class_docstring(
     """
     if issubclass(cls, models.Model):
         improve_model_docstring(app, cls, lines)
-    elif issubclass(cls, forms.BaseForm):
-        improve_form_docstring(cls, lines)
+    elif issubclass(cls, (forms.BaseForm, forms.BaseFormSet)):
+        start = len(lines)
+        if issubclass(cls, forms.BaseForm):
+            improve_form_docstring(cls, lines)
+        else:
+            improve_formset_docstring(cls, lines)
+        if is_excluded(app, "fields"):
+            lines[start:] = exclude_from_search(lines[start:])
+    else:
+        # Only registered model admins are in the index, so other classes are left unchanged
+        improve_model_admin_docstring(app, cls, lines)
 
 
 def improve_model_docstring(
@@ -89,30 +103,54 @@ def improve_model_docstring(
         if field not in related_fields + reverse_related_fields
     ]
 
-    # Analyze model to get inline field docstrings
-    analyzer = ModuleAnalyzer.for_module(model.__module__)
-    analyzer.analyze()
-    field_docs = {
-        field_name: field_docstring
-        for (_, field_name), field_docstring in analyzer.attr_docs.items()
-    }
+    # Get inline field docstrings
+    field_docs = get_field_docs(model)
+
+    if use_fields_table(app, all_fields):
+        # Add all fields as one compact table
+        shown_reverse_related_fields, more = truncate_reverse_relationships(
+            app, model, reverse_related_fields
+        )
+        table = get_model_fields_table(
+            [*non_related_fields, *related_fields, *shown_reverse_related_fields],
+            field_docs,
+        )
+        if lines and lines[-1]:
+            lines.append("")
+        lines.extend(
+            exclude_from_search(table) if is_excluded(app, "fields") else table
+        )
+        if more:
+            lines.append("")
+            lines.append(more)
+    else:
+        if is_excluded(app, "fields"):
+            exclude_fields_from_search(app, model)
 
-    # Add the normal fields to the docstring
-    add_model_parameters(non_related_fields, lines, field_docs)
+        # Add the normal fields to the docstring
+        add_model_parameters(non_related_fields, lines, field_docs)
 
-    # Add the related fields
-    if related_fields:
-        lines.append("")
-        lines.append("Relationship fields:")
-        lines.append("")
-        add_model_parameters(related_fields, lines, field_docs)
+        # Add the related fields
+        if related_fields:
+            lines.append("")
+            lines.append("Relationship fields:")
+            lines.append("")
+            add_model_parameters(related_fields, lines, field_docs)
 
-    # Add the reverse related fields
-    if reverse_related_fields:
-        lines.append("")
-        lines.append("Reverse relationships:")
-        lines.append("")
-        add_model_parameters(reverse_related_fields, lines, field_docs)
+        # Add the reverse related fields
+        if reverse_related_fields:
+            lines.append("")
+            lines.append("Reverse relationships:")
+            lines.append("")
+            add_reverse_relationships(
+                app, model, reverse_related_fields, lines, field_docs
+            )
+
+    # Add the admin configuration
+    add_admin_configuration(app, model, lines)
+
+    # Add the signal receivers
+    add_signal_receivers(app, model, lines)
 
     # Add the inheritance diagram
     if (
@@ -122,9 +160,72 @@ def improve_model_docstring(
     ):
         lines.append("")
         lines.append(f".. inheritance-diagram:: {model.__module__}.{model.__name__}")
+        # Cap the depth of the diagram
+        depth = app.config.django_inheritance_diagram_depth
+        top_classes = get_top_classes(model, depth) if depth is not None else []
+        if top_classes:
+            lines.append(f"   :top-classes: {', '.join(top_classes)}")
         lines.append("")
 
 
+def get_top_classes(cls: type, depth: int) -> list[str]:
+    """
+    Get the base classes at which the inheritance diagram of the given class is cut off.
+
+    :param cls: The class of the diagram
+    :param depth: The maximum amount of inheritance levels above the class
+    :return: The sorted dotted paths of the base classes at the given depth which have further
+             base classes
+    """
+    seen = {cls}
+    level = [cls]
+    for _ in range(depth):
+        level = [
+            base
+            for base in dict.fromkeys(
+                base for current in level for base in get_diagram_bases(current)
+            )
+            if base not in seen
+        ]
+        seen.update(level)
+    return sorted(
+        f"{base.__module__}.{base.__qualname__}"
+        for base in level
+        if get_diagram_bases(base)
+    )
+
+
+def get_diagram_bases(cls: type) -> list[type]:
+    """
+    Get the direct base classes which are shown in inheritance diagrams.
+
+    Builtins and private classes are not shown (see :mod:`sphinx.ext.inheritance_diagram`).
+
+    :param cls: The class
+    :return: The base classes
+    """
+    return [
+        base
+        for base in cls.__bases__
+        if base.__module__ != "builtins" and not base.__name__.startswith("_")
+    ]
+
+
+def get_field_docs(model: type[django.db.models.Model]) -> dict[str, list[str]]:
+    """
+    Analyze the module of a model to get the inline docstrings of its fields.
+
+    :param model: The class of the model
+    :return: The docstring lines by field name
+    """
+    analyzer = ModuleAnalyzer.for_module(model.__module__)
+    analyzer.analyze()
+    return {
+        field_name: field_docstring
+        for (_, field_name), field_docstring in analyzer.attr_docs.items()
+    }
+
+
 def add_db_table_name(
     app: sphinx.application.Sphinx,
     model: type[django.db.models.Model],
@@ -173,18 +274,144 @@ def add_model_parameters(
         lines.append(f":type {field.name}: {get_field_type(field, include_role=False)}")
 
 
+def add_reverse_relationships(
+    app: sphinx.application.Sphinx,
+    model: type[django.db.models.Model],
+    fields: Sequence[ForeignObjectRel],
+    lines: list[str],
+    field_docs: dict[str, list[str]],
+) -> None:
+    """
+    Add the given reverse relationships as model parameters, truncated to the configured
+    ``django_reverse_relations_to_show``
+
+    :param app: The Sphinx application object
+    :param model: The class of the model to document
+    :param fields: The list of reverse related fields
+    :param lines: The list of current docstring lines
+    :param field_docs: The attribute docstrings of the model
+    """
+    fields, more = truncate_reverse_relationships(app, model, fields)
+    add_model_parameters(fields, lines, field_docs)
+    if more:
+        lines.append("")
+        lines.append(more)
+
+
+def truncate_reverse_relationships(
+    app: sphinx.application.Sphinx,
+    model: type[django.db.models.Model],
+    fields: Sequence[ForeignObjectRel],
+) -> tuple[Sequence[ForeignObjectRel], str | None]:
+    """
+    Truncate the given reverse relationships to the configured
+    ``django_reverse_relations_to_show``
+
+    :param app: The Sphinx application object
+    :param model: The class of the model to document
+    :param fields: The list of reverse related fields
+    :return: The reverse relationships to show and a line which describes the truncated ones
+    """
+    limit = app.config.django_reverse_relations_to_show
+    # If only one element would be truncated, just list it as well
+    if limit is None or len(fields) <= limit + 1:
+        return fields, None
+    more = f"And {len(fields) - limit} more reverse relationships"
+    uri = get_overflow_link(
+        app,
+        f"reverse/{model._meta.label_lower}",
+        f"Reverse relationships of {model._meta.label}",
+        f"{model.__module__}.{model.__qualname__}",
+        [
+            (
+                field.name,
+                f"Reverse {type(field.remote_field).__name__} from"
+                f" {field.related_model._meta.label}",
+                f"{field.related_model.__module__}.{field.related_model.__qualname__}",
+            )
+            for field in fields
+        ],
+    )
+    return fields[:limit], f"{more} (`show all <{uri}>`__)" if uri else more
+
+
+def use_fields_table(
+    app: sphinx.application.Sphinx,
+    fields: Sequence[django.db.models.Field[Any, Any] | ForeignObjectRel],
+) -> bool:
+    """
+    Check whether the fields of a model should be rendered as table (see
+    ``django_model_fields_renderer`` and ``django_model_fields_table_threshold``).
+
+    :param app: The Sphinx application object
+    :param fields: The fields of the model
+    """
+    threshold = app.config.django_model_fields_table_threshold
+    return app.config.django_model_fields_renderer == "table" or (
+        threshold is not None and len(fields) > threshold
+    )
+
+
+def get_model_fields_table(
+    fields: Sequence[django.db.models.Field[Any, Any] | ForeignObjectRel],
+    field_docs: dict[str, list[str]],
+) -> list[str]:
+    """
+    Get a compact table of the given fields with their names, types and descriptions.
+
+    In contrast to :func:`add_model_parameters`, this creates only a few nodes per field, which
+    keeps the doctrees and the output of models with a lot of fields small.
+
+    :param fields: The list of fields
+    :param field_docs: The attribute docstrings of the model
+    :return: The lines of the table
+    """
+    lines = [
+        ".. list-table::",
+        "   :header-rows: 1",
+        "",
+        "   * - Field",
+        "     - Type",
+        "     - Description",
+    ]
+    for field in fields:
+        lines.append(f"   * - ``{field.name}``")
+        lines.append(f"     - {get_field_type(field)}")
+        lines.append(f"     - {get_field_verbose_name(field)}")
+        if field_docs.get(field.name):
+            lines.append("")
+            lines.extend(
+                f"       {line}" if line else "" for line in field_docs[field.name]
+            )
+    return lines
+
+
 def improve_form_docstring(form: type[django.forms.BaseForm], lines: list[str]) -> None:
     """
     Improve the documentation of a Django :class:`~django.forms.Form` class.
-    This highlights the available fields in the form.
+    This highlights the available fields in the form with their widgets, and the model fields
+    of :class:`~django.forms.ModelForm` classes.
 
     :param form: The class of the form to document
     :param lines: The list of existing docstring lines
     """
-    lines.append("**Form fields:**")
-    lines.append("")
-    # ``base_fields`` is set by the form metaclass, so it's invisible on ``type[BaseForm]``
-    for name, field in form.base_fields.items():  # type: ignore[attr-defined]
-        field_type = f"{field.__class__.__module__}.{field.__class__.__name__}"
-        label = field.label or name.replace("_", " ").title()
-        lines.append(f"* ``{name}``: {label} (:class:`~{field_type}`)")
+    lines.extend(get_form_lines(form))
+
+
+def improve_formset_docstring(
+    formset: type[django.forms.BaseFormSet[Any]], lines: list[str]
+) -> None:
+    """
+    Improve the documentation of a Django formset class, e.g. an inline formset.
+    This adds the options of the formset and the fields of its form, if the formset was created
+    by a factory.
+
+    :param formset: The class of the formset to document
+    :param lines: The list of existing docstring lines
+    """
+    formset_lines = get_formset_lines(formset)
+    if not formset_lines:
+        return
+    if lines and lines[-1]:
+        lines.append("")
+    lines.extend(formset_lines)
@@ -28,3 +28,11 @@ EXCLUDE_MEMBERS = {
 #: How many choices should be shown for model fields by default,
 #: used as default for ``django_choices_to_show`` option
 CHOICES_LIMIT = 10
+
+#: How many seconds callable choices and ``limit_choices_to`` may take to evaluate,
+#: used as default for ``django_choices_timeout`` option
+CHOICES_TIMEOUT = 5.0
+
+#: How many dynamic choices are evaluated at most, ``None`` to evaluate all,
+#: used as default for ``django_choices_max_items`` option
+CHOICES_MAX_ITEMS = None
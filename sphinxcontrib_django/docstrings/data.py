@@ -3,8 +3,6 @@ from __future__ import annotations
 import io
 import sys
 
-from pprintpp import pprint as pp
-
 
 def improve_data_docstring(data: object, lines: list[str]) -> None:
     """
@@ -14,6 +12,8 @@ def improve_data_docstring(data: object, lines: list[str]) -> None:
     :param lines: The lines of docstring lines
     """
     if isinstance(data, (list, tuple, dict, set)):
+        from pprintpp import pprint as pp
+
         # Redirect stdout to StringIO to catch print
         old_stdout = sys.stdout
         new_stdout = io.StringIO()
@@ -13,6 +13,8 @@ from django.contrib import contenttypes
 from django.db import models
 from django.utils.encoding import force_str
 
+from .translation import cache_per_language
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -56,6 +58,7 @@ def get_field_type(
     return f"~{type(field).__module__}.{type(field).__name__}"
 
 
+@cache_per_language
 def get_field_verbose_name(
     field: django.db.models.Field[Any, Any] | ForeignObjectRel | GenericForeignKey,
 ) -> str:
@@ -66,6 +69,9 @@ def get_field_verbose_name(
     In case the field is a related field, the ``related_name`` is used to link to the remote model.
     For reverse related fields, the originating field is linked.
 
+    The result is cached per language (see
+    :func:`~sphinxcontrib_django.docstrings.translation.cache_per_language`).
+
     :param field: The field
     """
     help_text = ""
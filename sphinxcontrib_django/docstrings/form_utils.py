@@ -0,0 +1,140 @@
+"""
+This module collects the metadata of forms and formsets, which is used by the
+:mod:`~sphinxcontrib_django.docstrings.classes` module.
+
+The metadata of each form class is collected once and its rendering is cached per language (see
+:func:`~sphinxcontrib_django.docstrings.translation.cache_per_language`), so forms which are
+documented several times, e.g. as ``form`` of multiple formsets, are only introspected once.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from django import forms
+from django.utils.encoding import force_str
+
+from .translation import cache_per_language
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class FormFieldMetadata(NamedTuple):
+    """
+    The metadata of a form field.
+    """
+
+    #: The name of the field
+    name: str
+    #: The label of the field
+    label: str
+    #: The dotted path of the field class
+    field_type: str
+    #: The dotted path of the widget class
+    widget: str
+    #: Whether the field is required
+    required: bool
+    #: The dotted path of the model field of a model form, if any
+    model_field: str | None
+
+
+def get_class_path(cls: type[Any]) -> str:
+    """
+    Get the dotted path of a class.
+
+    :param cls: The class
+    :return: The dotted path
+    """
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def get_form_fields(form: type[forms.BaseForm]) -> list[FormFieldMetadata]:
+    """
+    Get the metadata of the fields of a form.
+
+    For model forms, the fields are mapped to the fields of their model.
+
+    :param form: The class of the form
+    :return: The metadata of the form fields
+    """
+    model = getattr(getattr(form, "_meta", None), "model", None)
+    if model is None:
+        model_fields = set()
+    else:
+        model_path = get_class_path(model)
+        model_fields = {field.name for field in model._meta.get_fields()}
+    return [
+        FormFieldMetadata(
+            name=name,
+            label=force_str(field.label or name.replace("_", " ").title()),
+            field_type=get_class_path(type(field)),
+            widget=get_class_path(type(field.widget)),
+            required=field.required,
+            model_field=f"{model_path}.{name}" if name in model_fields else None,
+        )
+        # ``base_fields`` is set by the form metaclass, so it's invisible on ``type[BaseForm]``
+        for name, field in form.base_fields.items()  # type: ignore[attr-defined]
+    ]
+
+
+@cache_per_language
+def get_form_lines(form: type[forms.BaseForm]) -> tuple[str, ...]:
+    """
+    Get the documentation of the fields of a form as bullet list.
+
+    :param form: The class of the form
+    :return: The docstring lines
+    """
+    lines = ["**Form fields:**", ""]
+    for field in get_form_fields(form):
+        line = (
+            f"* ``{field.name}``: {field.label} (:class:`~{field.field_type}`,"
+            f" widget :class:`~{field.widget}`{', required' if field.required else ''})"
+        )
+        if field.model_field:
+            line += f", from :attr:`~{field.model_field}`"
+        lines.append(line)
+    return tuple(lines)
+
+
+@cache_per_language
+def get_formset_lines(formset: type[forms.BaseFormSet[Any]]) -> tuple[str, ...]:
+    """
+    Get the documentation of a formset, followed by the fields of its form.
+
+    :param formset: The class of the formset, e.g. created by
+                    :func:`~django.forms.formset_factory` or
+                    :func:`~django.forms.inlineformset_factory`
+    :return: The docstring lines, or no lines if the formset wasn't created by a factory
+    """
+    # The options are set by the formset factories, so they are missing on custom base classes
+    if not hasattr(formset, "form"):
+        return ()
+    options: Any = formset
+    model = getattr(formset, "model", None)
+    fk = getattr(formset, "fk", None)
+    if model is not None and fk is not None:
+        model_path = get_class_path(model)
+        lines = [
+            f"Inline formset of :class:`~{model_path}` related to"
+            f" :class:`~{get_class_path(fk.remote_field.model)}` via"
+            f" :attr:`~{model_path}.{fk.name}`"
+        ]
+    elif model is not None:
+        lines = [f"Model formset of :class:`~{get_class_path(model)}`"]
+    else:
+        lines = [f"Formset of :class:`~{get_class_path(options.form)}`"]
+    lines.extend(
+        [
+            "",
+            f"* Extra forms: {options.extra}",
+            f"* Minimum forms: {options.min_num}",
+            f"* Maximum forms: {options.max_num}",
+            f"* Can delete: {'yes' if options.can_delete else 'no'}",
+            f"* Can order: {'yes' if options.can_order else 'no'}",
+            "",
+        ]
+    )
+    lines.extend(get_form_lines(options.form))
+    return tuple(lines)
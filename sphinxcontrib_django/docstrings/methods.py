@@ -4,14 +4,126 @@ This module contains all functions which are used to improve the documentation o
 
 from __future__ import annotations
 
-import re
+import sys
+from functools import cache, partialmethod
+from inspect import getattr_static
+from typing import TYPE_CHECKING, NamedTuple
 
-RE_GET_FOO_DISPLAY = re.compile(r"\.get_(?P<field>[a-zA-Z0-9_]+)_display$")
-RE_GET_NEXT_BY = re.compile(r"\.get_next_by_(?P<field>[a-zA-Z0-9_]+)$")
-RE_GET_PREVIOUS_BY = re.compile(r"\.get_previous_by_(?P<field>[a-zA-Z0-9_]+)$")
+from django.db import models
 
+from .attributes import get_choice_lines
 
-def improve_method_docstring(name: str, lines: list[str]) -> None:
+if TYPE_CHECKING:
+    from typing import Any
+
+    import sphinx.application
+    from sphinx.ext.autodoc import Options
+
+#: The descriptions of the contributed methods by their generic names
+DESCRIPTIONS = {
+    "get_FOO_display": "Shows the label of {field}.",
+    "get_next_by_FOO": "Finds next instance based on {field}.",
+    "get_previous_by_FOO": "Finds previous instance based on {field}.",
+}
+
+#: The public signatures of the contributed methods, without the bound field arguments
+SIGNATURES = {
+    "get_FOO_display": "()",
+    "get_next_by_FOO": "(**kwargs)",
+    "get_previous_by_FOO": "(**kwargs)",
+}
+
+
+class ContributedMethod(NamedTuple):
+    """
+    A method which Django contributes to a model class for one of its fields.
+    """
+
+    #: The generic name of the method in the documentation of Django, e.g. ``get_FOO_display``
+    generic_name: str
+    #: The field of the method
+    field: models.Field[Any, Any]
+
+
+def get_model_class(path: str) -> type | None:
+    """
+    Get an already imported class by its dotted path.
+
+    The path doesn't need to match the ``__module__`` of the class, e.g. if a ``models`` package
+    re-exports the models of its submodules.
+
+    :param path: The dotted path of the class
+    :return: The class, or ``None`` if it's not imported
+    """
+    parts = path.split(".")
+    for index in range(len(parts) - 1, 0, -1):
+        module = sys.modules.get(".".join(parts[:index]))
+        if module is None:
+            continue
+        obj: object = module
+        for part in parts[index:]:
+            obj = getattr(obj, part, None)
+        return obj if isinstance(obj, type) else None
+    return None
+
+
+@cache
+def get_contributed_method(model: type, name: str) -> ContributedMethod | None:
+    """
+    Get the field of a method which Django contributed to a model class:
+
+    * :meth:`~django.db.models.Model.get_FOO_display` for fields with choices
+    * :meth:`~django.db.models.Model.get_next_by_FOO` and
+      :meth:`~django.db.models.Model.get_previous_by_FOO` for date fields without nulls
+
+    Django contributes these methods as :class:`~functools.partialmethod` objects which are bound
+    to their fields, also to abstract models. The result is cached per class and name.
+
+    :param model: The class which contains the method
+    :param name: The name of the method
+    :return: The contributed method, or ``None`` if the method is user-defined
+    """
+    method = getattr_static(model, name, None)
+    # Django doesn't overwrite methods which are defined on the model itself
+    if not isinstance(method, partialmethod):
+        return None
+    field = method.keywords.get("field")
+    if not isinstance(field, models.Field):
+        return None
+    for generic_name in DESCRIPTIONS:
+        if generic_name.replace("FOO", field.name) == name:
+            return ContributedMethod(generic_name, field)
+    return None
+
+
+def get_documented_method(name: str) -> ContributedMethod | None:
+    """
+    Get the contributed method which is documented under the given dotted path.
+
+    :param name: The full dotted path of the method
+    :return: The contributed method, or ``None`` if the method is user-defined
+    """
+    class_path, _, method_name = name.rpartition(".")
+    model = get_model_class(class_path)
+    if model is None or not issubclass(model, models.Model):
+        return None
+    return get_contributed_method(model, method_name)
+
+
+def reset_contributed_methods(app: sphinx.application.Sphinx) -> None:
+    """
+    Forget the contributed methods of a previous setup of the app registry.
+
+    Called on the ``django-configured`` event.
+
+    :param app: The Sphinx application object
+    """
+    get_contributed_method.cache_clear()
+
+
+def improve_method_docstring(
+    app: sphinx.application.Sphinx, name: str, lines: list[str]
+) -> None:
     """
     Improve the documentation of methods automatically contributed to models by Django:
 
@@ -19,33 +131,56 @@ def improve_method_docstring(name: str, lines: list[str]) -> None:
     * :meth:`~django.db.models.Model.get_next_by_FOO`
     * :meth:`~django.db.models.Model.get_previous_by_FOO`
 
+    The fields of the methods are resolved from the documented class (see
+    :func:`get_contributed_method`), so user-defined methods with the same names are not
+    affected.
+
+    :param app: The Sphinx application object
     :param name: The full dotted path to the object.
     :param lines: The lines of docstring lines
     """
-    if not lines:
-        # Not doing obj.__module__ lookups to avoid performance issues.
-        if name.endswith("_display"):
-            match = RE_GET_FOO_DISPLAY.search(name)
-            if match is not None:
-                # Django get_..._display method
-                lines.append(
-                    f"Shows the label of the :attr:`{match.group('field')}`. See"
-                    " :meth:`~django.db.models.Model.get_FOO_display` for more"
-                    " information."
-                )
-        elif ".get_next_by_" in name:
-            match = RE_GET_NEXT_BY.search(name)
-            if match is not None:
-                lines.append(
-                    f"Finds next instance based on :attr:`{match.group('field')}`. See"
-                    " :meth:`~django.db.models.Model.get_next_by_FOO` for more"
-                    " information."
-                )
-        elif ".get_previous_by_" in name:
-            match = RE_GET_PREVIOUS_BY.search(name)
-            if match is not None:
-                lines.append(
-                    f"Finds previous instance based on :attr:`{match.group('field')}`."
-                    " See :meth:`~django.db.models.Model.get_previous_by_FOO` for more"
-                    " information."
-                )
+    if lines:
+        return
+    method = get_documented_method(name)
+    if method is None:
+        return
+    field = f":attr:`~{name.rsplit('.', 1)[0]}.{method.field.name}`"
+    lines.append(
+        f"{DESCRIPTIONS[method.generic_name].format(field=field)} See"
+        f" :meth:`~django.db.models.Model.{method.generic_name}` for more information."
+    )
+    if method.generic_name == "get_FOO_display":
+        choice_lines = get_choice_lines(app, method.field)
+        if choice_lines:
+            lines.append("")
+            lines.extend(choice_lines)
+
+
+def improve_method_signature(
+    app: sphinx.application.Sphinx,
+    what: str,
+    name: str,
+    obj: object,
+    options: Options,
+    signature: str | None,
+    return_annotation: str | None,
+) -> tuple[str | None, str | None] | None:
+    """
+    Hide the field arguments which Django binds to its contributed methods
+    (see :event:`autodoc-process-signature`).
+
+    :param app: The Sphinx application object
+    :param what: The type of the object
+    :param name: The fully qualified name of the object
+    :param obj: The documented object
+    :param options: The options given to the directive
+    :param signature: The signature of the object
+    :param return_annotation: The return annotation of the object
+    :return: The public signature for contributed methods, ``None`` otherwise
+    """
+    if what != "method":
+        return None
+    method = get_documented_method(name)
+    if method is None:
+        return None
+    return SIGNATURES[method.generic_name], return_annotation
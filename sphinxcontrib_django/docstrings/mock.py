@@ -0,0 +1,158 @@
+"""
+This module contains a Django-aware variant of autodoc's mock imports, which is used to stub
+heavy optional modules while Django is set up (see ``django_mock_imports``).
+
+In contrast to :confval:`autodoc_mock_imports`, the mocked modules keep the model fields intact:
+
+* Attributes of mocked modules which look like model fields (e.g. ``PointField``) are subclasses
+  of :class:`~django.db.models.Field`, so the models which use them keep their fields.
+* Attributes of mocked ``models`` modules (e.g. ``django.contrib.gis.db.models``) which also
+  exist in :mod:`django.db.models` resolve to the real objects, e.g.
+  :class:`~django.db.models.Model` or :class:`~django.db.models.CharField`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import sys
+from typing import TYPE_CHECKING
+
+from django.db import models
+from sphinx.ext.autodoc.mock import (  # type: ignore[attr-defined]
+    MockFinder,
+    MockLoader,
+    _MockModule,
+)
+from sphinx.util import logging
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
+    from typing import Any
+
+    import sphinx
+
+logger = logging.getLogger(__name__)
+
+#: The keyword arguments which are accepted by :class:`~django.db.models.Field`
+FIELD_ARGUMENTS = frozenset(inspect.signature(models.Field.__init__).parameters) - {
+    "self"
+}
+
+
+class MockField(models.Field):  # type: ignore[type-arg]
+    """
+    Base class of mocked model fields.
+
+    It only passes the arguments known by :class:`~django.db.models.Field` to its constructor.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        # The first positional argument is the verbose name for most fields
+        if args and isinstance(args[0], str):
+            kwargs.setdefault("verbose_name", args[0])
+        super().__init__(
+            **{key: value for key, value in kwargs.items() if key in FIELD_ARGUMENTS}
+        )
+
+
+class DjangoMockModule(_MockModule):
+    """
+    A mocked module which resolves model fields and objects of :mod:`django.db.models`.
+    """
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name == "models":
+            # Import the submodule instead of mocking an object, e.g. for
+            # ``from django.contrib.gis.db import models``
+            return importlib.import_module(f"{self.__name__}.{name}")
+        if self.__name__.rsplit(".", 1)[-1] == "models" and hasattr(models, name):
+            return getattr(models, name)
+        if name[:1].isupper() and name.endswith("Field"):
+            field_class = type(
+                name, (MockField,), {"__module__": self.__name__, "__qualname__": name}
+            )
+            # Cache the field class, so all models use the same class
+            setattr(self, name, field_class)
+            return field_class
+        return super().__getattr__(name)
+
+
+class DjangoMockLoader(MockLoader):
+    """
+    A loader which creates :class:`DjangoMockModule` instances.
+    """
+
+    def create_module(self, spec: ModuleSpec) -> DjangoMockModule:
+        self.finder.mocked_modules.append(spec.name)
+        return DjangoMockModule(spec.name)
+
+
+class DjangoMockFinder(MockFinder):
+    """
+    A finder which mocks the given modules with :class:`DjangoMockModule` instances.
+    """
+
+    def __init__(self, modnames: Sequence[str]) -> None:
+        super().__init__(modnames)
+        self.loader = DjangoMockLoader(self)
+
+    def get_used_modnames(self) -> list[str]:
+        """
+        Get the configured module names which have actually been imported.
+
+        :return: The used module names
+        """
+        return [
+            modname
+            for modname in self.modnames
+            if any(
+                mocked == modname or mocked.startswith(f"{modname}.")
+                for mocked in self.mocked_modules
+            )
+        ]
+
+
+def install_mock_imports(modnames: Sequence[str]) -> DjangoMockFinder:
+    """
+    Mock the given modules until :func:`remove_mock_imports` is called.
+
+    :param modnames: The names of the modules to mock
+    :return: The finder of the mocked modules
+    """
+    finder = DjangoMockFinder(modnames)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def report_mock_imports(finder: DjangoMockFinder) -> None:
+    """
+    Report which of the configured modules have been mocked.
+
+    :param finder: The finder of the mocked modules
+    """
+    used = finder.get_used_modnames()
+    logger.info("Mocked imports during Django setup: %s", ", ".join(used) or "none")
+    unused = [modname for modname in finder.modnames if modname not in used]
+    if unused:
+        logger.warning("Unused entries of 'django_mock_imports': %s", ", ".join(unused))
+
+
+def remove_mock_imports(
+    finder: DjangoMockFinder,
+    app: sphinx.application.Sphinx | None = None,
+    exception: Exception | None = None,
+) -> None:
+    """
+    Stop mocking the modules of the given finder and remove the mocked modules.
+
+    Called on the :event:`build-finished` event.
+
+    :param finder: The finder of the mocked modules
+    :param app: The Sphinx application object
+    :param exception: The exception which stopped the build, if any
+    """
+    if finder in sys.meta_path:
+        sys.meta_path.remove(finder)
+    finder.invalidate_caches()
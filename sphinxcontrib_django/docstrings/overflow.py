@@ -0,0 +1,178 @@
+"""
+This module moves oversized lists of the generated documentation onto companion pages
+(see ``django_overflow_pages``).
+
+If a list is truncated because it exceeds ``django_choices_to_show`` or
+``django_reverse_relations_to_show``, the full list is written to a separate HTML page which is
+generated once per field or model, and the truncated list links to it. This keeps the size of
+the documentation pages and the search index bounded, independent of the size of the models.
+
+The companion pages are only generated for HTML builders, other builders keep the plain
+truncated lists.
+"""
+
+from __future__ import annotations
+
+from html import escape
+from typing import TYPE_CHECKING
+
+from sphinx.builders.html import StandaloneHTMLBuilder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import Any
+
+    import sphinx
+    from sphinx.environment import BuildEnvironment
+
+#: The directory of the companion pages in the HTML output
+OVERFLOW_PAGES_DIR = "_django"
+
+#: An entry of a companion page: The name, the description and the dotted path of the
+#: documented object to link the description to (if any)
+OverflowItem = tuple[str, str, str | None]
+
+
+def get_overflow_link(
+    app: sphinx.application.Sphinx,
+    pagename: str,
+    title: str,
+    target: str,
+    items: Sequence[OverflowItem],
+) -> str | None:
+    """
+    Register a companion page with the full list of the given items.
+
+    :param app: The Sphinx application object
+    :param pagename: The name of the page, relative to :data:`OVERFLOW_PAGES_DIR`
+    :param title: The title of the page
+    :param target: The dotted path of the documented object the page belongs to
+    :param items: The entries of the page
+    :return: The relative URI of the page, or ``None`` if companion pages are disabled or not
+             supported by the current builder
+    """
+    if not app.config.django_overflow_pages or not is_html_builder(app.builder):
+        return None
+    pagename = f"{OVERFLOW_PAGES_DIR}/{pagename}"
+    get_overflow_pages(app.env)[pagename] = {
+        "docname": app.env.docname,
+        "title": title,
+        "target": target,
+        "items": list(items),
+    }
+    return app.builder.get_relative_uri(app.env.docname, pagename)
+
+
+def is_html_builder(builder: sphinx.builders.Builder) -> bool:
+    """
+    Check whether the given builder writes standalone HTML pages.
+
+    :param builder: The Sphinx builder
+    """
+    return isinstance(builder, StandaloneHTMLBuilder) and not builder.embedded
+
+
+def get_overflow_pages(env: BuildEnvironment) -> dict[str, dict[str, Any]]:
+    """
+    Get the registered companion pages of the build environment.
+
+    :param env: The Sphinx build environment
+    :return: The data of the companion pages by page name
+    """
+    if not hasattr(env, "django_overflow_pages"):
+        env.django_overflow_pages = {}  # type: ignore[attr-defined]
+    return env.django_overflow_pages  # type: ignore[attr-defined, no-any-return]
+
+
+def collect_overflow_pages(
+    app: sphinx.application.Sphinx,
+) -> Iterator[tuple[str, dict[str, Any], str]]:
+    """
+    Generate the companion pages.
+
+    Called on the :event:`html-collect-pages` event.
+
+    :param app: The Sphinx application object
+    :return: The page names, contexts and templates of the pages
+    """
+    if not is_html_builder(app.builder):
+        return
+    for pagename, page in sorted(get_overflow_pages(app.env).items()):
+        body = [f"<h1>{escape(page['title'])}</h1>", "<ul>"]
+        for name, description, target in page["items"]:
+            item = f"<code>{escape(name)}</code>"
+            if description:
+                uri = get_object_uri(app, pagename, target) if target else None
+                description = escape(description)
+                if uri:
+                    description = f'<a href="{escape(uri)}">{description}</a>'
+                item += f" — {description}"
+            body.append(f"<li>{item}</li>")
+        body.append("</ul>")
+        uri = get_object_uri(
+            app, pagename, page["target"]
+        ) or app.builder.get_relative_uri(pagename, page["docname"])
+        body.append(
+            f'<p><a href="{escape(uri)}">Back to {escape(page["target"])}</a></p>'
+        )
+        yield pagename, {"title": page["title"], "body": "\n".join(body)}, "page.html"
+
+
+def get_object_uri(
+    app: sphinx.application.Sphinx, pagename: str, target: str
+) -> str | None:
+    """
+    Get the URI of a documented Python object relative to the given page.
+
+    :param app: The Sphinx application object
+    :param pagename: The name of the page which contains the link
+    :param target: The dotted path of the object
+    :return: The relative URI, or ``None`` if the object is not documented
+    """
+    entry = app.env.get_domain("py").objects.get(target)  # type: ignore[attr-defined]
+    if entry is None:
+        return None
+    uri = app.builder.get_relative_uri(pagename, entry.docname)
+    return f"{uri}#{entry.node_id}"
+
+
+def purge_overflow_pages(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """
+    Remove the companion pages of the given document.
+
+    Called on the :event:`env-purge-doc` event.
+
+    :param app: The Sphinx application object
+    :param env: The Sphinx build environment
+    :param docname: The name of the document
+    """
+    pages = get_overflow_pages(env)
+    for pagename in [
+        name for name, page in pages.items() if page["docname"] == docname
+    ]:
+        del pages[pagename]
+
+
+def merge_overflow_pages(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """
+    Merge the companion pages of a parallel read process.
+
+    Called on the :event:`env-merge-info` event.
+
+    :param app: The Sphinx application object
+    :param env: The Sphinx build environment of the main process
+    :param docnames: The names of the documents which were read by the other process
+    :param other: The Sphinx build environment of the other process
+    """
+    get_overflow_pages(env).update(
+        (pagename, page)
+        for pagename, page in get_overflow_pages(other).items()
+        if page["docname"] in docnames
+    )
@@ -5,26 +5,16 @@ This module contains patches for Django to improve its interaction with Sphinx.
 from __future__ import annotations
 
 import contextlib
+import sys
+from typing import TYPE_CHECKING
 
 from django import apps, forms, http, test
 from django.db import models
 
-try:
-    from django.contrib.postgres import fields as postgres_fields
-    from django.contrib.postgres import forms as postgres_forms
+if TYPE_CHECKING:
+    from types import ModuleType
 
-    POSTGRES = True
-except ModuleNotFoundError:
-    # In case postgres is not used, pass
-    POSTGRES = False
-
-try:
-    from mptt.managers import TreeManager
-
-    MPTT = True
-except ModuleNotFoundError:
-    # In case postgres is not used, pass
-    MPTT = False
+    import sphinx.application
 
 
 def patch_django_for_autodoc() -> None:
@@ -43,10 +33,6 @@ def patch_django_for_autodoc() -> None:
     # Stop Django from executing DB queries
     models.QuerySet.__repr__ = lambda self: self.__class__.__name__  # type: ignore[method-assign]
 
-    # Fix django-mptt TreeManager in Django >=3.1
-    if MPTT:
-        TreeManager.get_queryset = models.Manager.get_queryset
-
     # Module paths which are documented in the parent module
     DJANGO_MODULE_PATHS = {
         "django.db.models": [
@@ -65,16 +51,6 @@ def patch_django_for_autodoc() -> None:
     if hasattr(models.fields, "json"):
         DJANGO_MODULE_PATHS["django.db.models"].append(models.fields.json)
 
-    # Support postgres fields if used
-    if POSTGRES:
-        DJANGO_MODULE_PATHS["django.contrib.postgres.forms"] = [postgres_forms.array]
-        DJANGO_MODULE_PATHS["django.contrib.postgres.fields"] = [postgres_fields.array]
-        if hasattr(postgres_fields, "jsonb"):
-            DJANGO_MODULE_PATHS["django.contrib.postgres.forms"].append(
-                postgres_fields.jsonb
-            )
-        postgres_forms.array.__all__ = ("SimpleArrayField", "SplitArrayField")  # type: ignore[attr-defined]
-
     # Add __all__ where missing
     models.base.__all__ = ("Model", "FilteredRelation")  # type: ignore[attr-defined]
     models.fields.files.__all__ = ("FileField", "ImageField")  # type: ignore[attr-defined]
@@ -84,12 +60,74 @@ def patch_django_for_autodoc() -> None:
         "ManyToManyField",
     )
 
-    # Set the __module__ to the parent module to make sure intersphinx mappings work as expected
-    for parent_module_str, django_modules in DJANGO_MODULE_PATHS.items():
+    set_parent_modules(DJANGO_MODULE_PATHS)
+
+    # Fix module path of model manager
+    models.manager.Manager.__module__ = "django.db.models"
+
+
+def set_parent_modules(module_paths: dict[str, list[ModuleType]]) -> None:
+    """
+    Set the ``__module__`` of the public classes of the given modules to their parent module to
+    make sure intersphinx mappings work as expected.
+
+    :param module_paths: The modules by the path of their parent module
+    """
+    for parent_module_str, django_modules in module_paths.items():
         for django_module in django_modules:
             for module_class in map(django_module.__dict__.get, django_module.__all__):
                 with contextlib.suppress(AttributeError):
                     module_class.__module__ = parent_module_str
 
-    # Fix module path of model manager
-    models.manager.Manager.__module__ = "django.db.models"
+
+def is_integration_used(app_name: str, module_name: str) -> bool:
+    """
+    Check whether an optional integration is used, i.e. whether its app is installed or its
+    module was imported while setting up Django, e.g. by the models.
+
+    :param app_name: The name of the app of the integration
+    :param module_name: The module which contains the fields of the integration
+    """
+    return apps.apps.is_installed(app_name) or module_name in sys.modules
+
+
+def patch_integrations(app: sphinx.application.Sphinx | None = None) -> None:
+    """
+    Fix the appearance of the classes of optional integrations in autodoc.
+
+    The integrations are only imported if they are used by the Django project (see
+    :func:`is_integration_used`), so they don't slow down the import of this extension.
+
+    Called on the ``django-configured`` event.
+
+    :param app: The Sphinx application object
+    """
+    # Support postgres fields if used
+    if is_integration_used("django.contrib.postgres", "django.contrib.postgres.fields"):
+        from django.contrib.postgres import fields as postgres_fields
+        from django.contrib.postgres import forms as postgres_forms
+
+        postgres_module_paths = {
+            "django.contrib.postgres.forms": [postgres_forms.array],
+            "django.contrib.postgres.fields": [postgres_fields.array],
+        }
+        if hasattr(postgres_fields, "jsonb"):
+            postgres_module_paths["django.contrib.postgres.forms"].append(
+                postgres_fields.jsonb
+            )
+        postgres_forms.array.__all__ = ("SimpleArrayField", "SplitArrayField")  # type: ignore[attr-defined]
+        set_parent_modules(postgres_module_paths)
+
+    # Fix django-mptt TreeManager in Django >=3.1
+    if is_integration_used("mptt", "mptt.managers"):
+        from mptt.managers import TreeManager
+
+        TreeManager.get_queryset = models.Manager.get_queryset
+
+    # Document the descriptors of phone number fields like other fields
+    if is_integration_used("phonenumber_field", "phonenumber_field.modelfields"):
+        from phonenumber_field.modelfields import PhoneNumberDescriptor
+
+        from .attributes import register_field_descriptor
+
+        register_field_descriptor(PhoneNumberDescriptor)
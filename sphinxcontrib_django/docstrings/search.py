@@ -0,0 +1,124 @@
+"""
+This module excludes generated content from the HTML search index
+(see ``django_search_exclude``).
+
+The generated content is marked with the ``no-search`` class, which is skipped by the search
+indexer of Sphinx >= 7.3. The following sections can be excluded:
+
+* ``fields``: The parameter lists of models and the field lists of forms
+* ``choices``: The choices of model fields
+* ``managers``: The description of model managers
+* ``attributes``: The type and verbose name of model fields
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from docutils import nodes
+from sphinx import addnodes
+from sphinx.errors import ConfigError
+
+if TYPE_CHECKING:
+    import sphinx
+    from django.db.models import Model
+
+#: The sections which can be excluded from the search index
+SEARCH_SECTIONS = ("fields", "choices", "managers", "attributes")
+
+#: The class which is skipped by the search indexer
+NO_SEARCH_CLASS = "no-search"
+
+
+def check_search_exclude(
+    app: sphinx.application.Sphinx, config: sphinx.config.Config
+) -> None:
+    """
+    Check the sections of the configuration ``django_search_exclude``.
+
+    Called on the :event:`config-inited` event.
+
+    :param app: The Sphinx application object
+    :param config: The Sphinx configuration
+
+    :raises ~sphinx.errors.ConfigError: If an unknown section is given
+    """
+    unknown = set(config.django_search_exclude) - set(SEARCH_SECTIONS)
+    if unknown:
+        raise ConfigError(
+            f"Unknown sections {', '.join(map(repr, sorted(unknown)))} in the configuration"
+            f" 'django_search_exclude' in your conf.py, choose from"
+            f" {', '.join(map(repr, SEARCH_SECTIONS))}."
+        )
+
+
+def is_excluded(app: sphinx.application.Sphinx, section: str) -> bool:
+    """
+    Check whether the given section is excluded from the search index.
+
+    :param app: The Sphinx application object
+    :param section: The section (see :data:`SEARCH_SECTIONS`)
+    """
+    return section in app.config.django_search_exclude
+
+
+def exclude_from_search(lines: list[str]) -> list[str]:
+    """
+    Wrap the given docstring lines in a container which is skipped by the search indexer.
+
+    :param lines: The docstring lines
+    :return: The wrapped lines
+    """
+    if not any(lines):
+        return lines
+    return [
+        f".. container:: {NO_SEARCH_CLASS}",
+        "",
+        *(f"   {line}" if line else "" for line in lines),
+    ]
+
+
+def exclude_fields_from_search(
+    app: sphinx.application.Sphinx, model: type[Model]
+) -> None:
+    """
+    Remember to exclude the parameter list of the given model from the search index.
+
+    The parameter list can't be wrapped in a container, because the Python domain only merges
+    field lists which are direct children of the object description. Instead, the field lists
+    are marked in :func:`mark_excluded_fields`.
+
+    :param app: The Sphinx application object
+    :param model: The documented model
+    """
+    excluded = app.env.temp_data.setdefault("django_search_exclude", set())
+    excluded.add(f"{model.__module__}.{model.__qualname__}")  # type: ignore[union-attr]
+
+
+def mark_excluded_fields(
+    app: sphinx.application.Sphinx, doctree: nodes.document
+) -> None:
+    """
+    Mark the field lists of the models which were passed to :func:`exclude_fields_from_search`.
+
+    Called on the :event:`doctree-read` event.
+
+    :param app: The Sphinx application object
+    :param doctree: The doctree of the current document
+    """
+    excluded = app.env.temp_data.get("django_search_exclude")
+    if not excluded:
+        return
+    for desc in doctree.findall(addnodes.desc):
+        signatures = [
+            f"{signature.get('module')}.{signature.get('fullname')}"
+            for signature in desc.children
+            if isinstance(signature, addnodes.desc_signature)
+        ]
+        if excluded.isdisjoint(signatures):
+            continue
+        for content in desc.children:
+            if isinstance(content, addnodes.desc_content):
+                for field_list in content.children:
+                    if isinstance(field_list, nodes.field_list):
+                        field_list["classes"].append(NO_SEARCH_CLASS)
@@ -0,0 +1,154 @@
+"""
+This module adds the receivers of model signals to the documentation of models
+(see ``django_show_signals``).
+
+The receivers are collected once after Django has been set up from the receiver lists of the
+signal objects:
+
+* The model signals of :mod:`django.db.models.signals`, e.g.
+  :data:`~django.db.models.signals.post_save`
+* The custom signals which are defined in the ``signals`` modules of the installed apps
+
+The index maps each sender model to its receivers, so documenting a model only needs a lookup.
+Receivers which are connected without a sender run for all models and are indexed under
+``None``.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import weakref
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.apps import apps
+from django.db.models import signals
+from django.dispatch import Signal
+
+if TYPE_CHECKING:
+    import sphinx.application
+    from django.db.models import Model
+
+#: The names of the built-in model signals in :mod:`django.db.models.signals`
+MODEL_SIGNALS = (
+    "pre_init",
+    "post_init",
+    "pre_save",
+    "post_save",
+    "pre_delete",
+    "post_delete",
+    "m2m_changed",
+)
+
+
+class SignalReceiver(NamedTuple):
+    """
+    A receiver which is connected to a signal.
+    """
+
+    #: The dotted path of the signal
+    signal: str
+    #: The dotted path of the receiver
+    receiver: str
+    #: The Python role to link the receiver, ``func`` or ``meth``
+    role: str
+
+
+def get_signals() -> dict[str, Signal]:
+    """
+    Get the signals whose receivers are indexed.
+
+    Custom signals are only found in the ``signals`` modules of installed apps which were
+    already imported, since receivers can't be connected to them otherwise.
+
+    :return: The signals by dotted path
+    """
+    found = {
+        f"{signals.__name__}.{name}": getattr(signals, name) for name in MODEL_SIGNALS
+    }
+    for app_config in apps.get_app_configs():
+        module = sys.modules.get(f"{app_config.name}.signals")
+        if module is None:
+            continue
+        for name, value in sorted(vars(module).items()):
+            # Skip the model signals which are imported into the module
+            if isinstance(value, Signal) and value not in found.values():
+                found[f"{module.__name__}.{name}"] = value
+    return found
+
+
+def get_receiver(receiver: object) -> tuple[str, str] | None:
+    """
+    Get the dotted path and role of a connected receiver.
+
+    :param receiver: The receiver, or a weak reference to it
+    :return: The dotted path and role, or ``None`` if the receiver was garbage collected
+    """
+    if isinstance(receiver, weakref.ReferenceType):
+        receiver = receiver()
+    if receiver is None:
+        return None
+    role = "meth" if inspect.ismethod(receiver) else "func"
+    func = getattr(receiver, "__func__", receiver)
+    path = f"{func.__module__}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+    return path, role
+
+
+@cache
+def get_signal_receivers() -> dict[type[Model] | None, list[SignalReceiver]]:
+    """
+    Get the index of the receivers of all signals by their sender model.
+
+    The senders are matched by their ids, which Django stores in the lookup keys of the
+    receivers.
+
+    :return: The receivers by sender model, and the receivers of any sender under ``None``
+    """
+    senders: dict[int, type[Model] | None] = {id(None): None}
+    senders.update((id(model), model) for model in apps.get_models())
+    index: dict[type[Model] | None, list[SignalReceiver]] = {}
+    for path, signal in get_signals().items():
+        for (_, sender_id), receiver_ref, *_ in signal.receivers:
+            if sender_id not in senders:
+                continue
+            receiver = get_receiver(receiver_ref)
+            if receiver is not None:
+                index.setdefault(senders[sender_id], []).append(
+                    SignalReceiver(path, *receiver)
+                )
+    return index
+
+
+def reset_signal_receivers(app: sphinx.application.Sphinx) -> None:
+    """
+    Forget the receivers of a previous setup of the app registry.
+
+    Called on the ``django-configured`` event.
+
+    :param app: The Sphinx application object
+    """
+    get_signal_receivers.cache_clear()
+
+
+def add_signal_receivers(
+    app: sphinx.application.Sphinx, model: type[Model], lines: list[str]
+) -> None:
+    """
+    Add the receivers of the signals which are sent by a model, if ``django_show_signals`` is
+    enabled.
+
+    :param app: The Sphinx application object
+    :param model: The class of the model to document
+    :param lines: The docstring lines
+    """
+    if not app.config.django_show_signals:
+        return
+    receivers = get_signal_receivers().get(model)
+    if not receivers:
+        return
+    lines.extend(["", "Signal receivers:", ""])
+    lines.extend(
+        f"* :data:`~{receiver.signal}`: :{receiver.role}:`~{receiver.receiver}`"
+        for receiver in receivers
+    )
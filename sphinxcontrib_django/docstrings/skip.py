@@ -0,0 +1,223 @@
+"""
+This module decides which members are skipped by autodoc (see :event:`autodoc-skip-member`).
+
+The rules are configured in ``conf.py`` and are checked in order before the default rules, which
+exclude :data:`~sphinxcontrib_django.docstrings.config.EXCLUDE_MEMBERS` and include
+:data:`~sphinxcontrib_django.docstrings.config.INCLUDE_MEMBERS`. The first matching rule wins::
+
+    django_autodoc_skip_rules = [
+        # Skip the Meta class only on forms
+        {"name": "Meta", "owner": "django.forms.BaseForm"},
+        # Document the Meta class of models
+        {"name": "Meta", "owner": "django.db.models.Model", "skip": False},
+        # Skip all private helpers of views
+        {"regex": r"_[a-z_]+", "owner": "django.views.View"},
+    ]
+
+Each rule has either a ``name`` glob pattern or a ``regex`` which has to match the full member
+name. The optional ``owner`` restricts the rule to members of subclasses of the given class, and
+``skip`` (default: ``True``) decides whether the member is skipped or included.
+
+All patterns are compiled once into a single expression which rejects most members without
+checking the individual rules, and the result of each member name and owner is memoized.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from fnmatch import translate
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.utils.module_loading import import_string
+from sphinx.errors import ConfigError
+
+from .config import EXCLUDE_MEMBERS, INCLUDE_MEMBERS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    import sphinx.application
+    import sphinx.config
+
+#: The keys of a skip rule
+SKIP_RULE_KEYS = {"name", "regex", "owner", "skip"}
+
+#: The default rules which are checked after ``django_autodoc_skip_rules``
+DEFAULT_SKIP_RULES: list[dict[str, Any]] = [
+    *({"name": name} for name in sorted(EXCLUDE_MEMBERS)),
+    *({"name": name, "skip": False} for name in sorted(INCLUDE_MEMBERS)),
+]
+
+#: Characters which make a glob pattern match more than a literal name
+GLOB_CHARACTERS = re.compile(r"[*?\[]")
+
+
+class SkipRule(NamedTuple):
+    """
+    A compiled skip rule.
+    """
+
+    #: The expression which matches the full member name
+    pattern: str
+    #: The dotted path of the base class of the owner, if any
+    owner: str | None
+    #: Whether matching members are skipped or included
+    skip: bool
+
+
+class SkipRuleMatcher:
+    """
+    The compiled skip rules.
+    """
+
+    def __init__(self, rules: Sequence[dict[str, Any]]) -> None:
+        """
+        Compile the given rules.
+
+        :param rules: The rules in order of precedence
+        :raises ~sphinx.errors.ConfigError: If a rule is invalid
+        """
+        self.rules = [
+            compile_skip_rule(index, rule) for index, rule in enumerate(rules)
+        ]
+        #: The indices of the rules with literal names by name
+        self.literals: dict[str, list[int]] = {}
+        #: The indices of the rules with patterns
+        self.patterns: list[int] = []
+        for index, rule in enumerate(rules):
+            if "name" in rule and not GLOB_CHARACTERS.search(rule["name"]):
+                self.literals.setdefault(rule["name"], []).append(index)
+            else:
+                self.patterns.append(index)
+        #: One expression of all patterns to reject most members at once
+        self.prefilter = (
+            re.compile(
+                "|".join(f"(?:{self.rules[index].pattern})" for index in self.patterns)
+            )
+            if self.patterns
+            else None
+        )
+        self.expressions = {
+            index: re.compile(self.rules[index].pattern) for index in self.patterns
+        }
+        self.owners: dict[str, type | None] = {}
+        self.results: dict[tuple[str, type | None], bool | None] = {}
+
+    def match(self, name: str, owner: type | None = None) -> bool | None:
+        """
+        Check whether a member is skipped.
+
+        :param name: The name of the member
+        :param owner: The class of the member, ``None`` for module members
+        :return: Whether the member is skipped, or ``None`` if no rule matches
+        """
+        key = (name, owner)
+        if key not in self.results:
+            self.results[key] = self.evaluate(name, owner)
+        return self.results[key]
+
+    def evaluate(self, name: str, owner: type | None) -> bool | None:
+        """
+        Check the rules which match the given name in order.
+
+        :param name: The name of the member
+        :param owner: The class of the member, ``None`` for module members
+        :return: Whether the member is skipped, or ``None`` if no rule matches
+        """
+        candidates = list(self.literals.get(name, ()))
+        if self.prefilter is not None and self.prefilter.match(name):
+            candidates.extend(
+                index for index in self.patterns if self.expressions[index].match(name)
+            )
+        for index in sorted(candidates):
+            rule = self.rules[index]
+            if rule.owner is None or self.is_owner(owner, rule.owner):
+                return rule.skip
+        return None
+
+    def is_owner(self, owner: type | None, path: str) -> bool:
+        """
+        Check whether a class is a subclass of the given owner of a rule.
+
+        Owners which can't be imported, e.g. classes of uninstalled packages, never match.
+
+        :param owner: The class of the member
+        :param path: The dotted path of the owner of the rule
+        :return: Whether the class is a subclass of the owner
+        """
+        if owner is None:
+            return False
+        if path not in self.owners:
+            try:
+                self.owners[path] = import_string(path)
+            except ImportError:
+                self.owners[path] = None
+        base = self.owners[path]
+        return base is not None and issubclass(owner, base)
+
+
+def compile_skip_rule(index: int, rule: dict[str, Any]) -> SkipRule:
+    """
+    Compile a rule of ``django_autodoc_skip_rules``.
+
+    :param index: The index of the rule, used in error messages
+    :param rule: The rule
+    :return: The compiled rule
+    :raises ~sphinx.errors.ConfigError: If the rule is invalid
+    """
+    prefix = f"Invalid rule {index} in the configuration 'django_autodoc_skip_rules'"
+    if not isinstance(rule, dict):
+        raise ConfigError(f"{prefix}: expected a dict, got {rule!r}.")
+    unknown = set(rule) - SKIP_RULE_KEYS
+    if unknown:
+        raise ConfigError(
+            f"{prefix}: unknown keys {', '.join(map(repr, sorted(unknown)))}, choose from"
+            f" {', '.join(map(repr, sorted(SKIP_RULE_KEYS)))}."
+        )
+    if ("name" in rule) == ("regex" in rule):
+        raise ConfigError(f"{prefix}: expected either 'name' or 'regex'.")
+    if "name" in rule:
+        # The translated glob pattern matches until the end of the name
+        pattern = translate(rule["name"])
+    else:
+        pattern = f"(?:{rule['regex']})\\Z"
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ConfigError(f"{prefix}: {e}") from e
+    return SkipRule(pattern, rule.get("owner"), bool(rule.get("skip", True)))
+
+
+def get_owner(app: sphinx.application.Sphinx, what: str) -> type | None:
+    """
+    Get the class whose members are currently documented by autodoc.
+
+    :param app: The Sphinx application object
+    :param what: The type of the documented object, ``class`` or ``module``
+    :return: The class, or ``None`` for module members
+    """
+    if what not in ("class", "exception"):
+        return None
+    module = sys.modules.get(app.env.temp_data.get("autodoc:module") or "")
+    owner = getattr(module, app.env.temp_data.get("autodoc:class") or "", None)
+    return owner if isinstance(owner, type) else None
+
+
+def setup_skip_rules(
+    app: sphinx.application.Sphinx, config: sphinx.config.Config
+) -> None:
+    """
+    Compile ``django_autodoc_skip_rules`` followed by the :data:`DEFAULT_SKIP_RULES`.
+
+    Called on the :event:`config-inited` event.
+
+    :param app: The Sphinx application object
+    :param config: The Sphinx configuration
+
+    :raises ~sphinx.errors.ConfigError: If a rule is invalid
+    """
+    app.django_skip_rules = SkipRuleMatcher(  # type: ignore[attr-defined]
+        [*config.django_autodoc_skip_rules, *DEFAULT_SKIP_RULES]
+    )
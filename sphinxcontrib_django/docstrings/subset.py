@@ -0,0 +1,214 @@
+"""
+This module contains functions to load only a subset of the installed apps
+(see ``django_apps_to_document``).
+
+Only the requested apps and the apps their models depend on (via relationships, abstract base
+classes or model imports) are loaded into the app registry.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.apps import AppConfig, apps
+from django.conf import settings
+from django.db import models
+from sphinx.errors import ConfigError
+from sphinx.util import logging
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def get_app_configs(app_labels: Iterable[str]) -> list[AppConfig]:
+    """
+    Get the configs of the given installed apps.
+
+    :param app_labels: The labels or names of the apps
+    :return: The configs of the apps
+
+    :raises ~sphinx.errors.ConfigError: If one of the given apps is not installed
+    """
+    app_configs = []
+    for app_label in app_labels:
+        app_config = next(
+            (
+                app_config
+                for app_config in apps.get_app_configs()
+                if app_label in (app_config.label, app_config.name)
+            ),
+            None,
+        )
+        if app_config is None:
+            raise ConfigError(f"The app {app_label!r} is not installed.")
+        app_configs.append(app_config)
+    return app_configs
+
+
+def get_apps_to_document_closure(
+    installed_apps: Iterable[str | AppConfig], apps_to_document: Iterable[str]
+) -> list[str | AppConfig]:
+    """
+    Get the entries of :setting:`INSTALLED_APPS` which are required to document the given apps.
+
+    The models of the apps are imported repeatedly until the loaded apps don't reference models
+    of other apps which are not loaded.
+
+    :param installed_apps: All entries of :setting:`INSTALLED_APPS`
+    :param apps_to_document: The labels or names of the apps which should be documented
+    :return: The required entries of :setting:`INSTALLED_APPS` in their original order
+
+    :raises ~sphinx.errors.ConfigError: If one of the given apps or one of their dependencies is
+                                        not installed
+    """
+    entries = {}
+    app_configs = {}
+    for entry in installed_apps:
+        app_config = entry if isinstance(entry, AppConfig) else AppConfig.create(entry)
+        entries[app_config.label] = entry
+        app_configs[app_config.label] = app_config
+
+    selected = set()
+    for app_label in apps_to_document:
+        label = next(
+            (
+                label
+                for label, app_config in app_configs.items()
+                if app_label in (entries[label], label, app_config.name)
+            ),
+            None,
+        )
+        if label is None:
+            raise ConfigError(
+                f"The app {app_label!r} in the configuration 'django_apps_to_document' in"
+                " your conf.py is not contained in INSTALLED_APPS."
+            )
+        selected.add(label)
+
+    try:
+        while True:
+            required = load_models(app_configs, selected)
+            missing = sorted(required.keys() - app_configs.keys())
+            if missing:
+                dependencies = ", ".join(
+                    f"{label} (required by {', '.join(sorted(required[label]))})"
+                    for label in missing
+                )
+                raise ConfigError(
+                    "The apps in the configuration 'django_apps_to_document' in your conf.py"
+                    f" depend on apps which are not contained in INSTALLED_APPS: {dependencies}"
+                )
+            if required.keys() <= selected:
+                break
+            selected |= required.keys()
+    finally:
+        reset_app_registry()
+    return [entry for label, entry in entries.items() if label in selected]
+
+
+def load_models(
+    app_configs: dict[str, AppConfig], selected: set[str]
+) -> dict[str, set[str]]:
+    """
+    Import the models of the selected apps without running their ``ready()`` methods.
+
+    All installed apps are registered, so the models of the selected apps can import the models
+    of other apps. The dependencies are then taken from the loaded models:
+
+    * The apps of models which were imported by the models of the selected apps
+    * The apps of lazily referenced models which are not loaded yet
+    * The apps of abstract base classes and of directly referenced models
+
+    :param app_configs: The configs of all installed apps by label
+    :param selected: The labels of the apps whose models are imported
+    :return: The labels of all apps the models of the selected apps depend on, with the labels
+             or models which require them
+
+    :raises ~sphinx.errors.ConfigError: If the models of an app can't be imported
+    """
+    reset_app_registry()
+    for label, app_config in app_configs.items():
+        apps.app_configs[label] = app_config
+        app_config.apps = apps
+    apps.apps_ready = True
+
+    imported = {
+        id(model)
+        for app_models in apps.all_models.values()
+        for model in app_models.values()
+    }
+    for label in sorted(selected):
+        try:
+            app_configs[label].import_models()
+        except RuntimeError as e:
+            raise ConfigError(
+                f"The models of the app {label!r} can't be imported: {e}"
+            ) from e
+
+    required: dict[str, set[str]] = {}
+    for app_label, app_models in apps.all_models.items():
+        for model in app_models.values():
+            # Models which were imported by the models of the selected apps
+            if id(model) not in imported:
+                required.setdefault(app_label, set()).add(model._meta.label)
+    # Lazy references to models which are not loaded yet
+    for app_label, model_name in apps._pending_operations:
+        required.setdefault(app_label, set()).add(f"{app_label}.{model_name}")
+    for label in selected:
+        for model in app_configs[label].models.values():
+            # Abstract base classes of the loaded models
+            dependencies = {
+                base._meta.app_label
+                for base in model.__mro__
+                if issubclass(base, models.Model) and base is not models.Model
+            }
+            # Models which are referenced directly (the models of already imported modules are
+            # not registered again, so they don't cause lazy references)
+            dependencies.update(
+                field.remote_field.model._meta.app_label
+                for field in (
+                    model._meta.local_fields
+                    + model._meta.local_many_to_many
+                    + model._meta.private_fields
+                )
+                if field.remote_field and not isinstance(field.remote_field.model, str)
+            )
+            for app_label in filter(None, dependencies):
+                required.setdefault(app_label, set()).add(model._meta.label)
+    return required
+
+
+def reset_app_registry() -> None:
+    """
+    Reset the app registry, so it can be populated again with a different set of apps.
+
+    Imported models are kept in the registry of all models and are reused when their app is
+    loaded again.
+    """
+    # Expire the caches of the loaded models before they are unregistered
+    apps.clear_cache()
+    apps.app_configs = {}
+    apps.apps_ready = apps.models_ready = apps.loading = apps.ready = False
+
+
+def restrict_installed_apps(apps_to_document: Iterable[str]) -> None:
+    """
+    Restrict the setting :setting:`INSTALLED_APPS` to the apps which are required to document
+    the given apps.
+
+    This has to be called before :func:`django.setup`.
+
+    :param apps_to_document: The labels or names of the apps which should be documented
+    """
+    installed_apps = get_apps_to_document_closure(
+        settings.INSTALLED_APPS, apps_to_document
+    )
+    logger.info(
+        "Loading %d of %d installed apps: %s",
+        len(installed_apps),
+        len(settings.INSTALLED_APPS),
+        ", ".join(map(str, installed_apps)),
+    )
+    settings.INSTALLED_APPS = installed_apps
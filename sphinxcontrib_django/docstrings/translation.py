@@ -0,0 +1,86 @@
+"""
+This module renders the lazily translated strings of Django, e.g. verbose names, help texts and
+choice labels, in the language of the documentation (see ``django_translate``).
+
+The language of the Sphinx build is activated once per build instead of once per string, and the
+rendered strings are cached per language (see :func:`cache_per_language`).
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+from django.utils import translation
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    import sphinx.application
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+#: The caches of the functions decorated with :func:`cache_per_language`
+CACHES: list[dict[tuple[Any, ...], Any]] = []
+
+
+def cache_per_language(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Cache the results of the given function per active Django language.
+
+    The arguments of the function have to be hashable.
+
+    :param func: The function which renders translated strings
+    :return: The cached function
+    """
+    cache: dict[tuple[Any, ...], R] = {}
+    CACHES.append(cache)
+
+    @wraps(func)
+    def cached_func(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (translation.get_language(), *args, *sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+
+    return cached_func
+
+
+def clear_caches() -> None:
+    """
+    Clear the caches of all functions decorated with :func:`cache_per_language`.
+    """
+    for cache in CACHES:
+        cache.clear()
+
+
+def activate_language(app: sphinx.application.Sphinx) -> None:
+    """
+    Activate the language of the Sphinx build for the translations of Django if
+    ``django_translate`` is enabled.
+
+    Called on the ``django-configured`` event.
+
+    :param app: The Sphinx application object
+    """
+    # The registry might have been set up again, so the cached fields could be outdated
+    clear_caches()
+    if app.config.django_translate and app.config.language:
+        translation.activate(translation.to_language(app.config.language))
+
+
+def deactivate_language(
+    app: sphinx.application.Sphinx, exception: Exception | None
+) -> None:
+    """
+    Deactivate the language which was activated by :func:`activate_language`.
+
+    Called on the :event:`build-finished` event.
+
+    :param app: The Sphinx application object
+    :param exception: The exception of the build, if any
+    """
+    if app.config.django_translate:
+        translation.deactivate()
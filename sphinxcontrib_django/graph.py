@@ -0,0 +1,228 @@
+"""
+This module adds the ``django-model-graph`` directive which renders an entity relationship
+diagram of an app or of the neighbourhood of a model, e.g.::
+
+    .. django-model-graph:: blog
+
+    .. django-model-graph:: blog.Post
+       :hops: 2
+
+The diagram contains the models which can be reached via the given number of relations (default:
+1). For apps, the reached models of other apps are shown as well.
+
+The relations of all models in the app registry are collected once per build. Each directive
+only selects a subgraph and renders it with :mod:`sphinx.ext.graphviz`. Since the generated dot
+code is deterministic and doesn't depend on the current document, identical subgraphs share the
+same output file, which graphviz only renders if it doesn't exist yet.
+
+Since this module loads :mod:`sphinx.ext.graphviz`, it isn't set up by the top-level extension and
+has to be added to ``conf.py`` separately. It requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension::
+
+    extensions = [
+        "sphinxcontrib_django",
+        "sphinxcontrib_django.graph",
+    ]
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from docutils.parsers.rst import directives
+from sphinx.ext.graphviz import graphviz
+from sphinx.util.docutils import SphinxDirective
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    import sphinx
+    from docutils import nodes
+    from sphinx.environment import BuildEnvironment
+    from sphinx.util.typing import ExtensionMetadata
+
+#: The dot attributes of the edges per relation type
+EDGE_STYLES = {
+    "many_to_one": "",
+    "one_to_one": ", arrowtail=tee, dir=both",
+    "many_to_many": ", arrowtail=normal, dir=both",
+    "one_to_many": ", style=dashed",
+}
+
+
+class ModelGraphDirective(SphinxDirective):
+    """
+    Directive to render the relations of the models of an app or the neighbourhood of a model,
+    registered as ``django-model-graph``.
+    """
+
+    required_arguments = 1
+    option_spec = {"hops": directives.nonnegative_int, "alt": directives.unchanged}
+
+    def run(self) -> list[nodes.Node]:
+        """Render the subgraph of the given app or model."""
+        relation_graph = get_relation_graph(self.env)
+        label = self.arguments[0]
+        if label in relation_graph["apps"]:
+            labels = set(relation_graph["apps"][label])
+            # Include the neighbours of the app's models
+            labels |= get_neighbours(
+                relation_graph, labels, self.options.get("hops", 1)
+            )
+        elif label in relation_graph["models"]:
+            labels = get_neighbours(
+                relation_graph, {label}, self.options.get("hops", 1)
+            )
+        else:
+            raise self.error(f"Unknown Django app or model {label!r}")
+
+        # Read the document again if one of the models changes
+        for model_label in sorted(labels):
+            if relation_graph["models"][model_label]["file"]:
+                self.env.note_dependency(relation_graph["models"][model_label]["file"])
+
+        node = graphviz()
+        node["code"] = get_dot_code(relation_graph, label, labels)
+        # Don't add the docname to the options, so the output is shared between documents
+        node["options"] = {}
+        node["alt"] = self.options.get("alt", f"Relations of {label}")
+        return [node]
+
+
+def get_relation_graph(env: BuildEnvironment) -> dict[str, Any]:
+    """
+    Get the relation graph of all models, which is collected once per build.
+
+    :param env: The Sphinx build environment
+    :return: The relation graph
+    """
+    if getattr(env, "django_relation_graph", None) is None:
+        env.django_relation_graph = collect_relation_graph()  # type: ignore[attr-defined]
+    return env.django_relation_graph  # type: ignore[attr-defined, no-any-return]
+
+
+def reset_relation_graph(app: sphinx.application.Sphinx) -> None:
+    """
+    Forget the relation graph of the previous build.
+
+    Called on the :event:`builder-inited` event.
+
+    :param app: The Sphinx application object
+    """
+    app.env.django_relation_graph = None  # type: ignore[attr-defined]
+
+
+def collect_relation_graph() -> dict[str, Any]:
+    """
+    Collect the relations of all models in the app registry.
+
+    :return: The model labels per app label, the source files of the models by label and the
+             sorted list of edges as tuples of source model, field name, target model and
+             relation type
+    """
+    graph: dict[str, Any] = {"apps": {}, "models": {}, "edges": []}
+    for model in apps.get_models():
+        label = model._meta.label
+        graph["apps"].setdefault(model._meta.app_label, []).append(label)
+        graph["models"][label] = {
+            "file": getattr(sys.modules[model.__module__], "__file__", None)
+        }
+        for field in model._meta.get_fields():
+            # Skip reverse relations and parent links (which are auto-created) and generic
+            # foreign keys (which have no related model)
+            if (
+                not field.is_relation
+                or field.auto_created
+                or field.related_model is None
+                or isinstance(field.related_model, str)
+            ):
+                continue
+            relation = next(
+                (
+                    relation
+                    for relation in EDGE_STYLES
+                    if getattr(field, relation, False)
+                ),
+                None,
+            )
+            if relation is None:
+                # Custom relation fields which don't declare their cardinality can't be drawn
+                continue
+            graph["edges"].append(
+                (label, field.name, field.related_model._meta.label, relation)
+            )
+    for labels in graph["apps"].values():
+        labels.sort()
+    graph["edges"].sort()
+    return graph
+
+
+def get_neighbours(graph: dict[str, Any], labels: set[str], hops: int) -> set[str]:
+    """
+    Get the models which can be reached from the given models via the given amount of
+    relations in any direction.
+
+    :param graph: The relation graph
+    :param labels: The labels of the models to start from
+    :param hops: The maximum amount of relations
+    :return: The labels of the given and the reached models
+    """
+    reached = set(labels)
+    current = set(labels)
+    for _ in range(hops):
+        current = {
+            target if source in current else source
+            for source, _, target, _ in graph["edges"]
+            if source in current or target in current
+        } - reached
+        reached |= current
+    return reached
+
+
+def get_dot_code(graph: dict[str, Any], name: str, labels: set[str]) -> str:
+    """
+    Get the deterministic dot code of the subgraph which contains the given models.
+
+    :param graph: The relation graph
+    :param name: The name of the graph
+    :param labels: The labels of the models in the subgraph
+    :return: The dot code
+    """
+    lines = [
+        f'digraph "{name}" {{',
+        "  graph [rankdir=LR];",
+        '  node [shape=box, fontname="sans-serif", fontsize=10];',
+        '  edge [fontname="sans-serif", fontsize=8];',
+    ]
+    for label in sorted(labels):
+        lines.append(f'  "{label}" [label="{label}"];')
+    for source, field_name, target, relation in graph["edges"]:
+        if source in labels and target in labels:
+            lines.append(
+                f'  "{source}" -> "{target}" [label="{field_name}"{EDGE_STYLES[relation]}];'
+            )
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    It registers the :class:`ModelGraphDirective` and loads :mod:`sphinx.ext.graphviz`.
+
+    :param app: The Sphinx application object
+    """
+    app.setup_extension("sphinx.ext.graphviz")
+    app.add_directive("django-model-graph", ModelGraphDirective)
+    app.connect("builder-inited", reset_relation_graph)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,157 @@
+"""
+This module collects metadata about the Django app registry as plain, JSON-serializable data.
+
+The collected data does not reference any Django objects, so it can be transferred between
+processes and stored on the Sphinx build environment. It is also exported as deterministic schema
+snapshot (see :func:`get_snapshot`), which can be compared without Django via
+:mod:`~sphinxcontrib_django.schemadiff`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.db import models
+from django.utils.choices import flatten_choices
+from django.utils.encoding import force_str
+
+from .docstrings.attributes import evaluate_choices
+from .docstrings.config import CHOICES_MAX_ITEMS, CHOICES_TIMEOUT
+from .docstrings.subset import get_app_configs
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    import django
+    from django.apps import AppConfig
+
+
+def get_snapshot(app_labels: Sequence[str] = ()) -> str:
+    """
+    Get the schema snapshot of the app registry as JSON with sorted keys.
+
+    :param app_labels: The labels or names of the apps to include, all apps if empty
+    :return: The snapshot
+
+    :raises ~sphinx.errors.ConfigError: If one of the given apps is not installed
+    """
+    metadata = get_registry_metadata()
+    if app_labels:
+        labels = {app_config.label for app_config in get_app_configs(app_labels)}
+        metadata["apps"] = [app for app in metadata["apps"] if app["label"] in labels]
+    return json.dumps(metadata, indent=2, sort_keys=True) + "\n"
+
+
+def get_registry_metadata() -> dict[str, Any]:
+    """
+    Get the metadata of all installed apps and their models.
+
+    :return: The metadata of the app registry
+    """
+    return {
+        "apps": [
+            get_app_metadata(app_config)
+            for app_config in sorted(
+                apps.get_app_configs(), key=lambda app_config: app_config.label
+            )
+        ]
+    }
+
+
+def get_app_metadata(app_config: AppConfig) -> dict[str, Any]:
+    """
+    Get the metadata of an installed app.
+
+    :param app_config: The config of the app
+    :return: The metadata of the app
+    """
+    return {
+        "label": app_config.label,
+        "name": app_config.name,
+        "verbose_name": force_str(app_config.verbose_name),
+        "models": [
+            get_model_metadata(model)
+            for model in sorted(
+                app_config.get_models(), key=lambda model: model.__name__
+            )
+        ],
+    }
+
+
+def get_model_metadata(model: type[django.db.models.Model]) -> dict[str, Any]:
+    """
+    Get the metadata of a model.
+
+    :param model: The class of the model
+    :return: The metadata of the model
+    """
+    return {
+        "label": model._meta.label,
+        "path": f"{model.__module__}.{model.__qualname__}",
+        "verbose_name": force_str(model._meta.verbose_name),
+        "db_table": model._meta.db_table,
+        "fields": [
+            get_field_metadata(field)
+            for field in model._meta.get_fields()
+            # Reverse relationships are part of the metadata of the related model
+            if not isinstance(field, models.fields.reverse_related.ForeignObjectRel)
+        ],
+    }
+
+
+def get_field_metadata(field: django.db.models.Field[Any, Any]) -> dict[str, Any]:
+    """
+    Get the metadata of a forward model field.
+
+    :param field: The field
+    :return: The metadata of the field
+    """
+    related_model = field.related_model
+    return {
+        "name": field.name,
+        "type": f"{type(field).__module__}.{type(field).__name__}",
+        # Many-to-many fields are stored in a separate table
+        "column": None if field.many_to_many else getattr(field, "column", None),
+        "related_model": (
+            related_model._meta.label
+            if related_model is not None and not isinstance(related_model, str)
+            else related_model
+        ),
+        # Generic foreign keys don't have these attributes
+        "null": getattr(field, "null", False),
+        "blank": getattr(field, "blank", False),
+        "unique": getattr(field, "unique", False),
+        "primary_key": getattr(field, "primary_key", False),
+        "max_length": getattr(field, "max_length", None),
+        "choices": get_choices_metadata(field),
+    }
+
+
+def get_choices_metadata(
+    field: django.db.models.Field[Any, Any],
+) -> list[list[Any]] | None:
+    """
+    Get the flattened choices of a field as pairs of value and label.
+
+    Callable choices are evaluated within the default budget of the docstrings (see
+    :func:`~sphinxcontrib_django.docstrings.attributes.evaluate_choices`).
+
+    :param field: The field
+    :return: The choices, or ``None`` if the field has no choices or they exceeded the budget
+    """
+    if not getattr(field, "choices", None):
+        return None
+    choices = evaluate_choices(field, CHOICES_TIMEOUT, CHOICES_MAX_ITEMS)
+    if choices is None:
+        return None
+    flat_choices: list[tuple[Any, Any]] = list(flatten_choices(choices))
+    return [
+        [
+            value if isinstance(value, (str, int, float, bool)) else force_str(value),
+            force_str(label),
+        ]
+        for value, label in flat_choices
+    ]
@@ -20,6 +20,18 @@ their ``app_label.ModelName`` notation known from :mod:`django.contrib.admindocs
 ``:py:model:`auth.User``` links to the documentation of :class:`django.contrib.auth.models.User`
 if the model class is documented. Full import paths are supported as well.
 
+HTML builds additionally write the inventory ``django_models.inv`` next to ``objects.inv``, which
+maps the labels of the documented models to their documentation. Other projects can add it to
+their ``intersphinx_mapping`` to resolve ``:py:model:`` labels without installing or configuring
+this Django project::
+
+    intersphinx_mapping = {
+        "myproject": (
+            "https://myproject.readthedocs.io/en/latest/",
+            (None, "https://myproject.readthedocs.io/en/latest/django_models.inv"),
+        ),
+    }
+
 This module can also be used separately in ``conf.py``::
 
     extensions = [
@@ -30,11 +42,14 @@ This module can also be used separately in ``conf.py``::
 from __future__ import annotations
 
 import logging
+import re
+import zlib
 from typing import TYPE_CHECKING
 
-from django.apps import apps
+from sphinx.builders.html import StandaloneHTMLBuilder
 from sphinx.domains.python import PyXRefRole
 from sphinx.errors import ExtensionError
+from sphinx.ext.intersphinx import InventoryAdapter
 
 from . import __version__
 
@@ -45,6 +60,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: The file name of the inventory of model labels
+MODEL_INVENTORY_FILENAME = "django_models.inv"
+
 
 class ModelRole(PyXRefRole):
     """
@@ -53,6 +71,9 @@ class ModelRole(PyXRefRole):
     In addition to the full import path accepted by ``:py:class:``, it resolves the
     ``app_label.ModelName`` notation of :mod:`django.contrib.admindocs` via the app registry,
     so the same docstrings work in both the Django admin documentation and Sphinx.
+
+    If Django is not installed or not configured, labels are kept as they are and can be resolved
+    via the ``django_models.inv`` inventory of another project.
     """
 
     def process_link(
@@ -69,18 +90,81 @@ class ModelRole(PyXRefRole):
         title, target = super().process_link(
             env, refnode, has_explicit_title, title, target
         )
-        if target.count(".") == 1:
+        if target.count(".") == 1 and is_django_ready():
+            from django.apps import apps
+
             try:
                 model = apps.get_model(target)
             except LookupError as e:
-                logger.warning(
-                    "Unable to resolve Django model reference %r: %s", target, e
-                )
+                # The model might be documented in another project
+                if target not in InventoryAdapter(env).main_inventory.get(
+                    "py:class", {}
+                ):
+                    logger.warning(
+                        "Unable to resolve Django model reference %r: %s", target, e
+                    )
             else:
                 target = f"{model.__module__}.{model.__qualname__}"
         return title, target
 
 
+def is_django_ready() -> bool:
+    """
+    Check whether Django is installed and its app registry is populated.
+    """
+    try:
+        from django.apps import apps
+    except ImportError:
+        return False
+    return apps.ready
+
+
+def write_model_inventory(
+    app: sphinx.application.Sphinx, exception: Exception | None
+) -> None:
+    """
+    Write the inventory of the documented models by their labels, which uses the format of
+    ``objects.inv``.
+
+    Called on the :event:`build-finished` event.
+
+    :param app: The Sphinx application object
+    :param exception: The exception of the build, if any
+    """
+    if (
+        exception is not None
+        or not isinstance(app.builder, StandaloneHTMLBuilder)
+        or not is_django_ready()
+    ):
+        return
+    from django.apps import apps
+
+    def escape(string: str) -> str:
+        return re.sub(r"\s+", " ", string)
+
+    objects = app.env.get_domain("py").objects  # type: ignore[attr-defined]
+    entries = []
+    for model in apps.get_models():
+        entry = objects.get(f"{model.__module__}.{model.__qualname__}")
+        if entry is None or entry.aliased:
+            continue
+        uri = app.builder.get_target_uri(entry.docname)
+        if entry.node_id:
+            uri += f"#{entry.node_id}"
+        entries.append(f"{model._meta.label} py:class 1 {uri} -\n")
+
+    with (app.outdir / MODEL_INVENTORY_FILENAME).open("wb") as f:
+        f.write(
+            (
+                "# Sphinx inventory version 2\n"
+                f"# Project: {escape(app.config.project)}\n"
+                f"# Version: {escape(app.config.version)}\n"
+                "# The remainder of this file is compressed using zlib.\n"
+            ).encode()
+        )
+        f.write(zlib.compress("".join(sorted(entries)).encode(), 9))
+
+
 def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     """
     Allow this module to be used as Sphinx extension.
@@ -88,7 +172,8 @@ def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
 
     It adds cross-reference types via :meth:`~sphinx.application.Sphinx.add_crossref_type` and
-    the :class:`ModelRole` via :meth:`~sphinx.application.Sphinx.add_role_to_domain`.
+    the :class:`ModelRole` via :meth:`~sphinx.application.Sphinx.add_role_to_domain`, and writes
+    the inventory of model labels after HTML builds (see :func:`write_model_inventory`).
 
     :param app: The Sphinx application object
     """
@@ -98,6 +183,9 @@ def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
     # Add default intersphinx mappings after config is initialized
     app.connect("config-inited", add_default_intersphinx_mappings)
 
+    # Export the labels of the documented models
+    app.connect("build-finished", write_model_inventory)
+
     # Allow intersphinx mappings to custom Django roles
     django_crossref_types = [
         "setting",
@@ -0,0 +1,217 @@
+"""
+This module compares two schema snapshots of the app registry, e.g. of two releases. The
+snapshots are exported via the command line interface::
+
+    python -m sphinxcontrib_django snapshot --settings myproject.settings -o schema/2.0.json
+    python -m sphinxcontrib_django diff schema/1.0.json schema/2.0.json
+
+The changes can also be rendered in the documentation with the ``django-schema-diff``
+directive, e.g. in the release notes::
+
+    .. django-schema-diff:: schema/1.0.json schema/2.0.json
+
+The paths are relative to the current document, or to the source directory if they start with
+``/``. Neither the comparison nor the directive require a configured Django project, since only
+the JSON snapshots are read. So this module can also be used separately in ``conf.py``, without
+the :mod:`~sphinxcontrib_django.docstrings` extension::
+
+    extensions = [
+        "sphinxcontrib_django.schemadiff",
+    ]
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any
+
+    import sphinx
+    from sphinx.util.typing import ExtensionMetadata
+
+#: The attributes of fields which are compared, apart from the choices
+FIELD_ATTRIBUTES = (
+    "type",
+    "column",
+    "related_model",
+    "null",
+    "blank",
+    "unique",
+    "primary_key",
+    "max_length",
+)
+
+
+class SchemaDiffDirective(SphinxDirective):
+    """
+    Directive to render the changes between two schema snapshots, registered as
+    ``django-schema-diff``.
+    """
+
+    required_arguments = 2
+
+    def run(self) -> list[nodes.Node]:
+        """Render the changes as bullet list."""
+        snapshots = []
+        for argument in self.arguments:
+            relative_path, path = self.env.relfn2path(argument)
+            self.env.note_dependency(relative_path)
+            try:
+                snapshots.append(load_snapshot(path))
+            except (OSError, ValueError) as e:
+                raise self.error(
+                    f"Unable to load schema snapshot {argument!r}: {e}"
+                ) from e
+
+        changes = diff_snapshots(*snapshots) or ["No changes"]
+        lines = StringList()
+        source, _ = self.get_source_info()
+        for change in changes:
+            lines.append(f"* {change}", source)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def load_snapshot(path: str | PathLike[str]) -> dict[str, Any]:
+    """
+    Load a schema snapshot.
+
+    :param path: The path of the snapshot file
+    :return: The metadata of the app registry
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)  # type: ignore[no-any-return]
+
+
+def get_models(snapshot: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Get the models of a snapshot by label.
+
+    :param snapshot: The metadata of the app registry
+    :return: The metadata of the models
+    """
+    return {
+        model["label"]: model for app in snapshot["apps"] for model in app["models"]
+    }
+
+
+def diff_snapshots(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """
+    Compare two schema snapshots.
+
+    :param old: The metadata of the old app registry
+    :param new: The metadata of the new app registry
+    :return: The changes in reStructuredText inline markup, sorted by model and field
+    """
+    old_models = get_models(old)
+    new_models = get_models(new)
+    changes = []
+    for label in sorted(old_models.keys() | new_models.keys()):
+        if label not in new_models:
+            changes.append(f"Removed model ``{label}``")
+        elif label not in old_models:
+            changes.append(
+                f"Added model ``{label}`` (table ``{new_models[label]['db_table']}``)"
+            )
+        else:
+            changes.extend(diff_models(label, old_models[label], new_models[label]))
+    return changes
+
+
+def diff_models(label: str, old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """
+    Compare two versions of a model.
+
+    :param label: The label of the model
+    :param old: The old metadata of the model
+    :param new: The new metadata of the model
+    :return: The changes of the model and its fields
+    """
+    changes = []
+    if old["db_table"] != new["db_table"]:
+        changes.append(
+            f"``{label}``: Renamed table ``{old['db_table']}`` to ``{new['db_table']}``"
+        )
+    old_fields = {field["name"]: field for field in old["fields"]}
+    new_fields = {field["name"]: field for field in new["fields"]}
+    for name in sorted(old_fields.keys() | new_fields.keys()):
+        if name not in new_fields:
+            changes.append(f"``{label}.{name}``: Removed field")
+        elif name not in old_fields:
+            changes.append(
+                f"``{label}.{name}``: Added field of type ``{new_fields[name]['type']}``"
+            )
+        else:
+            changes.extend(
+                f"``{label}.{name}``: {change}"
+                for change in diff_fields(old_fields[name], new_fields[name])
+            )
+    return changes
+
+
+def diff_fields(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """
+    Compare two versions of a field.
+
+    :param old: The old metadata of the field
+    :param new: The new metadata of the field
+    :return: The changes of the field
+    """
+    changes = [
+        f"Changed {attribute} from ``{old.get(attribute)!r}`` to ``{new.get(attribute)!r}``"
+        for attribute in FIELD_ATTRIBUTES
+        if old.get(attribute) != new.get(attribute)
+    ]
+    old_choices = dict(map(tuple, old.get("choices") or []))
+    new_choices = dict(map(tuple, new.get("choices") or []))
+    added = [value for value in new_choices if value not in old_choices]
+    removed = [value for value in old_choices if value not in new_choices]
+    relabeled = [
+        value
+        for value in new_choices
+        if value in old_choices and old_choices[value] != new_choices[value]
+    ]
+    if added:
+        changes.append(
+            f"Added choices {', '.join(f'``{value!r}``' for value in added)}"
+        )
+    if removed:
+        changes.append(
+            f"Removed choices {', '.join(f'``{value!r}``' for value in removed)}"
+        )
+    if relabeled:
+        changes.append(
+            f"Changed labels of choices {', '.join(f'``{value!r}``' for value in relabeled)}"
+        )
+    return changes
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`SchemaDiffDirective`.
+
+    :param app: The Sphinx application object
+    """
+    app.add_directive("django-schema-diff", SchemaDiffDirective)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,141 @@
+"""
+This module adds the ``django-signal-receivers`` directive which renders a summary of the
+receivers of model signals, e.g.::
+
+    .. django-signal-receivers::
+
+    .. django-signal-receivers:: blog
+
+The summary contains one row per model and signal with the amount of connected receivers. If an
+app label is given, only the models of this app are included. Receivers which are connected
+without a sender are counted in a separate row, since they run for all models.
+
+The receivers are taken from the index of
+:func:`~sphinxcontrib_django.docstrings.signals.get_signal_receivers`, which is also used to list
+the receivers in the documentation of each model (see ``django_show_signals``).
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.signals",
+    ]
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+from .docstrings.signals import get_signal_receivers
+
+if TYPE_CHECKING:
+    import sphinx
+    from django.db.models import Model
+    from sphinx.util.typing import ExtensionMetadata
+
+    from .docstrings.signals import SignalReceiver
+
+
+class SignalReceiversDirective(SphinxDirective):
+    """
+    Directive to render the amount of signal receivers per model, registered as
+    ``django-signal-receivers``.
+    """
+
+    optional_arguments = 1
+
+    def run(self) -> list[nodes.Node]:
+        """Render the summary as table."""
+        if self.arguments:
+            try:
+                app_config = apps.get_app_config(self.arguments[0])
+            except LookupError as e:
+                raise self.error(f"Unable to summarize signal receivers: {e}") from e
+            models = list(app_config.get_models())
+        else:
+            models = list(apps.get_models())
+
+        source, _ = self.get_source_info()
+        lines = StringList()
+        for line in get_summary_lines(models, get_signal_receivers()):
+            lines.append(line, source)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def get_summary_lines(
+    models: list[type[Model]], receivers: dict[type[Model] | None, list[SignalReceiver]]
+) -> list[str]:
+    """
+    Get the table of the amount of receivers per model and signal.
+
+    :param models: The models to include
+    :param receivers: The index of the receivers by sender model
+    :return: The lines of the table
+    """
+    rows: list[tuple[str, str, int]] = []
+    for model in sorted(models, key=lambda model: model._meta.label):
+        rows.extend(
+            (f":class:`~{model.__module__}.{model.__qualname__}`", signal, count)
+            for signal, count in get_receiver_counts(receivers.get(model, []))
+        )
+    rows.extend(
+        ("Any model", signal, count)
+        for signal, count in get_receiver_counts(receivers.get(None, []))
+    )
+    if not rows:
+        return ["No signal receivers"]
+    lines = [
+        ".. list-table::",
+        "   :header-rows: 1",
+        "",
+        "   * - Model",
+        "     - Signal",
+        "     - Receivers",
+    ]
+    for sender, signal, count in rows:
+        lines.append(f"   * - {sender}")
+        lines.append(f"     - :data:`~{signal}`")
+        lines.append(f"     - {count}")
+    return lines
+
+
+def get_receiver_counts(receivers: list[SignalReceiver]) -> list[tuple[str, int]]:
+    """
+    Count the receivers per signal.
+
+    :param receivers: The receivers of one sender
+    :return: The dotted paths of the signals and their amount of receivers, in order of the
+             signals
+    """
+    return list(Counter(receiver.signal for receiver in receivers).items())
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`SignalReceiversDirective`.
+
+    :param app: The Sphinx application object
+    """
+    app.add_directive("django-signal-receivers", SignalReceiversDirective)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
@@ -0,0 +1,145 @@
+"""
+This module generates reStructuredText stub files for Django apps, similar to
+:doc:`sphinx-apidoc <sphinx:man/sphinx-apidoc>`.
+
+In contrast to sphinx-apidoc, the apps are read from the Django app registry and a stub file is
+only rewritten if its content changed. This keeps the modification times of the other files, so
+the following Sphinx build only re-reads the affected documents.
+
+Run it via the command line, e.g.::
+
+    python -m sphinxcontrib_django stubs --settings myproject.settings --output-dir docs/apps
+
+The granularity of the stub files is one of:
+
+* ``app``: One file per app with the ``autodjango`` directive (default)
+* ``module``: One file per models, forms and views module with the ``automodule`` directive
+* ``model``: One file per model with the ``autoclass`` directive
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.utils.encoding import force_str
+
+from .docstrings.subset import get_app_configs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from django.apps import AppConfig
+
+#: The supported granularities of stub files
+GRANULARITIES = ("app", "module", "model")
+
+#: The submodules of apps which are documented in addition to the models modules
+APP_MODULES = ("forms", "views")
+
+
+def generate_stubs(
+    output_dir: Path,
+    app_labels: Sequence[str] = (),
+    granularity: str = "app",
+    tocfile: str | None = "apps",
+) -> dict[Path, bool]:
+    """
+    Write the stub files of the given apps into the output directory.
+
+    :param output_dir: The directory of the stub files
+    :param app_labels: The labels or names of the apps, all installed apps if empty
+    :param granularity: The granularity of the stub files (see :data:`GRANULARITIES`)
+    :param tocfile: The name of the file which contains the toctree of all stub files (without
+                    suffix), or ``None`` to skip it
+    :return: Whether each stub file was written
+
+    :raises ~sphinx.errors.ConfigError: If one of the given apps is not installed
+    """
+    app_configs = (
+        get_app_configs(app_labels) if app_labels else list(apps.get_app_configs())
+    )
+
+    stubs: dict[str, str] = {}
+    for app_config in app_configs:
+        stubs.update(get_app_stubs(app_config, granularity))
+    if tocfile:
+        stubs[tocfile] = get_stub(
+            "Apps",
+            [".. toctree::", "   :maxdepth: 1", ""]
+            + [f"   {name}" for name in sorted(stubs)],
+        )
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return {
+        output_dir / f"{name}.rst": write_if_changed(
+            output_dir / f"{name}.rst", content
+        )
+        for name, content in stubs.items()
+    }
+
+
+def get_app_stubs(app_config: AppConfig, granularity: str) -> Iterator[tuple[str, str]]:
+    """
+    Get the names and contents of the stub files of an app.
+
+    :param app_config: The config of the app
+    :param granularity: The granularity of the stub files (see :data:`GRANULARITIES`)
+    :return: The names (without suffix) and contents of the stub files
+    """
+    if granularity == "app":
+        yield app_config.label, get_stub(
+            force_str(app_config.verbose_name), [f".. autodjango:: {app_config.label}"]
+        )
+    elif granularity == "module":
+        modules = sorted({model.__module__ for model in app_config.get_models()})
+        modules.extend(
+            module
+            for module in (f"{app_config.name}.{name}" for name in APP_MODULES)
+            if importlib.util.find_spec(module) is not None
+        )
+        for module in modules:
+            yield module, get_stub(
+                module,
+                [f".. automodule:: {module}", "   :members:", "   :show-inheritance:"],
+            )
+    elif granularity == "model":
+        for model in app_config.get_models():
+            yield model._meta.label, get_stub(
+                model._meta.label,
+                [
+                    f".. autoclass:: {model.__module__}.{model.__qualname__}",
+                    "   :members:",
+                    "   :show-inheritance:",
+                ],
+            )
+    else:
+        raise ValueError(f"Unknown stub granularity {granularity!r}")
+
+
+def get_stub(title: str, lines: list[str]) -> str:
+    """
+    Get the content of a stub file.
+
+    :param title: The title of the document
+    :param lines: The lines of the body
+    :return: The content of the stub file
+    """
+    return "\n".join([title, "=" * len(title), "", *lines, ""])
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write the content to the given file, unless the file already has the same content.
+
+    :param path: The path of the file
+    :param content: The new content of the file
+    :return: Whether the file was written
+    """
+    data = content.encode("utf-8")
+    if path.is_file() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
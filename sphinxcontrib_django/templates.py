@@ -0,0 +1,324 @@
+"""
+This module adds the ``django-template-library`` directive which documents the tags and filters
+of a custom template tag library, e.g.::
+
+    .. django-template-library:: blog_tags
+
+The argument is the name which is used to load the library in templates. Each tag and filter is
+documented with its syntax and docstring as target of the ``:templatetag:`` and
+``:templatefilter:`` roles (see :mod:`~sphinxcontrib_django.roles`), so they can be referenced
+like the built-in tags and filters of Django, e.g. ``:templatetag:`blog_post_list```.
+
+The libraries are enumerated once per build from the template engines of the
+:class:`~django.template.backends.django.DjangoTemplates` backend. The scan results are stored in
+the build environment by module and are only collected again if the hash of the library module
+changed. The hash is computed from the module file without importing it, so incremental builds of
+projects with many template libraries don't import and introspect the unchanged ones.
+
+This module can also be used separately in ``conf.py``, but requires the configuration of the
+:mod:`~sphinxcontrib_django.docstrings` extension and the cross-reference types of the
+:mod:`~sphinxcontrib_django.roles` extension::
+
+    extensions = [
+        "sphinxcontrib_django.docstrings",
+        "sphinxcontrib_django.roles",
+        "sphinxcontrib_django.templates",
+    ]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+from typing import TYPE_CHECKING, NamedTuple
+
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    import sphinx
+    from django.template.library import Library
+    from sphinx.environment import BuildEnvironment
+    from sphinx.util.typing import ExtensionMetadata
+
+
+class TemplateLibraryEntry(NamedTuple):
+    """
+    A tag or filter of a template library.
+    """
+
+    #: The name of the tag or filter
+    name: str
+    #: The syntax of the tag or filter in templates
+    syntax: str
+    #: The docstring lines of the function
+    docstring: tuple[str, ...]
+
+
+class TemplateLibraryMetadata(NamedTuple):
+    """
+    The scan result of a template library module.
+    """
+
+    #: The dotted path of the library module
+    module: str
+    #: The SHA-256 hash of the library module, used to decide whether the scan is outdated
+    digest: str
+    #: The path of the library module
+    file: str | None
+    #: The tags of the library
+    tags: tuple[TemplateLibraryEntry, ...]
+    #: The filters of the library
+    filters: tuple[TemplateLibraryEntry, ...]
+
+
+class TemplateLibraryDirective(SphinxDirective):
+    """
+    Directive to document the tags and filters of a template library, registered as
+    ``django-template-library``.
+    """
+
+    required_arguments = 1
+
+    def run(self) -> list[nodes.Node]:
+        """Document the tags and filters of the given library."""
+        name = self.arguments[0]
+        module = getattr(self.env, "django_template_library_names", {}).get(name)
+        if module is None:
+            raise self.error(f"Unknown template library {name!r}")
+        library = self.env.django_template_libraries[module]  # type: ignore[attr-defined]
+        if library.file:
+            # Read the document again if the library changes
+            self.env.note_dependency(library.file)
+
+        source, _ = self.get_source_info()
+        lines = StringList()
+        for line in get_library_lines(name, library):
+            lines.append(line, source)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def get_engine_libraries() -> dict[str, str]:
+    """
+    Get the custom template libraries of all Django template engines, without importing them.
+
+    The built-in libraries, which are loaded without ``{% load %}``, and the libraries of
+    Django itself, which are documented by Django, are not included.
+
+    :return: The dotted paths of the library modules by their load names
+    """
+    from django.template import engines
+    from django.template.backends.django import DjangoTemplates
+
+    libraries: dict[str, str] = {}
+    for backend in engines.all():
+        if isinstance(backend, DjangoTemplates):
+            for name, module in backend.engine.libraries.items():
+                if not module.startswith("django."):
+                    libraries.setdefault(name, module)
+    return libraries
+
+
+def get_module_digest(module: str) -> tuple[str | None, str]:
+    """
+    Get the path and the hash of a module without importing it.
+
+    :param module: The dotted path of the module
+    :return: The path of the module file and its SHA-256 hash, or an empty hash if the module
+             has no file
+    """
+    spec = importlib.util.find_spec(module)
+    path = spec.origin if spec is not None and spec.has_location else None
+    if path is None:
+        return None, ""
+    with open(path, "rb") as f:
+        return path, hashlib.sha256(f.read()).hexdigest()
+
+
+def get_parameters(func: Callable[..., Any]) -> list[inspect.Parameter]:
+    """
+    Get the parameters of a tag or filter function.
+
+    :param func: The function
+    :return: The parameters, or an empty list if the signature can't be inspected
+    """
+    try:
+        return list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return []
+
+
+def get_tag_syntax(name: str, compile_function: Callable[..., Any]) -> str:
+    """
+    Get the syntax of a template tag.
+
+    The functions of simple, inclusion and block tags are wrapped by their compile functions, so
+    their arguments are taken from the wrapped function. Other tags parse their arguments on
+    their own, which can't be introspected.
+
+    :param name: The name of the tag
+    :param compile_function: The compile function which is registered in the library
+    :return: The syntax of the tag
+    """
+    if not hasattr(compile_function, "__wrapped__"):
+        return f"{{% {name} ... %}}"
+    parameters = get_parameters(compile_function)
+    # Tags with ``takes_context`` have to name their first argument ``context``
+    if parameters and parameters[0].name == "context":
+        parameters = parameters[1:]
+    arguments = []
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            arguments.append(f"*{parameter.name}")
+        elif parameter.kind == parameter.VAR_KEYWORD:
+            arguments.append(f"**{parameter.name}")
+        elif parameter.default is not parameter.empty:
+            arguments.append(f"{parameter.name}={parameter.default!r}")
+        else:
+            arguments.append(parameter.name)
+    return " ".join(["{%", name, *arguments, "%}"])
+
+
+def get_filter_syntax(name: str, func: Callable[..., Any]) -> str:
+    """
+    Get the syntax of a template filter.
+
+    :param name: The name of the filter
+    :param func: The filter function
+    :return: The syntax of the filter
+    """
+    parameters = get_parameters(func)
+    if len(parameters) < 2:
+        return f"{{{{ value|{name} }}}}"
+    return f"{{{{ value|{name}:{parameters[1].name} }}}}"
+
+
+def get_docstring(func: Callable[..., Any]) -> tuple[str, ...]:
+    """
+    Get the docstring lines of a tag or filter function.
+
+    :param func: The function, which might wrap the documented function
+    :return: The docstring lines
+    """
+    return tuple((inspect.getdoc(inspect.unwrap(func)) or "").splitlines())
+
+
+def collect_library(
+    module: str, file: str | None, digest: str, library: Library
+) -> TemplateLibraryMetadata:
+    """
+    Collect the tags and filters of a template library.
+
+    :param module: The dotted path of the library module
+    :param file: The path of the library module
+    :param digest: The hash of the library module
+    :param library: The library
+    :return: The metadata of the library
+    """
+    return TemplateLibraryMetadata(
+        module=module,
+        digest=digest,
+        file=file,
+        tags=tuple(
+            TemplateLibraryEntry(name, get_tag_syntax(name, func), get_docstring(func))
+            for name, func in sorted(library.tags.items())
+        ),
+        filters=tuple(
+            TemplateLibraryEntry(
+                name, get_filter_syntax(name, func), get_docstring(func)
+            )
+            for name, func in sorted(library.filters.items())
+        ),
+    )
+
+
+def scan_template_libraries(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """
+    Enumerate the template libraries and import and collect the libraries whose modules changed.
+
+    Called on the :event:`env-before-read-docs` event, so the libraries are scanned once per
+    build in the main process, even for parallel builds.
+
+    :param app: The Sphinx application object
+    :param env: The Sphinx build environment
+    :param docnames: The names of the documents which will be read
+    """
+    from django.template.library import import_library
+
+    cached: dict[str, TemplateLibraryMetadata] = getattr(
+        env, "django_template_libraries", {}
+    )
+    scanned = {}
+    names = {}
+    for name, module in sorted(get_engine_libraries().items()):
+        names[name] = module
+        if module not in scanned:
+            file, digest = get_module_digest(module)
+            if module in cached and digest and cached[module].digest == digest:
+                scanned[module] = cached[module]
+            else:
+                scanned[module] = collect_library(
+                    module, file, digest, import_library(module)
+                )
+    env.django_template_libraries = scanned  # type: ignore[attr-defined]
+    env.django_template_library_names = names  # type: ignore[attr-defined]
+
+
+def get_library_lines(name: str, library: TemplateLibraryMetadata) -> list[str]:
+    """
+    Get the reStructuredText lines which document a template library.
+
+    :param name: The name which is used to load the library
+    :param library: The metadata of the library
+    :return: The lines of the documentation
+    """
+    lines = [f"Load with ``{{% load {name} %}}`` (module ``{library.module}``).", ""]
+    for title, directive, entries in (
+        ("Tags", "templatetag", library.tags),
+        ("Filters", "templatefilter", library.filters),
+    ):
+        if not entries:
+            continue
+        lines.extend([f"**{title}:**", ""])
+        for entry in entries:
+            # The targets of the cross-reference types have no content
+            lines.extend([f".. {directive}:: {entry.name}", ""])
+            lines.extend([f"``{entry.name}``", f"   ``{entry.syntax}``", ""])
+            if entry.docstring:
+                lines.extend(f"   {line}" if line else "" for line in entry.docstring)
+                lines.append("")
+    return lines
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It registers the :class:`TemplateLibraryDirective` and scans the template libraries on the
+    :event:`env-before-read-docs` event.
+
+    :param app: The Sphinx application object
+    """
+    app.add_directive("django-template-library", TemplateLibraryDirective)
+    app.connect("env-before-read-docs", scan_template_libraries)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
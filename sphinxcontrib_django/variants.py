@@ -0,0 +1,253 @@
+"""
+This module adds a multi-settings build mode to document projects which use several Django
+settings modules, e.g. with different :setting:`INSTALLED_APPS` per tenant.
+
+Since :func:`django.setup` can only be called once per process, each settings module is
+introspected in its own worker process. The workers run in parallel and the collected metadata is
+merged into one build. Configure the settings in ``conf.py``::
+
+    django_settings_variants = {
+        "tenant-a": "myproject.settings.tenant_a",
+        "tenant-b": "myproject.settings.tenant_b",
+    }
+
+and render one section per settings module with the ``django-settings-variants`` directive::
+
+    .. django-settings-variants::
+
+Optionally, the names of the variants to render can be passed as arguments to the directive.
+
+Each section lists the installed apps of the settings module and documents its models with their
+fields. Since autodoc can only import the models of the main settings module, the models of the
+variants are documented from the collected metadata.
+
+This module can also be used separately in ``conf.py``::
+
+    extensions = [
+        "sphinxcontrib_django.variants",
+    ]
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from typing import TYPE_CHECKING
+
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.errors import ExtensionError
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import nested_parse_with_titles
+
+from . import __version__
+from .metadata import get_registry_metadata
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    import sphinx
+    from sphinx.util.typing import ExtensionMetadata
+
+
+class SettingsVariantsDirective(SphinxDirective):
+    """
+        Directive to render one section per Django settings variant, registered as
+        ``django-settings-variants``.
+
+        The sections list the installed apps of the respective settings module and document its
+    models with their fields.
+    """
+
+    optional_arguments = 1
+    final_argument_whitespace = True
+
+    def run(self) -> list[nodes.Node]:
+        """Render the collected metadata of the requested settings variants."""
+        variants = getattr(self.env, "django_settings_variants", {})
+        names = self.arguments[0].split() if self.arguments else list(variants)
+        # The metadata is collected freshly on every build
+        self.env.note_reread()
+
+        lines = StringList()
+        source, _ = self.get_source_info()
+        for name in names:
+            if name not in variants:
+                raise self.error(f"Unknown Django settings variant {name!r}")
+            for line in get_variant_lines(name, variants[name]):
+                lines.append(line, source)
+
+        node = nodes.container()
+        nested_parse_with_titles(self.state, lines, node)
+        return node.children
+
+
+def get_variant_lines(name: str, metadata: dict[str, Any]) -> list[str]:
+    """
+    Get the reStructuredText lines of a settings variant section.
+
+    :param name: The name of the settings variant
+    :param metadata: The collected metadata of the settings variant
+    :return: The lines of the section
+    """
+    lines = [
+        name,
+        "-" * len(name),
+        "",
+        f"Settings module: ``{metadata['settings']}``",
+        "",
+        "Installed apps:",
+        "",
+    ]
+    lines.extend(
+        f"* ``{app['label']}`` (``{app['name']}``)" for app in metadata["apps"]
+    )
+    lines.append("")
+    for app in metadata["apps"]:
+        for model in app["models"]:
+            lines.extend(get_model_lines(model))
+    return lines
+
+
+def get_model_lines(model: dict[str, Any]) -> list[str]:
+    """
+    Get the reStructuredText lines which document a model of a settings variant.
+
+    The models can't be documented with autodoc, since they are only loaded in the worker
+    process of the variant. So they are documented from the collected metadata.
+
+    :param model: The collected metadata of the model
+    :return: The lines of the model documentation
+    """
+    lines = [
+        f"``{model['label']}``",
+        f"   {model['verbose_name']}, stored in the table ``{model['db_table']}``",
+        "",
+    ]
+    lines.extend(f"   * {get_field_text(field)}" for field in model["fields"])
+    lines.append("")
+    return lines
+
+
+def get_field_text(field: dict[str, Any]) -> str:
+    """
+    Get the description of a model field of a settings variant.
+
+    :param field: The collected metadata of the field
+    :return: The description of the field
+    """
+    text = f"``{field['name']}``: :class:`~{field['type']}`"
+    if field["related_model"]:
+        text += f" to ``{field['related_model']}``"
+    flags = [
+        flag
+        for flag, key in (
+            ("primary key", "primary_key"),
+            ("unique", "unique"),
+            ("nullable", "null"),
+        )
+        if field[key]
+    ]
+    if field["max_length"]:
+        flags.append(f"max length {field['max_length']}")
+    if field["choices"]:
+        flags.append(f"{len(field['choices'])} choices")
+    if flags:
+        text += f" ({', '.join(flags)})"
+    return text
+
+
+def collect_variant_metadata(
+    settings_module: str,
+    apps_to_document: list[str],
+    mock_imports: list[str],
+    sys_path: list[str],
+) -> dict[str, Any]:
+    """
+    Set up Django with the given settings module and collect the metadata of the app registry.
+
+    This is executed in a worker process, since Django can only be set up once per process.
+
+    :param settings_module: The import path of the settings module
+    :param apps_to_document: The labels or names of the apps which should be documented
+    :param mock_imports: The modules to mock
+    :param sys_path: The module search path of the Sphinx process
+    :return: The metadata of the app registry
+    """
+    from .docstrings import configure_django
+    from .docstrings.patches import patch_django_for_autodoc, patch_integrations
+
+    sys.path[:] = sys_path
+    # Use the same module paths as the main process
+    patch_django_for_autodoc()
+    configure_django(settings_module, apps_to_document, mock_imports)
+    patch_integrations()
+    return {"settings": settings_module, **get_registry_metadata()}
+
+
+def collect_settings_variants(app: sphinx.application.Sphinx) -> None:
+    """
+    Introspect all configured settings variants in a pool of worker processes and store the
+    collected metadata on the build environment.
+
+    Called on the :event:`builder-inited` event.
+
+    :param app: The Sphinx application object
+
+    :raises ~sphinx.errors.ExtensionError: If a settings variant cannot be introspected
+    """
+    variants = app.config.django_settings_variants
+    app.env.django_settings_variants = {}  # type: ignore[attr-defined]
+    if not variants:
+        return
+
+    # Use fresh interpreters, since forked workers would inherit the configured Django settings
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(
+        processes=app.config.django_settings_variants_workers or None,
+        # Each worker can only set up Django once
+        maxtasksperchild=1,
+    ) as pool:
+        # The docstrings extension might not be loaded
+        apps_to_document = getattr(app.config, "django_apps_to_document", [])
+        mock_imports = getattr(app.config, "django_mock_imports", [])
+        results = {}
+        for name, settings_module in variants.items():
+            results[name] = pool.apply_async(
+                collect_variant_metadata,
+                (settings_module, apps_to_document, mock_imports, sys.path),
+            )
+        for name, result in results.items():
+            try:
+                app.env.django_settings_variants[name] = result.get()  # type: ignore[attr-defined]
+            except Exception as e:
+                raise ExtensionError(
+                    f"Unable to introspect the Django settings variant {name!r}: {e}"
+                ) from e
+
+
+def setup(app: sphinx.application.Sphinx) -> ExtensionMetadata:
+    """
+    Allow this module to be used as Sphinx extension.
+
+    This is also called from the top-level :meth:`~sphinxcontrib_django.setup`.
+
+    It adds the config values ``django_settings_variants`` and
+    ``django_settings_variants_workers``, connects to the :event:`builder-inited` event and
+    registers the :class:`SettingsVariantsDirective`.
+
+    :param app: The Sphinx application object
+    """
+    # Mapping of variant names to the import paths of their settings modules
+    app.add_config_value("django_settings_variants", {}, "env")
+    # Number of worker processes, defaults to the number of CPUs
+    app.add_config_value("django_settings_variants_workers", None, "env")
+
+    app.connect("builder-inited", collect_settings_variants)
+    app.add_directive("django-settings-variants", SettingsVariantsDirective)
+
+    return {
+        "version": __version__,
+        "parallel_read_safe": True,
+        "parallel_write_safe": True,
+    }
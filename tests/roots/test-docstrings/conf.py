@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.abspath("."))
 project = "sphinx dummy Test"
 extensions = [
     "sphinxcontrib_django",
+    "sphinxcontrib_django.graph",
     "sphinx.ext.graphviz",
     "sphinx.ext.inheritance_diagram",
 ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.contrib import admin
+
+from .models import FileModel, SimpleModel
+
+#: Custom admin sites, the default site requires ``django.contrib.admin`` to be installed
+site = admin.AdminSite(name="dummy_admin")
+other_site = admin.AdminSite(name="other_admin")
+
+
+class SimpleModelInline(admin.TabularInline):
+    model = SimpleModel
+
+
+@admin.register(FileModel, site=other_site)
+class FileModelAdmin(admin.ModelAdmin):
+    list_display = ("upload",)
+    inlines = [SimpleModelInline]
+
+
+@admin.register(SimpleModel, site=site)
+class SimpleModelAdmin(admin.ModelAdmin):
+    list_display = ("dummy_field", "file")
+    search_fields = ("dummy_field",)
+    list_select_related = ("file",)
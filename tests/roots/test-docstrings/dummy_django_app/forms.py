@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django import forms
 
-from .models import SimpleModel
+from .models import FileModel, SimpleModel
 
 
 class SimpleForm(forms.ModelForm):
@@ -18,3 +18,22 @@ class SimpleForm(forms.ModelForm):
     class Meta:
         model = SimpleModel
         fields = ("file", "childA", "childrenB", "dummy_field")
+
+
+class BaseSimpleFormSet(forms.BaseFormSet):
+    """
+    Custom base class of formsets
+    """
+
+
+class BaseSimpleInlineFormSet(forms.BaseInlineFormSet):
+    """
+    Custom base class of inline formsets
+    """
+
+
+SimpleFormSet = forms.formset_factory(SimpleForm, extra=2, max_num=5)
+
+SimpleModelFormSet = forms.inlineformset_factory(
+    FileModel, SimpleModel, fields=("dummy_field",), can_delete=False
+)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument("models", nargs="*", help="The models to index")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only list the changes"
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        pass
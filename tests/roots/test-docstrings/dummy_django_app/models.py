@@ -57,15 +57,13 @@ class SimpleModel(models.Model):
     #: Custom model manager
     custom_objects = SimpleModelManager()
 
-    # Mock get_..._display method of Django models
+    # User-defined methods with the names of methods contributed by Django
     def get_dummy_field_display(self):
         pass
 
-    # Mock common get_next_by_ method
     def get_next_by_dummy_field(self):
         pass
 
-    # Mock common get_previous_by_ method
     def get_previous_by_dummy_field(self):
         pass
 
@@ -112,6 +110,14 @@ class ChoiceModel(models.Model):
     choice_with_callable_empty = models.CharField(choices=callable_choices_empty)
 
 
+class AbstractPublication(models.Model):
+    status = models.CharField(choices=[("draft", "Draft"), ("public", "Public")])
+    published_on = models.DateField()
+
+    class Meta:
+        abstract = True
+
+
 class TaggedItem(models.Model):
     # Test model taken from:
     # https://docs.djangoproject.com/en/stable/ref/contrib/contenttypes/#generic-relations
@@ -17,3 +17,7 @@ INSTALLED_APPS = [
 ]
 
 USE_TZ = False
+
+TEMPLATES = [
+    {"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}
+]
@@ -0,0 +1,11 @@
+"""
+Dummy Django settings file with a reduced set of installed apps
+"""
+
+from __future__ import annotations
+
+SECRET_KEY = "dummy-key"
+
+INSTALLED_APPS = ["django.contrib.contenttypes"]
+
+USE_TZ = False
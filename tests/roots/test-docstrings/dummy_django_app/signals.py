@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import Signal, receiver
+
+from .models import FileModel, SimpleModel
+
+#: A custom signal of the app
+file_uploaded = Signal()
+
+
+@receiver(post_save, sender=SimpleModel)
+def log_simple_model(sender, **kwargs):
+    pass
+
+
+@receiver(pre_delete, sender=SimpleModel)
+@receiver(file_uploaded, sender=FileModel)
+def clean_up(sender, **kwargs):
+    pass
+
+
+class Auditor:
+    def audit(self, sender, **kwargs):
+        pass
+
+
+#: Keep a reference, receivers are only weakly referenced by default
+auditor = Auditor()
+post_save.connect(auditor.audit, sender=SimpleModel)
+post_save.connect(auditor.audit)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from django import template
+from django.template.defaultfilters import stringfilter
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def greeting(context, name, salutation="Hello"):
+    """
+    Greet the given name.
+    """
+    return f"{salutation} {name}"
+
+
+@register.inclusion_tag("dummy_list.html")
+def dummy_list(*items):
+    return {"items": items}
+
+
+@register.tag
+def raw_tag(parser, token):
+    """
+    A tag which parses its arguments on its own.
+    """
+    raise NotImplementedError
+
+
+@register.filter
+@stringfilter
+def shout(value):
+    """
+    Convert the value to upper case.
+    """
+    return value.upper()
+
+
+@register.filter
+def repeat(value, times):
+    return value * times
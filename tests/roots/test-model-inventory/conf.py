@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+project = "sphinx dummy Consumer Test"
+extensions = ["sphinxcontrib_django.roles"]
+
+nitpicky = True
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from sphinxcontrib_django.docstrings.admin import get_admin_index
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_admin_index(app: SphinxTestApp) -> None:
+    admin = importlib.import_module("dummy_django_app.admin")
+    models = importlib.import_module("dummy_django_app.models")
+    get_admin_index.cache_clear()
+    index = get_admin_index()
+    assert [
+        (registration.site_name, type(registration.model_admin))
+        for registration in index.models[models.SimpleModel]
+    ] == [("dummy_admin", admin.SimpleModelAdmin)]
+    assert [
+        registration.model for registration in index.model_admins[admin.FileModelAdmin]
+    ] == [models.FileModel]
+    assert models.ChoiceModel not in index.models
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_show_admin": True}
+)
+def test_model_admin_configuration(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    importlib.import_module("dummy_django_app.admin")
+    actual = do_autodoc(app, "class", "dummy_django_app.models.FileModel")
+    print(actual)
+    assert list(actual)[-8:] == [
+        "",
+        "   Admin :class:`~dummy_django_app.admin.FileModelAdmin` (site ``other_admin``):",
+        "",
+        "   * List display: ``upload``",
+        "   * Inlines: :class:`~dummy_django_app.admin.SimpleModelInline`",
+        "",
+        "   .. inheritance-diagram:: dummy_django_app.models.FileModel",
+        "",
+    ]
+    actual = do_autodoc(app, "class", "dummy_django_app.models.SimpleModel")
+    print(actual)
+    assert list(actual)[-8:-2] == [
+        "   Admin :class:`~dummy_django_app.admin.SimpleModelAdmin` (site ``dummy_admin``):",
+        "",
+        "   * List display: ``dummy_field``, ``file``",
+        "   * Search fields: ``dummy_field``",
+        "   * List select related: ``file``",
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_admin_configuration_disabled(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    importlib.import_module("dummy_django_app.admin")
+    actual = do_autodoc(app, "class", "dummy_django_app.models.FileModel")
+    assert not any(line.lstrip().startswith("Admin ") for line in actual)
+    actual = do_autodoc(app, "class", "dummy_django_app.admin.SimpleModelAdmin")
+    assert "   Registered for:" not in actual
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_show_admin": True}
+)
+def test_model_admin_docstring(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    importlib.import_module("dummy_django_app.admin")
+    actual = do_autodoc(app, "class", "dummy_django_app.admin.SimpleModelAdmin")
+    print(actual)
+    assert list(actual) == [
+        "",
+        ".. py:class:: SimpleModelAdmin(model, admin_site)",
+        "   :module: dummy_django_app.admin",
+        "",
+        "   Registered for:",
+        "",
+        "   * :class:`~dummy_django_app.models.SimpleModel` (site ``dummy_admin``)",
+        "",
+    ]
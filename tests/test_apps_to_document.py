@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import importlib
+import os
+from typing import TYPE_CHECKING
+
+import django
+import pytest
+from django.apps import apps
+from django.conf import settings
+from sphinx.errors import ConfigError
+
+from sphinxcontrib_django.docstrings.subset import (
+    get_apps_to_document_closure,
+    reset_app_registry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.fixture
+def restore_installed_apps() -> Iterator[None]:
+    """
+    Load all installed apps again after the test
+    """
+    yield
+    settings_module = importlib.import_module(os.environ["DJANGO_SETTINGS_MODULE"])
+    settings.INSTALLED_APPS = settings_module.INSTALLED_APPS
+    reset_app_registry()
+    django.setup()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+@pytest.mark.usefixtures("restore_installed_apps")
+def test_app_with_imported_models(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    # The models of dummy_django_app import the ContentType model and reference auth lazily
+    app = setup_app_with_different_config(django_apps_to_document=["dummy_django_app"])
+    assert "Loading 3 of " in app.status.getvalue()
+    assert [app_config.label for app_config in apps.get_app_configs()] == [
+        "auth",
+        "contenttypes",
+        "dummy_django_app",
+    ]
+    assert settings.INSTALLED_APPS == [
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "dummy_django_app",
+    ]
+    assert not apps.is_installed("dummy_django_app2")
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+@pytest.mark.usefixtures("restore_installed_apps")
+def test_closure_of_app_without_dependencies(app: SphinxTestApp) -> None:
+    assert get_apps_to_document_closure(settings.INSTALLED_APPS, ["contenttypes"]) == [
+        "django.contrib.contenttypes"
+    ]
+    # The models of auth import the ContentType model
+    assert get_apps_to_document_closure(
+        settings.INSTALLED_APPS, ["django.contrib.auth"]
+    ) == ["django.contrib.auth", "django.contrib.contenttypes"]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+@pytest.mark.usefixtures("restore_installed_apps")
+def test_app_with_lazy_references(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    # dummy_django_app2 references dummy_django_app lazily, which references auth lazily
+    setup_app_with_different_config(django_apps_to_document=["dummy_django_app2"])
+    assert [app_config.label for app_config in apps.get_app_configs()] == [
+        "auth",
+        "contenttypes",
+        "dummy_django_app",
+        "dummy_django_app2",
+    ]
+    relation_field = apps.get_model(
+        "dummy_django_app2", "GenericRelationModel"
+    )._meta.get_field("relation_field")
+    assert relation_field.related_model is apps.get_model(
+        "dummy_django_app", "TaggedItem"
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+@pytest.mark.usefixtures("restore_installed_apps")
+def test_app_not_installed(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    with pytest.raises(ConfigError):
+        setup_app_with_different_config(django_apps_to_document=["unknown_app"])
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+@pytest.mark.usefixtures("restore_installed_apps")
+def test_dependency_not_installed(app: SphinxTestApp) -> None:
+    # dummy_django_app2 references a model of dummy_django_app, which is not installed here
+    with pytest.raises(
+        ConfigError,
+        match=(
+            r"not contained in INSTALLED_APPS: dummy_django_app \(required by"
+            r" dummy_django_app2.GenericRelationModel\)"
+        ),
+    ):
+        get_apps_to_document_closure(
+            ["django.contrib.contenttypes", "dummy_django_app2"], ["dummy_django_app2"]
+        )
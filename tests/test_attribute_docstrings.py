@@ -561,3 +561,15 @@ def test_generic_relation_field(
         ),
         "",
     ]
+
+
+def test_default_docstring_cache() -> None:
+    from django.db.models.query_utils import DeferredAttribute
+
+    from sphinxcontrib_django.docstrings.attributes import get_default_docstring
+
+    lines = get_default_docstring(DeferredAttribute)
+    assert lines[0] == (
+        "A wrapper for a deferred-loading field. When the value is read from this"
+    )
+    assert get_default_docstring(DeferredAttribute) is lines
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.apps import apps
+from django.conf import settings
+from django.db.models import AutoField
+
+from sphinxcontrib_django.autodjango import get_app_lines, get_module_files
+
+if TYPE_CHECKING:
+    from sphinx.testing.util import SphinxTestApp
+
+
+def autofield() -> str:
+    return getattr(
+        settings,
+        "DEFAULT_AUTO_FIELD",
+        f"{AutoField.__module__}.{AutoField.__qualname__}",
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_app_models(app: SphinxTestApp) -> None:
+    actual = get_app_lines(app, apps.get_app_config("dummy_django_app2"), ["models"])
+    print(actual)
+    assert actual == [
+        ".. py:class:: GenericRelationModel",
+        "   :module: dummy_django_app2.models",
+        "",
+        "   :param id: Primary key: ID",
+        f"   :type id: ~{autofield()}",
+        "",
+        "   Relationship fields:",
+        "",
+        "   :param relation_field: Relation field",
+        (
+            "   :type relation_field:"
+            " :class:`~django.contrib.contenttypes.fields.GenericRelation` to"
+            " :class:`~dummy_django_app.models.TaggedItem`"
+        ),
+        "",
+        "   .. inheritance-diagram:: dummy_django_app2.models.GenericRelationModel",
+        "",
+        "   .. py:attribute:: id",
+        "",
+        f"      Type: :class:`~{autofield()}`",
+        "",
+        "      Primary key: ID",
+        "",
+        "   .. py:attribute:: relation_field",
+        "",
+        (
+            "      Type: :class:`~django.contrib.contenttypes.fields.GenericRelation`"
+            " to :class:`~dummy_django_app.models.TaggedItem`"
+        ),
+        "",
+        "      Relation field",
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_app_forms_and_views(app: SphinxTestApp) -> None:
+    actual = get_app_lines(
+        app, apps.get_app_config("dummy_django_app"), ["forms", "views"]
+    )
+    print(actual)
+    assert actual[:5] == [
+        ".. py:class:: SimpleForm",
+        "   :module: dummy_django_app.forms",
+        "",
+        "   **Form fields:**",
+        "",
+    ]
+    views_start = actual.index(".. py:function:: simple_view(request)")
+    assert actual[views_start:] == [
+        ".. py:function:: simple_view(request)",
+        "   :module: dummy_django_app.views",
+        "",
+        "   A simple view function.",
+        "",
+        "   URL paths:",
+        "",
+        "   * ``/simple/``",
+        "   * ``/simple/<year>/``",
+        "",
+        ".. py:function:: not_a_view()",
+        "   :module: dummy_django_app.views",
+        "",
+        "   A function which is not mapped to any URL.",
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_autodjango_directive(app: SphinxTestApp) -> None:
+    app.build()
+    html = (app.outdir / "autodjango.html").read_text(encoding="utf-8")
+    assert 'id="dummy_django_app2.models.GenericRelationModel"' in html
+    assert 'id="dummy_django_app2.models.GenericRelationModel.relation_field"' in html
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_module_files(app: SphinxTestApp) -> None:
+    app_config = apps.get_app_config("dummy_django_app")
+    get_app_lines(app, app_config, ["models", "forms", "views"])
+    actual = get_module_files(app_config, ["models", "forms", "views"])
+    assert [file.removeprefix(app_config.path) for file in actual] == [
+        "/forms.py",
+        "/models.py",
+        "/views.py",
+    ]
+    assert get_module_files(app_config, ["views"]) == [actual[-1]]
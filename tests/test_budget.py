@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import models
+from django.utils.choices import CallableChoiceIterator
+
+from sphinxcontrib_django.docstrings.attributes import get_limit_choices_to
+from sphinxcontrib_django.docstrings.budget import (
+    BudgetExceeded,
+    call_with_timeout,
+    evaluate_with_budget,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.fixture
+def release() -> Iterator[threading.Event]:
+    """
+    Event which releases the abandoned worker threads at the end of the test
+    """
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_call_with_timeout(release: threading.Event) -> None:
+    assert call_with_timeout(lambda: 42, 1) == 42
+    assert call_with_timeout(lambda: 42, None) == 42
+    with pytest.raises(BudgetExceeded, match="not finished after 0.05 seconds"):
+        call_with_timeout(release.wait, 0.05)
+
+
+def test_call_with_timeout_exception() -> None:
+    def fail() -> None:
+        raise ValueError("Database unavailable")
+
+    with pytest.raises(ValueError, match="Database unavailable"):
+        call_with_timeout(fail, 1)
+
+
+def test_evaluate_with_budget() -> None:
+    assert evaluate_with_budget(range(3), 1, 3) == [0, 1, 2]
+    assert evaluate_with_budget(range(3), None, None) == [0, 1, 2]
+    with pytest.raises(BudgetExceeded, match="more than 2 items"):
+        evaluate_with_budget(range(3), 1, 2)
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_choices_timeout": 0.05}
+)
+def test_choices_timeout(
+    app: SphinxTestApp,
+    do_autodoc: Callable[..., StringList],
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    from dummy_django_app.models import ChoiceModel
+
+    def slow_choices() -> list[tuple[str, str]]:
+        release.wait()
+        return [("Something", "Not empty")]
+
+    field = ChoiceModel._meta.get_field("choice_with_callable")
+    monkeypatch.setattr(field, "choices", CallableChoiceIterator(slow_choices))
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_with_callable"
+    )
+    print(actual)
+    assert list(actual) == [
+        "",
+        ".. py:attribute:: ChoiceModel.choice_with_callable",
+        "   :module: dummy_django_app.models",
+        "",
+        "   Type: :class:`~django.db.models.CharField`",
+        "",
+        "   Choice with callable",
+        "",
+        "   Choices: computed by"
+        " ``test_budget.test_choices_timeout.<locals>.slow_choices``",
+        "",
+    ]
+    assert (
+        "Skipped the choices of dummy_django_app.ChoiceModel.choice_with_callable computed by"
+        " test_budget.test_choices_timeout.<locals>.slow_choices: not finished after 0.05"
+        " seconds"
+    ) in app.warning.getvalue()
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_choices_max_items": 0}
+)
+def test_choices_max_items(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_with_callable"
+    )
+    print(actual)
+    assert list(actual)[-2:] == [
+        "   Choices: computed by ``dummy_django_app.models.callable_choices``",
+        "",
+    ]
+    assert "more than 0 items" in app.warning.getvalue()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_choices_error(
+    app: SphinxTestApp,
+    do_autodoc: Callable[..., StringList],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from dummy_django_app.models import ChoiceModel
+
+    def unavailable() -> list[tuple[str, str]]:
+        raise RuntimeError("Database unavailable")
+
+    field = ChoiceModel._meta.get_field("choice_with_callable")
+    monkeypatch.setattr(field, "choices", CallableChoiceIterator(unavailable))
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_with_callable"
+    )
+    print(actual)
+    assert list(actual)[-2:] == [
+        "   Choices: computed by"
+        " ``test_budget.test_choices_error.<locals>.unavailable``",
+        "",
+    ]
+    assert "Database unavailable" in app.warning.getvalue()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_limit_choices_to(app: SphinxTestApp, release: threading.Event) -> None:
+    def staff() -> dict[str, bool]:
+        return {"is_staff": True}
+
+    def slow() -> dict[str, bool]:
+        release.wait()
+        return {"is_staff": True}
+
+    def unavailable() -> dict[str, bool]:
+        raise RuntimeError("Database unavailable")
+
+    def get_field(limit_choices_to: Any) -> models.ForeignKey[Any, Any]:  # noqa: ANN401
+        field: models.ForeignKey[Any, Any] = models.ForeignKey(
+            "auth.User", on_delete=models.CASCADE, limit_choices_to=limit_choices_to
+        )
+        field.set_attributes_from_name("user")
+        return field
+
+    assert get_limit_choices_to(get_field(None)) is None
+    assert (
+        get_limit_choices_to(get_field({"is_active": True}))
+        == "``{'is_active': True}``"
+    )
+    assert get_limit_choices_to(get_field(staff), 1) == "``{'is_staff': True}``"
+    assert (
+        get_limit_choices_to(get_field(slow), 0.05)
+        == "computed by ``test_budget.test_limit_choices_to.<locals>.slow``"
+    )
+    assert (
+        get_limit_choices_to(get_field(unavailable), 1)
+        == "computed by ``test_budget.test_limit_choices_to.<locals>.unavailable``"
+    )
+    assert (
+        "computed by test_budget.test_limit_choices_to.<locals>.unavailable:"
+        " Database unavailable"
+    ) in app.warning.getvalue()
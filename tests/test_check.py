@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from sphinxcontrib_django.check import get_references
+
+if TYPE_CHECKING:
+    from sphinx.testing.util import SphinxTestApp
+
+
+def test_get_references() -> None:
+    source = (
+        "Title\n"
+        "=====\n"
+        "\n"
+        "See :py:model:`auth.User` and :setting:`Installed apps <INSTALLED_APPS>`\n"
+        "and :py:model:`~auth.Group`.\n"
+    )
+    assert list(get_references(source)) == [
+        (4, "py:model", "auth.User"),
+        (4, "setting", "INSTALLED_APPS"),
+        (5, "py:model", "auth.Group"),
+    ]
+
+
+@pytest.mark.sphinx("djangocheck", testroot="docstrings")
+def test_check_builder(app: SphinxTestApp) -> None:
+    app.build()
+    warnings = app.warning.getvalue()
+    print(warnings)
+    assert (
+        "check.rst:7: WARNING: Broken Django reference :setting:`UNKNOWN_SETTING`"
+        in warnings
+    )
+    assert "INSTALLED_APPS" not in warnings
+    # Documented settings don't need to be set in the settings module
+    assert "THIRD_PARTY_SETTING" not in warnings
+    assert (
+        "index.rst:10: WARNING: Broken Django reference :py:model:`unknown_app.UnknownModel`"
+        in warnings
+    )
+    assert "dummy_django_app.models.SimpleModel`" not in warnings
+    # The reverse accessor of foreign keys without related name ends with "_set"
+    assert (
+        "WARNING: Broken generated reference :attr:`dummy_django_app.models.SimpleModel"
+        ".childmodela` in the documentation of dummy_django_app.models.ChildModelA"
+        in warnings
+    )
+    # The intersphinx inventories are not loaded, but the configuration is kept
+    assert "intersphinx" not in warnings
+    assert app.config.intersphinx_mapping
+    # No output is written
+    assert not list(app.outdir.glob("*.html"))
@@ -397,22 +397,131 @@ def test_form(app: SphinxTestApp, do_autodoc: Callable[..., StringList]) -> None
         "",
         "   **Form fields:**",
         "",
-        "   * ``file``: File (:class:`~django.forms.ModelChoiceField`)",
-        "   * ``childA``: ChildA (:class:`~django.forms.ModelChoiceField`)",
         (
-            "   * ``childrenB``: ChildrenB"
-            " (:class:`~django.forms.ModelMultipleChoiceField`)"
+            "   * ``file``: File (:class:`~django.forms.ModelChoiceField`,"
+            " widget :class:`~django.forms.Select`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.file`"
+        ),
+        (
+            "   * ``childA``: ChildA (:class:`~django.forms.ModelChoiceField`,"
+            " widget :class:`~django.forms.Select`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.childA`"
+        ),
+        (
+            "   * ``childrenB``: ChildrenB (:class:`~django.forms.ModelMultipleChoiceField`,"
+            " widget :class:`~django.forms.SelectMultiple`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.childrenB`"
+        ),
+        (
+            "   * ``dummy_field``: Very verbose name of dummy field"
+            " (:class:`~django.forms.CharField`, widget :class:`~django.forms.TextInput`,"
+            " required), from :attr:`~dummy_django_app.models.SimpleModel.dummy_field`"
+        ),
+        (
+            "   * ``test1``: Test1 (:class:`~django.forms.CharField`,"
+            " widget :class:`~django.forms.TextInput`, required)"
+        ),
+        (
+            "   * ``test2``: Test2 (:class:`~django.forms.CharField`,"
+            " widget :class:`~django.forms.TextInput`, required)"
+        ),
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_formset(app: SphinxTestApp, do_autodoc: Callable[..., StringList]) -> None:
+    actual = do_autodoc(app, "class", "dummy_django_app.forms.SimpleFormSet")
+    print(actual)
+    assert list(actual)[4:] == [
+        "",
+        "   Formset of :class:`~dummy_django_app.forms.SimpleForm`",
+        "",
+        "   * Extra forms: 2",
+        "   * Minimum forms: 0",
+        "   * Maximum forms: 5",
+        "   * Can delete: no",
+        "   * Can order: no",
+        "",
+        "   **Form fields:**",
+        "",
+        (
+            "   * ``file``: File (:class:`~django.forms.ModelChoiceField`,"
+            " widget :class:`~django.forms.Select`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.file`"
+        ),
+        (
+            "   * ``childA``: ChildA (:class:`~django.forms.ModelChoiceField`,"
+            " widget :class:`~django.forms.Select`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.childA`"
+        ),
+        (
+            "   * ``childrenB``: ChildrenB (:class:`~django.forms.ModelMultipleChoiceField`,"
+            " widget :class:`~django.forms.SelectMultiple`, required), from"
+            " :attr:`~dummy_django_app.models.SimpleModel.childrenB`"
         ),
         (
             "   * ``dummy_field``: Very verbose name of dummy field"
-            " (:class:`~django.forms.CharField`)"
+            " (:class:`~django.forms.CharField`, widget :class:`~django.forms.TextInput`,"
+            " required), from :attr:`~dummy_django_app.models.SimpleModel.dummy_field`"
+        ),
+        (
+            "   * ``test1``: Test1 (:class:`~django.forms.CharField`,"
+            " widget :class:`~django.forms.TextInput`, required)"
+        ),
+        (
+            "   * ``test2``: Test2 (:class:`~django.forms.CharField`,"
+            " widget :class:`~django.forms.TextInput`, required)"
         ),
-        "   * ``test1``: Test1 (:class:`~django.forms.CharField`)",
-        "   * ``test2``: Test2 (:class:`~django.forms.CharField`)",
         "",
     ]
 
 
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_inline_formset(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(app, "class", "dummy_django_app.forms.SimpleModelFormSet")
+    print(actual)
+    assert list(actual)[4:] == [
+        "",
+        (
+            "   Inline formset of :class:`~dummy_django_app.models.SimpleModel` related to"
+            " :class:`~dummy_django_app.models.FileModel` via"
+            " :attr:`~dummy_django_app.models.SimpleModel.file`"
+        ),
+        "",
+        "   * Extra forms: 3",
+        "   * Minimum forms: 0",
+        "   * Maximum forms: 1000",
+        "   * Can delete: no",
+        "   * Can order: no",
+        "",
+        "   **Form fields:**",
+        "",
+        (
+            "   * ``dummy_field``: Very verbose name of dummy field"
+            " (:class:`~django.forms.CharField`, widget :class:`~django.forms.TextInput`,"
+            " required), from :attr:`~dummy_django_app.models.SimpleModel.dummy_field`"
+        ),
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_custom_base_formset(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    # Custom base classes lack the options which are set by the formset factories
+    for name, docstring in (
+        ("BaseSimpleFormSet", "Custom base class of formsets"),
+        ("BaseSimpleInlineFormSet", "Custom base class of inline formsets"),
+    ):
+        actual = do_autodoc(app, "class", f"dummy_django_app.forms.{name}")
+        print(actual)
+        assert list(actual)[3:] == ["", f"   {docstring}", ""]
+
+
 @pytest.mark.sphinx("html", testroot="docstrings")
 def test_relation_model(
     app: SphinxTestApp, do_autodoc: Callable[..., StringList]
@@ -439,3 +548,25 @@ def test_relation_model(
         "   .. inheritance-diagram:: dummy_django_app2.models.GenericRelationModel",
         "",
     ]
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_inheritance_diagram_depth": 1}
+)
+def test_inheritance_diagram_depth(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = list(do_autodoc(app, "class", "dummy_django_app.models.ChildModelA"))
+    print(actual)
+    assert actual[-3:] == [
+        "   .. inheritance-diagram:: dummy_django_app.models.ChildModelA",
+        "      :top-classes: dummy_django_app.models.AbstractModel",
+        "",
+    ]
+    # The bases of Model are cut off
+    actual = list(do_autodoc(app, "class", "dummy_django_app.models.AbstractModel"))
+    assert actual[-3:] == [
+        "   .. inheritance-diagram:: dummy_django_app.models.AbstractModel",
+        "      :top-classes: django.db.models.Model",
+        "",
+    ]
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.apps import apps
+from sphinx.errors import ConfigError
+
+from sphinxcontrib_django import commands
+from sphinxcontrib_django.commands import (
+    CommandMetadata,
+    discover_commands,
+    extract_commands,
+    get_command_lines,
+    get_command_metadata,
+    parse_command,
+)
+from sphinxcontrib_django.docstrings.budget import BudgetExceeded
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.fixture
+def commands_document(app: SphinxTestApp) -> Iterator[Path]:
+    """
+    Add a document with the directive, which is removed again to not slow down other builds.
+    """
+    path = app.srcdir / "commands.rst"
+    path.write_text(
+        "\n".join(
+            [
+                ":orphan:",
+                "",
+                "Management commands",
+                "===================",
+                "",
+                ".. django-commands:: dummy_django_app",
+                "",
+                "* Reference to a custom command: :django-admin:`rebuild_index`",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    yield path
+    path.unlink()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_discover_commands(app: SphinxTestApp) -> None:
+    # The commands of Django, e.g. ``createsuperuser`` of the auth app, are not included
+    discovered = discover_commands(list(apps.get_app_configs()))
+    assert [(command.app_name, command.name) for command in discovered] == [
+        ("dummy_django_app", "rebuild_index")
+    ]
+    assert discovered[0].file.endswith("management/commands/rebuild_index.py")
+    assert len(discovered[0].digest) == 64
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_parse_command(app: SphinxTestApp) -> None:
+    (command,) = discover_commands([apps.get_app_config("dummy_django_app")])
+    metadata = parse_command(command)
+    assert metadata.digest == command.digest
+    assert metadata.help == "Rebuild the search index."
+    assert metadata.usage.startswith("usage: django-admin rebuild_index [-h]")
+    assert metadata.options == (
+        ("models", "The models to index"),
+        ("--dry-run", "Only list the changes"),
+        ("--batch-size", ""),
+    )
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_commands_timeout": 5}
+)
+def test_extract_commands_timeout(app: SphinxTestApp) -> None:
+    # A command which hangs while it's imported blocks its worker process
+    app_config = apps.get_app_config("dummy_django_app")
+    path = Path(app_config.path) / "management" / "commands" / "hang.py"
+    path.write_text("import time\n\ntime.sleep(60)\n", encoding="utf-8")
+    try:
+        discovered = discover_commands([app_config])
+        start = time.monotonic()
+        results = extract_commands(app.config, discovered)
+    finally:
+        path.unlink()
+    assert time.monotonic() - start < 30
+    hang, rebuild_index = discovered
+    assert isinstance(results[hang], BudgetExceeded)
+    assert str(results[hang]) == "not finished after 5 seconds"
+    # The other commands are extracted by new workers
+    assert isinstance(results[rebuild_index], CommandMetadata)
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_extract_commands_setup_error(
+    app: SphinxTestApp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The workers can't set up Django with unknown settings
+    monkeypatch.setattr(app.config, "django_settings", "unknown_settings")
+    monkeypatch.setattr(app.config, "django_commands_timeout", None)
+    (command,) = discover_commands([apps.get_app_config("dummy_django_app")])
+    discovered = [command._replace(name=f"command_{i}") for i in range(10)]
+    start = time.monotonic()
+    results = extract_commands(app.config, discovered)
+    assert time.monotonic() - start < 30
+    # All commands fail with the error of the setup, without waiting for a timeout
+    assert list(results) == discovered
+    assert all(isinstance(result, ConfigError) for result in results.values())
+    assert "'django_settings' in your conf.py cannot be imported" in str(
+        results[discovered[0]]
+    )
+
+
+def test_command_lines() -> None:
+    metadata = CommandMetadata(
+        digest="",
+        help="Rebuild the search index.",
+        usage="usage: django-admin rebuild_index [--dry-run]",
+        options=(("--dry-run", "Only list the changes"), ("--batch-size", "")),
+    )
+    assert get_command_lines("rebuild_index", metadata) == [
+        ".. django-admin:: rebuild_index",
+        "",
+        "``rebuild_index``",
+        "   Rebuild the search index.",
+        "",
+        "   .. code-block:: text",
+        "",
+        "      usage: django-admin rebuild_index [--dry-run]",
+        "",
+        "   * ``--dry-run``: Only list the changes",
+        "   * ``--batch-size``",
+        "",
+    ]
+    assert get_command_lines("rebuild_index", None) == [
+        ".. django-admin:: rebuild_index",
+        "",
+        "``rebuild_index``",
+        "   The command could not be inspected.",
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_commands_directive(
+    app: SphinxTestApp, commands_document: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app.build()
+    html = (app.outdir / "commands.html").read_text(encoding="utf-8")
+    assert 'id="std-django-admin-rebuild_index"' in html
+    assert 'href="#std-django-admin-rebuild_index"' in html
+    assert "Only list the changes" in html
+    assert "commands.rst" not in app.warning.getvalue()
+
+    # The extracted commands are cached until their modules change
+    env: Any = app.env
+    discovered = discover_commands([apps.get_app_config("dummy_django_app")])
+    cached = env.django_commands[("dummy_django_app", "rebuild_index")]
+
+    def fail(*args: object) -> None:
+        raise AssertionError("The command was extracted again")
+
+    monkeypatch.setattr(commands, "extract_commands", fail)
+    assert get_command_metadata(env, discovered, "commands") == {discovered[0]: cached}
+    env.django_commands[("dummy_django_app", "rebuild_index")] = cached._replace(
+        digest="outdated"
+    )
+    with pytest.raises(AssertionError, match="extracted again"):
+        get_command_metadata(env, discovered, "commands")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from sphinx.errors import ConfigError, SphinxError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("djangocoverage", testroot="docstrings")
+def test_coverage_builder(app: SphinxTestApp) -> None:
+    app.build()
+    coverage = json.loads((app.outdir / "coverage.json").read_text())
+    assert coverage["apps"]["dummy_django_app"]["models"][
+        "dummy_django_app.SimpleModel"
+    ] == {
+        "docstring": False,
+        "fields": {
+            "file": True,
+            "childA": True,
+            "dummy_field": True,
+            "childrenB": True,
+        },
+        "documented": 4,
+        "total": 5,
+        "coverage": 80.0,
+    }
+    # Docstrings which are set at runtime count as well
+    assert coverage["apps"]["dummy_django_app"]["models"][
+        "dummy_django_app.MonkeyPatched"
+    ]["docstring"]
+    # The models of Django itself are skipped
+    assert sorted(coverage["apps"]) == ["dummy_django_app", "dummy_django_app2"]
+    assert coverage["documented"] == 5
+    assert coverage["total"] == 30
+
+    report = (app.outdir / "coverage.txt").read_text()
+    assert "  dummy_django_app.SimpleModel               4 / 5      80.00%" in report
+    assert "* dummy_django_app.FileModel.upload" in report
+    assert "* dummy_django_app.SimpleModel.file" not in report
+
+
+@pytest.mark.sphinx("djangocoverage", testroot="docstrings")
+def test_coverage_fail_under(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    app = setup_app_with_different_config(django_coverage_fail_under=50)
+    with pytest.raises(SphinxError, match="coverage of 16.67% is below"):
+        app.build()
+
+
+@pytest.mark.sphinx("djangocoverage", testroot="docstrings")
+def test_coverage_app_names(app: SphinxTestApp) -> None:
+    from sphinxcontrib_django.coverage import get_coverage
+
+    # Apps can be given by their name as well as by their label
+    coverage = get_coverage(["django.contrib.auth", "dummy_django_app2"])
+    assert sorted(coverage["apps"]) == ["auth", "dummy_django_app2"]
+    assert "auth.Group" in coverage["apps"]["auth"]["models"]
+
+    with pytest.raises(ConfigError, match="'unknown_app' is not installed"):
+        get_coverage(["unknown_app"])
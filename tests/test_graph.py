@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from django.apps.registry import Apps
+from django.db import models
+from sphinx.ext.graphviz import graphviz
+
+from sphinxcontrib_django import graph
+from sphinxcontrib_django.graph import (
+    collect_relation_graph,
+    get_dot_code,
+    get_neighbours,
+    get_relation_graph,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_relation_graph(app: SphinxTestApp) -> None:
+    graph = get_relation_graph(app.env)
+    assert graph["apps"]["dummy_django_app2"] == [
+        "dummy_django_app2.GenericRelationModel"
+    ]
+    assert [
+        edge for edge in graph["edges"] if edge[0] == "dummy_django_app.SimpleModel"
+    ] == [
+        (
+            "dummy_django_app.SimpleModel",
+            "childA",
+            "dummy_django_app.ChildModelA",
+            "one_to_one",
+        ),
+        (
+            "dummy_django_app.SimpleModel",
+            "childrenB",
+            "dummy_django_app.ChildModelB",
+            "many_to_many",
+        ),
+        (
+            "dummy_django_app.SimpleModel",
+            "file",
+            "dummy_django_app.FileModel",
+            "many_to_one",
+        ),
+    ]
+    # The graph is only collected once per build
+    assert get_relation_graph(app.env) is graph
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_neighbours(app: SphinxTestApp) -> None:
+    graph = get_relation_graph(app.env)
+    assert get_neighbours(graph, {"dummy_django_app.FileModel"}, 0) == {
+        "dummy_django_app.FileModel"
+    }
+    assert get_neighbours(graph, {"dummy_django_app.FileModel"}, 1) == {
+        "dummy_django_app.FileModel",
+        "dummy_django_app.SimpleModel",
+    }
+    assert get_neighbours(graph, {"dummy_django_app.FileModel"}, 2) == {
+        "dummy_django_app.FileModel",
+        "dummy_django_app.SimpleModel",
+        "dummy_django_app.ChildModelA",
+        "dummy_django_app.ChildModelB",
+    }
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_dot_code(app: SphinxTestApp) -> None:
+    graph = get_relation_graph(app.env)
+    labels = {"dummy_django_app.FileModel", "dummy_django_app.SimpleModel"}
+    assert get_dot_code(graph, "dummy_django_app.FileModel", labels) == "\n".join(
+        [
+            'digraph "dummy_django_app.FileModel" {',
+            "  graph [rankdir=LR];",
+            '  node [shape=box, fontname="sans-serif", fontsize=10];',
+            '  edge [fontname="sans-serif", fontsize=8];',
+            '  "dummy_django_app.FileModel" [label="dummy_django_app.FileModel"];',
+            '  "dummy_django_app.SimpleModel" [label="dummy_django_app.SimpleModel"];',
+            (
+                '  "dummy_django_app.SimpleModel" -> "dummy_django_app.FileModel"'
+                ' [label="file"];'
+            ),
+            "}",
+        ]
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_graph_directive(app: SphinxTestApp) -> None:
+    app.build()
+    doctree = app.env.get_doctree("graph")
+    codes = [node["code"] for node in doctree.findall(graphviz)]
+    assert len(codes) == 2
+    assert (
+        '"dummy_django_app.ChildModelA" -> "dummy_django_app.SimpleModel"' in codes[0]
+    )
+    assert (
+        '"dummy_django_app.SimpleModel" -> "dummy_django_app.FileModel"' not in codes[0]
+    )
+    assert codes[1].count("[label=") == 1
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_custom_relation_without_cardinality(
+    app: SphinxTestApp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class CustomRelation(models.ForeignKey):  # type: ignore[type-arg]
+        many_to_one = False
+
+    class Meta:
+        apps = Apps()
+        app_label = "custom"
+
+    target = type("Target", (models.Model,), {"__module__": __name__, "Meta": Meta})
+    source = type(
+        "Source",
+        (models.Model,),
+        {
+            "__module__": __name__,
+            "Meta": Meta,
+            "target": CustomRelation(target, on_delete=models.CASCADE),
+        },
+    )
+    monkeypatch.setattr(
+        graph, "apps", SimpleNamespace(get_models=lambda: [target, source])
+    )
+    assert collect_relation_graph()["edges"] == []
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_graph_is_optional(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    app = setup_app_with_different_config(extensions=["sphinxcontrib_django"])
+    assert "sphinxcontrib_django.graph" not in app.extensions
+    assert "sphinx.ext.graphviz" not in app.extensions
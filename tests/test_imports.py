@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+#: Heavy modules which are only imported once the extension is set up
+HEAVY_MODULES = (
+    "sphinx.builders",
+    "sphinx.ext.graphviz",
+    "sphinx.ext.intersphinx",
+    "sphinxcontrib_django.check",
+    "sphinxcontrib_django.coverage",
+    "sphinxcontrib_django.graph",
+)
+
+#: Optional integrations which are only imported if the Django project uses them
+OPTIONAL_MODULES = ("django.contrib.postgres", "mptt", "phonenumber_field", "pprintpp")
+
+
+def get_imported_modules(module: str) -> set[str]:
+    """
+    Import the given module in a fresh interpreter and return all imported modules
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sphinxcontrib_django",
+        "sphinxcontrib_django.roles",
+        "sphinxcontrib_django.schemadiff",
+    ],
+)
+def test_import_without_django(module: str) -> None:
+    assert "django" not in get_imported_modules(module)
+
+
+def test_import_without_optional_integrations() -> None:
+    imported = get_imported_modules("sphinxcontrib_django.docstrings")
+    assert "django" in imported
+    assert imported.isdisjoint(OPTIONAL_MODULES)
+
+
+def test_import_without_heavy_modules() -> None:
+    imported = get_imported_modules("sphinxcontrib_django")
+    assert imported.isdisjoint(HEAVY_MODULES)
+    assert imported.isdisjoint(OPTIONAL_MODULES)
+
+
+def test_lazy_submodules() -> None:
+    import sphinxcontrib_django
+
+    assert sphinxcontrib_django.schemadiff.__name__ == "sphinxcontrib_django.schemadiff"
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        sphinxcontrib_django.unknown
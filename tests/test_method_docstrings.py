@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+import types
 from typing import TYPE_CHECKING
 
 import pytest
@@ -16,19 +18,27 @@ def test_model_method_display(
     app: SphinxTestApp, do_autodoc: Callable[..., StringList]
 ) -> None:
     actual = do_autodoc(
-        app, "method", "dummy_django_app.models.SimpleModel.get_dummy_field_display"
+        app,
+        "method",
+        "dummy_django_app.models.ChoiceModel.get_choice_with_empty_display",
     )
     print(actual)
     assert list(actual) == [
         "",
-        ".. py:method:: SimpleModel.get_dummy_field_display()",
+        ".. py:method:: ChoiceModel.get_choice_with_empty_display()",
         "   :module: dummy_django_app.models",
         "",
         (
-            "   Shows the label of the :attr:`dummy_field`. See"
+            "   Shows the label of"
+            " :attr:`~dummy_django_app.models.ChoiceModel.choice_with_empty`. See"
             " :meth:`~django.db.models.Model.get_FOO_display` for more information."
         ),
         "",
+        "   Choices:",
+        "",
+        "   * ``''`` (Empty string) — Empty",
+        "   * ``Something`` — Not empty",
+        "",
     ]
 
 
@@ -37,16 +47,17 @@ def test_model_method_get_next_by(
     app: SphinxTestApp, do_autodoc: Callable[..., StringList]
 ) -> None:
     actual = do_autodoc(
-        app, "method", "dummy_django_app.models.SimpleModel.get_next_by_dummy_field"
+        app, "method", "django.contrib.auth.models.User.get_next_by_date_joined"
     )
     print(actual)
     assert list(actual) == [
         "",
-        ".. py:method:: SimpleModel.get_next_by_dummy_field()",
-        "   :module: dummy_django_app.models",
+        ".. py:method:: User.get_next_by_date_joined(**kwargs)",
+        "   :module: django.contrib.auth.models",
         "",
         (
-            "   Finds next instance based on :attr:`dummy_field`. See"
+            "   Finds next instance based on"
+            " :attr:`~django.contrib.auth.models.User.date_joined`. See"
             " :meth:`~django.db.models.Model.get_next_by_FOO` for more information."
         ),
         "",
@@ -58,17 +69,108 @@ def test_model_method_get_previous_by(
     app: SphinxTestApp, do_autodoc: Callable[..., StringList]
 ) -> None:
     actual = do_autodoc(
-        app, "method", "dummy_django_app.models.SimpleModel.get_previous_by_dummy_field"
+        app, "method", "django.contrib.auth.models.User.get_previous_by_date_joined"
     )
     print(actual)
     assert list(actual) == [
         "",
-        ".. py:method:: SimpleModel.get_previous_by_dummy_field()",
-        "   :module: dummy_django_app.models",
+        ".. py:method:: User.get_previous_by_date_joined(**kwargs)",
+        "   :module: django.contrib.auth.models",
         "",
         (
-            "   Finds previous instance based on :attr:`dummy_field`. See"
+            "   Finds previous instance based on"
+            " :attr:`~django.contrib.auth.models.User.date_joined`. See"
             " :meth:`~django.db.models.Model.get_previous_by_FOO` for more information."
         ),
         "",
     ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_user_defined_method(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    # SimpleModel defines methods with the names of contributed methods, but dummy_field has
+    # neither choices nor is it a date field
+    for name in (
+        "get_dummy_field_display",
+        "get_next_by_dummy_field",
+        "get_previous_by_dummy_field",
+    ):
+        actual = do_autodoc(
+            app, "method", f"dummy_django_app.models.SimpleModel.{name}"
+        )
+        print(actual)
+        assert list(actual) == [
+            "",
+            f".. py:method:: SimpleModel.{name}()",
+            "   :module: dummy_django_app.models",
+            "",
+        ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_abstract_model_methods(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "method", "dummy_django_app.models.AbstractPublication.get_status_display"
+    )
+    print(actual)
+    assert list(actual) == [
+        "",
+        ".. py:method:: AbstractPublication.get_status_display()",
+        "   :module: dummy_django_app.models",
+        "",
+        (
+            "   Shows the label of"
+            " :attr:`~dummy_django_app.models.AbstractPublication.status`. See"
+            " :meth:`~django.db.models.Model.get_FOO_display` for more information."
+        ),
+        "",
+        "   Choices:",
+        "",
+        "   * ``draft`` — Draft",
+        "   * ``public`` — Public",
+        "",
+    ]
+    actual = do_autodoc(
+        app,
+        "method",
+        "dummy_django_app.models.AbstractPublication.get_next_by_published_on",
+    )
+    print(actual)
+    assert list(actual)[1] == (
+        ".. py:method:: AbstractPublication.get_next_by_published_on(**kwargs)"
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_reexported_model_methods(
+    app: SphinxTestApp,
+    do_autodoc: Callable[..., StringList],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from dummy_django_app.models import ChoiceModel
+
+    # Simulate a models package which re-exports the models of its submodules
+    package = types.ModuleType("dummy_django_app.exports")
+    package.ChoiceModel = ChoiceModel  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, package.__name__, package)
+    actual = do_autodoc(
+        app,
+        "method",
+        "dummy_django_app.exports.ChoiceModel.get_choice_with_empty_display",
+    )
+    print(actual)
+    assert list(actual)[:5] == [
+        "",
+        ".. py:method:: ChoiceModel.get_choice_with_empty_display()",
+        "   :module: dummy_django_app.exports",
+        "",
+        (
+            "   Shows the label of"
+            " :attr:`~dummy_django_app.exports.ChoiceModel.choice_with_empty`. See"
+            " :meth:`~django.db.models.Model.get_FOO_display` for more information."
+        ),
+    ]
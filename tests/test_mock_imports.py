@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+from django.apps.registry import Apps
+from django.db import models
+
+from sphinxcontrib_django.docstrings.mock import (
+    install_mock_imports,
+    remove_mock_imports,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_mocked_model_fields(app: SphinxTestApp) -> None:
+    finder = install_mock_imports(["heavy_geo_library", "unused_library"])
+    try:
+        from heavy_geo_library.db import models as geo_models  # type: ignore[import-not-found]
+        from heavy_geo_library.db.models import PointField  # type: ignore[import-not-found]
+        from heavy_geo_library.raster import load_raster  # type: ignore[import-not-found]
+
+        class Place(geo_models.Model):  # type: ignore[misc]
+            name = geo_models.CharField(max_length=10)
+            location = PointField("Location", srid=4326, geography=True)
+            raster = geo_models.ForeignKey(
+                "Place", null=True, on_delete=geo_models.CASCADE
+            )
+
+            class Meta:
+                apps = Apps()
+                app_label = "mocked"
+
+        assert geo_models.Model is models.Model
+        assert PointField is geo_models.PointField
+        assert issubclass(PointField, models.Field)
+        assert PointField.__module__ == "heavy_geo_library.db.models"
+        location = Place._meta.get_field("location")
+        assert isinstance(location, PointField)
+        assert location.verbose_name == "Location"
+        assert not isinstance(load_raster, models.Field)
+        assert finder.get_used_modnames() == ["heavy_geo_library"]
+    finally:
+        remove_mock_imports(finder)
+    assert "heavy_geo_library" not in sys.modules
+    assert finder not in sys.meta_path
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_mock_imports_config(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    app = setup_app_with_different_config(django_mock_imports=["unused_library"])
+    assert "Mocked imports during Django setup: none" in app.status.getvalue()
+    assert (
+        "Unused entries of 'django_mock_imports': unused_library"
+        in app.warning.getvalue()
+    )
+    app.build()
+    assert not any(
+        getattr(finder, "modnames", None) == ["unused_library"]
+        for finder in sys.meta_path
+    )
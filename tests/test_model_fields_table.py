@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.conf import settings
+from django.db.models import AutoField
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+def autofield() -> str:
+    return getattr(
+        settings,
+        "DEFAULT_AUTO_FIELD",
+        f"{AutoField.__module__}.{AutoField.__qualname__}",
+    )
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={"django_model_fields_renderer": "table"},
+)
+def test_fields_table(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(app, "class", "dummy_django_app.models.FileModel")
+    print(actual)
+    assert list(actual) == [
+        "",
+        ".. py:class:: FileModel(id, upload)",
+        "   :module: dummy_django_app.models",
+        "",
+        "   .. list-table::",
+        "      :header-rows: 1",
+        "",
+        "      * - Field",
+        "        - Type",
+        "        - Description",
+        "      * - ``id``",
+        f"        - :class:`~{autofield()}`",
+        "        - Primary key: ID",
+        "      * - ``upload``",
+        "        - :class:`~django.db.models.FileField`",
+        "        - Upload",
+        "      * - ``simple_models``",
+        (
+            "        - Reverse :class:`~django.db.models.ForeignKey` from"
+            " :class:`~dummy_django_app.models.SimpleModel`"
+        ),
+        (
+            "        - All simple models of this file model (related name of"
+            " :attr:`~dummy_django_app.models.SimpleModel.file`)"
+        ),
+        "",
+        "   .. inheritance-diagram:: dummy_django_app.models.FileModel",
+        "",
+    ]
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={"django_model_fields_table_threshold": 3},
+)
+def test_fields_table_threshold(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    # SimpleModel has more than three fields
+    actual = list(do_autodoc(app, "class", "dummy_django_app.models.SimpleModel"))
+    assert "   .. list-table::" in actual
+    # FileModel has three fields including the reverse relationship
+    actual = list(do_autodoc(app, "class", "dummy_django_app.models.FileModel"))
+    assert "   .. list-table::" not in actual
+    assert "   :param upload: Upload" in actual
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={"django_model_fields_renderer": "table"},
+)
+def test_fields_table_build(app: SphinxTestApp) -> None:
+    app.build()
+    models_page = (app.outdir / "models.html").read_text()
+    assert '<th class="head"><p>Description</p></th>' in models_page
+    # The inline docstrings are part of the description
+    assert "<td><p>ChildrenB (related name:" in models_page
+    assert "<p>Docstring of many to many field</p>" in models_page
+    assert '<dl class="field-list' not in models_page
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_overflow_pages": True}
+)
+def test_choices_overflow_link(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_limit_above"
+    )
+    print(actual)
+    assert list(actual)[-2] == (
+        "   * and 2 more (`show all"
+        " <_django/choices/dummy_django_app.choicemodel.choice_limit_above.html>`__)"
+    )
+
+
+@pytest.mark.sphinx(
+    "text", testroot="docstrings", confoverrides={"django_overflow_pages": True}
+)
+def test_choices_overflow_non_html(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_limit_above"
+    )
+    assert list(actual)[-2] == "   * and 2 more"
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_reverse_relations_to_show": 0}
+)
+def test_reverse_relations_limit(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = list(do_autodoc(app, "class", "dummy_django_app.models.SimpleModel"))
+    print(actual)
+    index = actual.index("   Reverse relationships:")
+    assert actual[index : index + 4] == [
+        "   Reverse relationships:",
+        "",
+        "",
+        "   And 2 more reverse relationships",
+    ]
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={
+        "django_overflow_pages": True,
+        "django_reverse_relations_to_show": 0,
+    },
+)
+def test_overflow_pages(app: SphinxTestApp) -> None:
+    app.build()
+    models_page = (app.outdir / "models.html").read_text()
+    assert 'href="_django/reverse/dummy_django_app.simplemodel.html"' in models_page
+
+    reverse_page = (
+        app.outdir / "_django/reverse/dummy_django_app.simplemodel.html"
+    ).read_text()
+    assert (
+        "<h1>Reverse relationships of dummy_django_app.SimpleModel</h1>" in reverse_page
+    )
+    assert (
+        '<li><code>childmodela</code> — <a href="../../models.html#dummy_django_app.models'
+        '.ChildModelA">Reverse ForeignKey from dummy_django_app.ChildModelA</a></li>'
+        in reverse_page
+    )
+    assert (
+        '<a href="../../models.html#dummy_django_app.models.SimpleModel">'
+        in reverse_page
+    )
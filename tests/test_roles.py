@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import re
+import zlib
 from typing import TYPE_CHECKING
 
 import pytest
+from django.apps import apps
+from sphinx.util.inventory import InventoryFile
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     from sphinx.testing.util import SphinxTestApp
 
 
@@ -50,3 +56,49 @@ def test_model_role_unknown_model(
         if record.name == "sphinxcontrib_django.roles"
     ]
     assert any("unknown_app.UnknownModel" in message for message in warnings)
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_model_inventory(app: SphinxTestApp) -> None:
+    app.build()
+    inventory = InventoryFile.loads(
+        (app.outdir / "django_models.inv").read_bytes(), uri="https://example.org/"
+    )
+    labels = inventory.data["py:class"]
+    assert (
+        labels["dummy_django_app.SimpleModel"].uri
+        == "https://example.org/models.html#dummy_django_app.models.SimpleModel"
+    )
+    # Only models are exported
+    assert "dummy_django_app.SimpleModelManager" not in labels
+    assert list(inventory.data) == ["py:class"]
+
+
+@pytest.mark.sphinx("html", testroot="model-inventory")
+def test_model_role_via_inventory(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    # Simulate a consumer project without configured Django
+    monkeypatch.setattr(apps, "ready", False)
+    inventory = tmp_path / "django_models.inv"
+    inventory.write_bytes(
+        b"# Sphinx inventory version 2\n"
+        b"# Project: Producer\n"
+        b"# Version: \n"
+        b"# The remainder of this file is compressed using zlib.\n"
+        + zlib.compress(
+            b"dummy_django_app.SimpleModel py:class 1"
+            b" models.html#dummy_django_app.models.SimpleModel -\n"
+        )
+    )
+    app = setup_app_with_different_config(
+        intersphinx_mapping={"producer": ("https://example.org/", str(inventory))}
+    )
+    app.build()
+    html = (app.outdir / "index.html").read_text(encoding="utf-8")
+    assert (
+        'href="https://example.org/models.html#dummy_django_app.models.SimpleModel"'
+        in html
+    )
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from sphinx.errors import ConfigError
+
+from sphinxcontrib_django import metadata
+from sphinxcontrib_django.__main__ import main
+from sphinxcontrib_django.metadata import get_snapshot
+from sphinxcontrib_django.schemadiff import diff_snapshots
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_snapshot(app: SphinxTestApp) -> None:
+    snapshot = get_snapshot(["dummy_django_app"])
+    assert snapshot == get_snapshot(["dummy_django_app"])
+    metadata = json.loads(snapshot)
+    assert [app["label"] for app in metadata["apps"]] == ["dummy_django_app"]
+    choice_model = next(
+        model
+        for model in metadata["apps"][0]["models"]
+        if model["label"] == "dummy_django_app.ChoiceModel"
+    )
+    choice_with_empty = next(
+        field
+        for field in choice_model["fields"]
+        if field["name"] == "choice_with_empty"
+    )
+    assert choice_with_empty["choices"] == [["", "Empty"], ["Something", "Not empty"]]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_snapshot_app_names(app: SphinxTestApp) -> None:
+    metadata = json.loads(get_snapshot(["django.contrib.auth", "dummy_django_app2"]))
+    assert [app["label"] for app in metadata["apps"]] == ["auth", "dummy_django_app2"]
+    with pytest.raises(ConfigError, match="'unknown_app' is not installed"):
+        get_snapshot(["unknown_app"])
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_snapshot_choices_budget(
+    app: SphinxTestApp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(metadata, "CHOICES_MAX_ITEMS", 0)
+    snapshot = json.loads(get_snapshot(["dummy_django_app"]))
+    choice_model = next(
+        model
+        for model in snapshot["apps"][0]["models"]
+        if model["label"] == "dummy_django_app.ChoiceModel"
+    )
+    choices = {field["name"]: field["choices"] for field in choice_model["fields"]}
+    # Callable choices which exceed the budget are skipped
+    assert choices["choice_with_callable"] is None
+    assert choices["choice_with_empty"] == [["", "Empty"], ["Something", "Not empty"]]
+    assert "more than 0 items" in app.warning.getvalue()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_diff_snapshots(app: SphinxTestApp) -> None:
+    old = json.loads(get_snapshot(["dummy_django_app"]))
+    new = copy.deepcopy(old)
+    models = {model["label"]: model for model in new["apps"][0]["models"]}
+    del models["dummy_django_app.FileModel"]
+    new["apps"][0]["models"] = list(models.values())
+    simple_model = models["dummy_django_app.SimpleModel"]
+    simple_model["db_table"] = "simple"
+    simple_model["fields"] = [
+        field for field in simple_model["fields"] if field["name"] != "childA"
+    ]
+    dummy_field = next(
+        field for field in simple_model["fields"] if field["name"] == "dummy_field"
+    )
+    dummy_field["null"] = True
+    dummy_field["choices"] = [["a", "A"]]
+
+    assert diff_snapshots(old, new) == [
+        "Removed model ``dummy_django_app.FileModel``",
+        "``dummy_django_app.SimpleModel``: Renamed table"
+        " ``dummy_django_app_simplemodel`` to ``simple``",
+        "``dummy_django_app.SimpleModel.childA``: Removed field",
+        "``dummy_django_app.SimpleModel.dummy_field``: Changed null from ``False`` to"
+        " ``True``",
+        "``dummy_django_app.SimpleModel.dummy_field``: Added choices ``'a'``",
+    ]
+    assert diff_snapshots(new, old)[0] == (
+        "Added model ``dummy_django_app.FileModel``"
+        " (table ``dummy_django_app_filemodel``)"
+    )
+    assert diff_snapshots(old, old) == []
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_command_line(
+    app: SphinxTestApp, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    snapshot = tmp_path / "schema.json"
+    args = ["--settings", "dummy_django_app.settings", "--output", str(snapshot)]
+    assert main(["snapshot", *args]) == 0
+    assert snapshot.read_text() == get_snapshot()
+
+    assert main(["diff", "--exit-code", str(snapshot), str(snapshot)]) == 0
+    old = app.srcdir / "schema" / "old.json"
+    new = app.srcdir / "schema" / "new.json"
+    assert main(["diff", "--exit-code", str(old), str(new)]) == 1
+    assert capsys.readouterr().out == (
+        "* ``blog.Post.status``: Added choices ``'published'``\n"
+        "* ``blog.Post.title``: Changed max_length from ``100`` to ``200``\n"
+        "* Added model ``blog.Tag`` (table ``blog_tag``)\n"
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_schema_diff_directive(app: SphinxTestApp) -> None:
+    app.build()
+    html = (app.outdir / "schemadiff.html").read_text(encoding="utf-8")
+    assert (
+        '<li><p>Added model <code class="docutils literal notranslate">'
+        '<span class="pre">blog.Tag</span></code>' in html
+    )
+    assert "Changed max_length from" in html
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from sphinx.errors import ConfigError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_search_exclude": ["choices"]}
+)
+def test_exclude_choices(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.ChoiceModel.choice_with_empty"
+    )
+    print(actual)
+    assert list(actual) == [
+        "",
+        ".. py:attribute:: ChoiceModel.choice_with_empty",
+        "   :module: dummy_django_app.models",
+        "",
+        "   Type: :class:`~django.db.models.CharField`",
+        "",
+        "   Choice with empty",
+        "",
+        "   .. container:: no-search",
+        "",
+        "      Choices:",
+        "",
+        "      * ``''`` (Empty string) — Empty",
+        "      * ``Something`` — Not empty",
+        "",
+    ]
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_search_exclude": ["managers"]}
+)
+def test_exclude_managers(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app, "attribute", "dummy_django_app.models.SimpleModel.custom_objects"
+    )
+    print(actual)
+    assert list(actual)[5:] == [
+        "   .. container:: no-search",
+        "",
+        "      Django manager to access the ORM",
+        "      Use ``SimpleModel.objects.all()`` to fetch all objects.",
+        "",
+        "   Custom model manager",
+        "",
+    ]
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={"django_search_exclude": ["fields", "attributes", "managers"]},
+)
+def test_search_index(app: SphinxTestApp) -> None:
+    app.build()
+    models_page = (app.outdir / "models.html").read_text()
+    assert '<dl class="no-search field-list simple">' in models_page
+    search_index = (app.outdir / "searchindex.js").read_text()
+    terms = json.loads(search_index[search_index.index("(") + 1 : -1])["terms"]
+    # Only contained in the generated description of managers
+    assert not terms.get("orm")
+    # Only contained in the generated parameter lists and field types
+    assert not terms.get("charfield")
+    assert not terms.get("verbos")
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_unknown_section(
+    setup_app_with_different_config: Callable[..., SphinxTestApp],
+) -> None:
+    with pytest.raises(ConfigError, match="Unknown sections 'models'"):
+        setup_app_with_different_config(django_search_exclude=["models", "fields"])
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import pytest
+from docutils import nodes
+
+from sphinxcontrib_django.docstrings.signals import SignalReceiver, get_signal_receivers
+from sphinxcontrib_django.signals import get_summary_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.fixture
+def signals(app: SphinxTestApp) -> object:
+    """
+    Connect the receivers of the dummy app and rebuild the index.
+    """
+    module = importlib.import_module("dummy_django_app.signals")
+    get_signal_receivers.cache_clear()
+    return module
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_signal_receivers(app: SphinxTestApp, signals: object) -> None:
+    models = importlib.import_module("dummy_django_app.models")
+    index = get_signal_receivers()
+    assert index[models.SimpleModel] == [
+        SignalReceiver(
+            "django.db.models.signals.post_save",
+            "dummy_django_app.signals.log_simple_model",
+            "func",
+        ),
+        SignalReceiver(
+            "django.db.models.signals.post_save",
+            "dummy_django_app.signals.Auditor.audit",
+            "meth",
+        ),
+        SignalReceiver(
+            "django.db.models.signals.pre_delete",
+            "dummy_django_app.signals.clean_up",
+            "func",
+        ),
+    ]
+    assert index[models.FileModel] == [
+        SignalReceiver(
+            "dummy_django_app.signals.file_uploaded",
+            "dummy_django_app.signals.clean_up",
+            "func",
+        )
+    ]
+    assert (
+        SignalReceiver(
+            "django.db.models.signals.post_save",
+            "dummy_django_app.signals.Auditor.audit",
+            "meth",
+        )
+        in index[None]
+    )
+    # The index is only built once per setup of Django
+    assert get_signal_receivers() is index
+
+
+@pytest.mark.sphinx(
+    "html", testroot="docstrings", confoverrides={"django_show_signals": True}
+)
+def test_model_signal_receivers(
+    app: SphinxTestApp, signals: object, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(app, "class", "dummy_django_app.models.FileModel")
+    print(actual)
+    assert list(actual)[-6:-2] == [
+        "   Signal receivers:",
+        "",
+        (
+            "   * :data:`~dummy_django_app.signals.file_uploaded`:"
+            " :func:`~dummy_django_app.signals.clean_up`"
+        ),
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_model_signal_receivers_disabled(
+    app: SphinxTestApp, signals: object, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(app, "class", "dummy_django_app.models.FileModel")
+    assert "   Signal receivers:" not in actual
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_summary_lines(app: SphinxTestApp, signals: object) -> None:
+    models = importlib.import_module("dummy_django_app.models")
+    lines = get_summary_lines([models.SimpleModel], get_signal_receivers())
+    assert lines[:12] == [
+        ".. list-table::",
+        "   :header-rows: 1",
+        "",
+        "   * - Model",
+        "     - Signal",
+        "     - Receivers",
+        "   * - :class:`~dummy_django_app.models.SimpleModel`",
+        "     - :data:`~django.db.models.signals.post_save`",
+        "     - 2",
+        "   * - :class:`~dummy_django_app.models.SimpleModel`",
+        "     - :data:`~django.db.models.signals.pre_delete`",
+        "     - 1",
+    ]
+    assert "   * - Any model" in lines
+    assert get_summary_lines([], {}) == ["No signal receivers"]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_signal_receivers_directive(app: SphinxTestApp, signals: object) -> None:
+    app.build()
+    doctree = app.env.get_doctree("signals")
+    table = next(doctree.findall(nodes.table))
+    rows = [row.astext().split("\n\n") for row in table.findall(nodes.row)]
+    assert rows[0] == ["Model", "Signal", "Receivers"]
+    assert ["FileModel", "file_uploaded", "1"] in rows
+    assert ["SimpleModel", "post_save", "2"] in rows
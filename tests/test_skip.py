@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django import forms
+from django.db import models
+from sphinx.errors import ConfigError
+
+from sphinxcontrib_django.docstrings.config import EXCLUDE_MEMBERS, INCLUDE_MEMBERS
+from sphinxcontrib_django.docstrings.skip import DEFAULT_SKIP_RULES, SkipRuleMatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+def test_default_rules() -> None:
+    matcher = SkipRuleMatcher(DEFAULT_SKIP_RULES)
+    for name in EXCLUDE_MEMBERS:
+        assert matcher.match(name) is True
+        assert matcher.match(name, forms.Form) is True
+    for name in INCLUDE_MEMBERS:
+        assert matcher.match(name) is False
+    assert matcher.match("clean") is None
+    assert matcher.prefilter is None
+
+
+def test_rules() -> None:
+    matcher = SkipRuleMatcher(
+        [
+            {"name": "Meta", "owner": "django.forms.BaseForm"},
+            {"name": "Meta", "owner": "django.db.models.Model", "skip": False},
+            {"name": "get_*_display", "skip": False},
+            {"regex": r"_[a-z_]+", "owner": "django.views.View"},
+            {"name": "panels", "owner": "wagtail.models.Page"},
+            {"name": "get_*"},
+        ]
+    )
+    assert matcher.match("Meta", forms.Form) is True
+    assert matcher.match("Meta", models.Model) is False
+    assert matcher.match("Meta") is None
+    # Rules are checked in order
+    assert matcher.match("get_status_display") is False
+    assert matcher.match("get_status") is True
+    # Regular expressions have to match the full name
+    from django.views import View
+
+    assert matcher.match("_allowed_methods", View) is True
+    assert matcher.match("_allowed_methods2", View) is None
+    # Owners which can't be imported never match
+    assert matcher.match("panels", models.Model) is None
+    assert ("get_status", None) in matcher.results
+
+
+@pytest.mark.parametrize(
+    ("rule", "message"),
+    [
+        ("Meta", "expected a dict, got 'Meta'"),
+        ({"name": "Meta", "regex": "Meta"}, "expected either 'name' or 'regex'"),
+        ({"owner": "django.forms.Form"}, "expected either 'name' or 'regex'"),
+        ({"name": "Meta", "exclude": True}, "unknown keys 'exclude'"),
+        ({"regex": "Meta("}, "missing \\), unterminated subpattern"),
+    ],
+)
+def test_invalid_rule(rule: object, message: str) -> None:
+    with pytest.raises(ConfigError, match=f"Invalid rule 0 .*: {message}"):
+        SkipRuleMatcher([rule])  # type: ignore[list-item]
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={
+        "django_autodoc_skip_rules": [
+            {"name": "Meta", "owner": "django.forms.BaseForm", "skip": False},
+            {"regex": "med(ia|ium)", "owner": "django.forms.BaseForm"},
+        ]
+    },
+)
+def test_autodoc_skip(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(
+        app,
+        "class",
+        "dummy_django_app.forms.SimpleForm",
+        {"members": None, "undoc-members": None},
+    )
+    print(actual)
+    assert "   .. py:class:: SimpleForm.Meta()" in actual
+    assert "   .. py:attribute:: SimpleForm.base_fields" not in actual
+    assert "   .. py:method:: SimpleForm.__init__(*args, **kwargs) -> None" in actual
+    assert "   .. py:property:: SimpleForm.media" not in actual
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sphinx.errors import ConfigError
+
+from sphinxcontrib_django.__main__ import main
+from sphinxcontrib_django.stubs import generate_stubs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_app_stubs(app: SphinxTestApp, tmp_path: Path) -> None:
+    written = generate_stubs(tmp_path, app_labels=["dummy_django_app2"])
+    assert written == {
+        tmp_path / "dummy_django_app2.rst": True,
+        tmp_path / "apps.rst": True,
+    }
+    assert (tmp_path / "dummy_django_app2.rst").read_text() == (
+        "Dummy_Django_App2\n"
+        "=================\n"
+        "\n"
+        ".. autodjango:: dummy_django_app2\n"
+    )
+    assert (tmp_path / "apps.rst").read_text() == (
+        "Apps\n====\n\n.. toctree::\n   :maxdepth: 1\n\n   dummy_django_app2\n"
+    )
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_unchanged_stubs_are_not_written(app: SphinxTestApp, tmp_path: Path) -> None:
+    generate_stubs(tmp_path, app_labels=["dummy_django_app"], granularity="module")
+    mtimes = {path: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+    assert sorted(path.name for path in mtimes) == [
+        "apps.rst",
+        "dummy_django_app.forms.rst",
+        "dummy_django_app.models.rst",
+        "dummy_django_app.views.rst",
+    ]
+    (tmp_path / "dummy_django_app.views.rst").write_text("Outdated")
+
+    written = generate_stubs(
+        tmp_path, app_labels=["dummy_django_app"], granularity="module"
+    )
+    assert [path.name for path, changed in written.items() if changed] == [
+        "dummy_django_app.views.rst"
+    ]
+    for path, mtime in mtimes.items():
+        if path.name != "dummy_django_app.views.rst":
+            assert path.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_model_stubs(app: SphinxTestApp, tmp_path: Path) -> None:
+    generate_stubs(
+        tmp_path, app_labels=["dummy_django_app2"], granularity="model", tocfile=None
+    )
+    assert (tmp_path / "dummy_django_app2.GenericRelationModel.rst").read_text() == (
+        "dummy_django_app2.GenericRelationModel\n"
+        "======================================\n"
+        "\n"
+        ".. autoclass:: dummy_django_app2.models.GenericRelationModel\n"
+        "   :members:\n"
+        "   :show-inheritance:\n"
+    )
+    assert not (tmp_path / "apps.rst").exists()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_command_line(
+    app: SphinxTestApp, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    args = [
+        "stubs",
+        "--settings",
+        "dummy_django_app.settings",
+        "--output-dir",
+        str(tmp_path),
+        "--no-toc",
+    ]
+    assert main(args) == 0
+    assert capsys.readouterr().out.endswith("stub files written, 0 unchanged\n")
+    assert main(args) == 0
+    assert capsys.readouterr().out.startswith("0 of ")
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_app_names(app: SphinxTestApp, tmp_path: Path) -> None:
+    generate_stubs(tmp_path, app_labels=["django.contrib.auth"], tocfile=None)
+    assert [path.name for path in tmp_path.iterdir()] == ["auth.rst"]
+    with pytest.raises(ConfigError, match="The app 'unknown_app' is not installed."):
+        generate_stubs(tmp_path, app_labels=["unknown_app"])
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_command_line_unknown_app(
+    app: SphinxTestApp, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    args = ["stubs", "--settings", "dummy_django_app.settings", "--app", "unknown_app"]
+    assert main([*args, "--output-dir", str(tmp_path)]) == 2
+    assert "Error: The app 'unknown_app'" in capsys.readouterr().err
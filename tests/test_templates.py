@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from sphinxcontrib_django.templates import (
+    TemplateLibraryEntry,
+    get_library_lines,
+    scan_template_libraries,
+)
+
+if TYPE_CHECKING:
+    from django.template.library import Library
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_scan_template_libraries(
+    app: SphinxTestApp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The scan results are stored as attributes of the environment
+    env: Any = app.env
+    scan_template_libraries(app, env, [])
+    module = "dummy_django_app.templatetags.dummy_tags"
+    # The libraries of Django are not included
+    assert env.django_template_library_names == {"dummy_tags": module}
+    library = env.django_template_libraries[module]
+    assert library.tags == (
+        TemplateLibraryEntry("dummy_list", "{% dummy_list *items %}", ()),
+        TemplateLibraryEntry(
+            "greeting",
+            "{% greeting name salutation='Hello' %}",
+            ("Greet the given name.",),
+        ),
+        TemplateLibraryEntry(
+            "raw_tag",
+            "{% raw_tag ... %}",
+            ("A tag which parses its arguments on its own.",),
+        ),
+    )
+    assert library.filters == (
+        TemplateLibraryEntry("repeat", "{{ value|repeat:times }}", ()),
+        TemplateLibraryEntry(
+            "shout", "{{ value|shout }}", ("Convert the value to upper case.",)
+        ),
+    )
+
+    # Unchanged modules are neither imported nor scanned again
+    from django.template import library as template_library
+
+    original_import_library = template_library.import_library
+    imported = []
+
+    def import_library(name: str) -> Library:
+        imported.append(name)
+        result: Library = original_import_library(name)
+        return result
+
+    monkeypatch.setattr(template_library, "import_library", import_library)
+    scan_template_libraries(app, env, [])
+    assert env.django_template_libraries[module] is library
+    assert imported == []
+    # Changed modules are scanned again
+    env.django_template_libraries[module] = library._replace(digest="outdated")
+    scan_template_libraries(app, env, [])
+    assert env.django_template_libraries[module] == library
+    assert imported == [module]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_library_lines(app: SphinxTestApp) -> None:
+    env: Any = app.env
+    scan_template_libraries(app, env, [])
+    library = env.django_template_libraries["dummy_django_app.templatetags.dummy_tags"]
+    lines = get_library_lines("dummy_tags", library)
+    assert lines[:16] == [
+        (
+            "Load with ``{% load dummy_tags %}`` (module"
+            " ``dummy_django_app.templatetags.dummy_tags``)."
+        ),
+        "",
+        "**Tags:**",
+        "",
+        ".. templatetag:: dummy_list",
+        "",
+        "``dummy_list``",
+        "   ``{% dummy_list *items %}``",
+        "",
+        ".. templatetag:: greeting",
+        "",
+        "``greeting``",
+        "   ``{% greeting name salutation='Hello' %}``",
+        "",
+        "   Greet the given name.",
+        "",
+    ]
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_template_library_directive(app: SphinxTestApp) -> None:
+    app.build()
+    doctree = app.env.get_doctree("templates")
+    assert "Greet the given name." in doctree.astext()
+    html = (app.outdir / "templates.html").read_text(encoding="utf-8")
+    assert 'id="std-templatetag-greeting"' in html
+    assert 'href="#std-templatetag-greeting"' in html
+    assert 'href="#std-templatefilter-shout"' in html
+    assert "templates.rst" not in app.warning.getvalue()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+from django.utils import translation
+
+from sphinxcontrib_django.docstrings.translation import cache_per_language
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from docutils.statemachine import StringList
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.fixture
+def deactivate_language() -> Iterator[None]:
+    yield
+    translation.deactivate()
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_cache_per_language(app: SphinxTestApp, deactivate_language: None) -> None:
+    calls = []
+
+    @cache_per_language
+    def render(value: str) -> str:
+        calls.append(value)
+        return f"{translation.get_language()}: {value}"
+
+    translation.activate("de")
+    assert render("a") == "de: a"
+    assert render("a") == "de: a"
+    translation.activate("fr")
+    assert render("a") == "fr: a"
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    confoverrides={"django_translate": True, "language": "de"},
+)
+def test_translated_verbose_name(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList], deactivate_language: None
+) -> None:
+    actual = do_autodoc(app, "attribute", "django.contrib.auth.models.User.username")
+    assert list(actual)[6].startswith("   Benutzername. ")
+
+
+@pytest.mark.sphinx("html", testroot="docstrings", confoverrides={"language": "de"})
+def test_untranslated_verbose_name(
+    app: SphinxTestApp, do_autodoc: Callable[..., StringList]
+) -> None:
+    actual = do_autodoc(app, "attribute", "django.contrib.auth.models.User.username")
+    assert list(actual)[6].startswith("   Username. ")
+
+
+@pytest.mark.sphinx("text", testroot="docstrings")
+def test_multi_language_build(app: SphinxTestApp, tmp_path: Path) -> None:
+    # Run the command in a fresh process, since the test app already loaded the English catalog
+    args = ["build", str(app.srcdir), str(tmp_path), "-b", "text"]
+    subprocess.run(
+        [sys.executable, "-m", "sphinxcontrib_django", *args, "-l", "de", "-l", "en"],
+        check=True,
+        capture_output=True,
+    )
+    assert "Parameter:" in (tmp_path / "de" / "models.txt").read_text()
+    assert "Parameters:" in (tmp_path / "en" / "models.txt").read_text()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from sphinx.testing.util import SphinxTestApp
+
+
+@pytest.mark.sphinx(
+    "html",
+    testroot="docstrings",
+    freshenv=True,
+    confoverrides={
+        "django_settings_variants": {
+            "full": "dummy_django_app.settings",
+            "minimal": "dummy_django_app.settings_minimal",
+        }
+    },
+)
+def test_settings_variants(app: SphinxTestApp) -> None:
+    variants = app.env.django_settings_variants  # type: ignore[attr-defined]
+    assert list(variants) == ["full", "minimal"]
+    assert variants["minimal"]["settings"] == "dummy_django_app.settings_minimal"
+    assert [app["label"] for app in variants["minimal"]["apps"]] == ["contenttypes"]
+    assert [app["label"] for app in variants["full"]["apps"]] == [
+        "auth",
+        "contenttypes",
+        "dummy_django_app",
+        "dummy_django_app2",
+    ]
+    simple_model = next(
+        model
+        for app in variants["full"]["apps"]
+        for model in app["models"]
+        if model["label"] == "dummy_django_app.SimpleModel"
+    )
+    assert simple_model["db_table"] == "dummy_django_app_simplemodel"
+    assert {
+        "name": "file",
+        "type": "django.db.models.ForeignKey",
+        "column": "file_id",
+        "related_model": "dummy_django_app.FileModel",
+        "null": False,
+        "blank": False,
+        "unique": False,
+        "primary_key": False,
+        "max_length": None,
+        "choices": None,
+    } in simple_model["fields"]
+
+    app.build()
+    html = (app.outdir / "variants.html").read_text(encoding="utf-8")
+    assert "Settings module: <code" in html
+    assert 'id="minimal"' in html
+    assert "dummy_django_app_simplemodel" in html
+    assert (
+        '<code class="docutils literal notranslate"><span class="pre">file</span></code>'
+    ) in html
+
+
+@pytest.mark.sphinx("html", testroot="docstrings")
+def test_no_settings_variants(app: SphinxTestApp) -> None:
+    assert app.env.django_settings_variants == {}  # type: ignore[attr-defined]